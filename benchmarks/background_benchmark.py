@@ -0,0 +1,110 @@
+"""
+Benchmark de la fluidité du jeu lorsque les minotaures sont déplacés (service.minotaur_worker).
+
+La boucle Tk est simulée : GameWindow.process_input est appelée à chaque image (FRAME_INTERVAL) dans une fenêtre
+sans affichage (benchmarks.stub_window). Le joueur appuie sur une touche toutes les KEY_INTERVAL images, par
+phases d'une seconde : des erreurs, puis des déplacements, puis une pause.
+    * sync       : minotaures calculés dans la boucle (comme sur les petits niveaux), l'image qui traite une erreur
+                   attend la fin du pathfinding ;
+    * background : minotaures calculés par le worker (processus de calcul, voir service.minotaur_worker).
+Pour chaque mode : durée maximale et 95e centile d'une image (ms) et nombre de déplacements des minotaures.
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/background_benchmark.py [--sizes 200 1000] [--minotaurs 1] [--seconds 20] [--no-sync]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.stub_window import StubGameWindow, stub_photo_images
+from benchmarks.synthetic import make_rows
+from game_play import FRAME_INTERVAL
+
+KEY_INTERVAL = 6  # Nombre d'images entre deux touches (10 touches par seconde)
+PHASE_FRAMES = 60  # Durée (en images) de chaque phase : erreurs, déplacements, pause
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def next_key(engine, frame, rng):
+    """
+    Retourne la touche (dx, dy) du joueur scripté pour cette image, None s'il n'appuie sur rien.
+    """
+    if frame % KEY_INTERVAL:
+        return None
+    x, y = engine.player
+    free, blocked = [], []
+    for dx, dy in DIRECTIONS:
+        nx, ny = x + dx, y + dy
+        if not engine.grid.in_bounds(nx, ny) or engine.grid.is_exit(nx, ny) or (nx, ny) in engine.minotaur_cells:
+            continue
+        (free if engine.grid.is_walkable(nx, ny) else blocked).append((dx, dy))
+    phase = frame // PHASE_FRAMES % 3
+    choices = blocked if phase == 0 else free if phase == 1 else None
+    return rng.choice(choices) if choices else None
+
+
+def play(level_path, background, seconds):
+    """
+    Joue la partie pendant `seconds` secondes (ou jusqu'à sa fin) en mesurant chaque image.
+    :return: Tuple (durées des images en ms, nombre de déplacements des minotaures).
+    """
+    rng = random.Random(0)
+    with stub_photo_images():
+        window = StubGameWindow()
+        window.background_minotaurs = background
+        window.load_level(level_path)
+        window.render_level()
+        window.engine.start()
+
+        frames = []
+        moved = 0
+        end = time.perf_counter() + seconds
+        try:
+            while time.perf_counter() < end and not window.engine.is_over():
+                key = next_key(window.engine, len(frames), rng)
+                if key is not None:
+                    window.queue_move(*key)
+                minotaurs = window.engine.minotaurs
+                start = time.perf_counter()
+                window.process_input()
+                duration = time.perf_counter() - start
+                frames.append(duration * 1000)
+                moved += window.engine.minotaurs != minotaurs
+                time.sleep(max(0.0, FRAME_INTERVAL - duration))
+        finally:
+            window.stop_minotaur_worker()
+    return frames, moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--minotaurs", type=int, nargs="+", default=[1])
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--no-sync", action="store_true", help="Ne pas mesurer le mode synchrone")
+    args = parser.parse_args()
+    modes = (("background", True),) if args.no_sync else (("sync", False), ("background", True))
+
+    print(f"{'size':>10}{'minotaurs':>11}{'mode':>12}{'frames':>8}{'max (ms)':>11}{'p95 (ms)':>11}{'moves':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            for count in args.minotaurs:
+                level_path = os.path.join(directory, f"{size}_{count}.txt")
+                with open(level_path, "w") as file:
+                    file.write("\n".join(make_rows(size, size, minotaurs=count)))
+                for name, background in modes:
+                    frames, moved = play(level_path, background, args.seconds)
+                    frames.sort()
+                    p95 = frames[min(len(frames) - 1, len(frames) * 95 // 100)]
+                    print(f"{f'{size}x{size}':>10}{count:>11}{name:>12}{len(frames):>8}{frames[-1]:>11.2f}"
+                          f"{p95:>11.2f}{moved:>7}")
+
+
+if __name__ == "__main__":
+    main()
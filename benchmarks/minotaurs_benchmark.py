@@ -0,0 +1,93 @@
+"""
+Benchmark du déplacement de plusieurs minotaures (GameEngine.move_minotaur) sur des niveaux synthétiques.
+
+Pour chaque taille et chaque nombre de minotaures, le joueur fait un pas (le champ de distances doit être
+recalculé) puis une erreur. On compare le coût d'une erreur :
+    * shared     : déplacement de tous les minotaures avec un seul BFS inversé depuis le joueur ;
+    * per search : un BFS par minotaure (service.pathfinder.find_path), sans déplacement
+                   (très lent sur les grands niveaux, --no-per-search pour ne pas le mesurer).
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/minotaurs_benchmark.py [--sizes 200 500 1000] [--minotaurs 1 100] [--rounds 3]
+                                             [--no-per-search]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import make_rows
+from domain.grid import Grid
+from service.game_engine import GameEngine, MINOTAUR_STEPS
+from service.pathfinder import find_path
+
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def new_engine(rows):
+    grid = Grid.from_rows(rows)
+    minotaurs = [(x, y) for y, row in enumerate(rows) for x, char in enumerate(row) if char == "$"]
+    engine = GameEngine(grid, (1, 1), minotaurs, timer_limit=3600)
+    engine.start()
+    return engine
+
+
+def player_step(engine, rng):
+    """
+    Déplace le joueur d'une case au hasard (sans erreur, sans atteindre la sortie).
+    """
+    x, y = engine.player
+    moves = [(dx, dy) for dx, dy in DIRECTIONS
+             if engine.grid.is_walkable(x + dx, y + dy) and not engine.grid.is_exit(x + dx, y + dy)
+             and (x + dx, y + dy) not in engine.minotaur_cells]
+    if moves:
+        engine.move_player(*rng.choice(moves))
+
+
+def simulate(rows, rounds, per_search_enabled=True):
+    """
+    Mesure le coût moyen (ms) d'une erreur du joueur avec les deux approches.
+    :return: Tuple (shared, per search), per search vaut None s'il n'est pas mesuré.
+    """
+    rng = random.Random(0)
+    engine = new_engine(rows)
+    shared = per_search = 0.0
+    for _ in range(rounds):
+        if engine.is_over():
+            engine = new_engine(rows)
+        player_step(engine, rng)
+
+        if per_search_enabled:
+            start = time.perf_counter()
+            for minotaur in engine.minotaurs:
+                find_path(engine.grid, minotaur, engine.player)
+            per_search += time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.move_minotaur(MINOTAUR_STEPS)
+        shared += time.perf_counter() - start
+    return shared / rounds * 1000, per_search / rounds * 1000 if per_search_enabled else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 500, 1000])
+    parser.add_argument("--minotaurs", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--no-per-search", action="store_true", help="Ne pas mesurer un BFS par minotaure")
+    args = parser.parse_args()
+
+    print(f"{'size':>10}{'minotaurs':>11}{'shared (ms)':>16}{'per search (ms)':>18}")
+    for size in args.sizes:
+        for count in args.minotaurs:
+            shared, per_search = simulate(make_rows(size, size, minotaurs=count), args.rounds, not args.no_per_search)
+            per_search = f"{per_search:.2f}" if per_search is not None else "-"
+            print(f"{f'{size}x{size}':>10}{count:>11}{shared:>16.2f}{per_search:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark des moteurs de pathfinding du minotaure (service.pathfinder.ENGINES) sur des niveaux synthétiques.
+
+Deux scénarios par taille :
+    * moving   : le joueur fait un pas entre chaque erreur (le champ de distances doit être recalculé) ;
+    * standing : plusieurs erreurs de suite sans que le joueur ne bouge.
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/pathfinding_benchmark.py [--sizes 100 500 1000 2000] [--rounds 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import make_rows
+from domain.grid import Grid
+from service.pathfinder import ENGINES, get_path_finder
+
+
+def simulate(grid, engine, rounds, player_moves, steps=5):
+    """
+    Simule `rounds` erreurs du joueur et retourne le temps moyen (ms) d'un déplacement du minotaure.
+    """
+    rng = random.Random(0)
+    find = get_path_finder(engine, grid)
+    player = (1, 1)
+    minotaur = (grid.width - 2, grid.height - 2)
+    total = 0.0
+    for _ in range(rounds):
+        if player_moves:
+            moves = [(player[0] + dx, player[1] + dy) for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))]
+            moves = [m for m in moves if grid.is_walkable(*m) and m != minotaur]
+            if moves:
+                player = rng.choice(moves)
+        start = time.perf_counter()
+        path = find(grid, minotaur, player)
+        total += time.perf_counter() - start
+        if len(path) <= steps:
+            # Le minotaure rattraperait le joueur : on le replace à son point de départ.
+            minotaur = (grid.width - 2, grid.height - 2)
+        else:
+            minotaur = path[steps - 1]
+    return total / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    args = parser.parse_args()
+
+    print(f"{'size':>10}{'scenario':>10}" + "".join(f"{engine + ' (ms)':>22}" for engine in args.engines))
+    for size in args.sizes:
+        grid = Grid.from_rows(make_rows(size, size))
+        for scenario in ("moving", "standing"):
+            results = [simulate(grid, engine, args.rounds, scenario == "moving") for engine in args.engines]
+            print(f"{f'{size}x{size}':>10}{scenario:>10}" + "".join(f"{r:>22.2f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
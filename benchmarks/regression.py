@@ -0,0 +1,412 @@
+"""
+Suite de benchmarks de non-régression des chemins critiques du jeu :
+    * find_path       : chaque moteur de pathfinding (service.pathfinder.ENGINES), du minotaure vers le joueur ;
+    * move_minotaurs  : une erreur du joueur avec 1 puis 100 minotaures (champ de distances partagé) ;
+    * check_validity  : lecture et validation d'un niveau (résolubilité comprise) ;
+    * get_levels      : liste des niveaux d'un répertoire, sans cache (cold) puis avec le cache (warm) ;
+    * load_level      : GameWindow.load_level (partie et empreinte du niveau) ;
+    * render_level    : premier affichage d'un niveau, dans chaque mode de rendu ;
+    * render_moves    : MOVES déplacements du joueur (avec des erreurs) et leur affichage ;
+    * resize_image    : création d'une miniature de bouton-image (utils.thumbnails.render_thumbnail) ;
+    * import_main     : temps d'import de main (python -X importtime).
+
+Les niveaux sont synthétiques (benchmarks.synthetic) et écrits dans un répertoire temporaire. Le rendu utilise
+un canvas factice (benchmarks.stub_window) : aucun affichage n'est nécessaire. Le rendu dans Tk (sous Xvfb)
+est mesuré par benchmarks/render_benchmark.py.
+
+Les résultats (médiane, minimum et maximum en ms de chaque mesure) sont écrits en JSON. Avec --baseline, ils
+sont comparés à des résultats enregistrés : le code de retour est 1 si la meilleure mesure d'un benchmark est
+plus lente que celle de la référence de plus de --threshold (proportion). Les références doivent être enregistrées sur la même machine.
+
+Utilisation (depuis la racine du projet) :
+    python benchmarks/regression.py [--profile quick|full] [--groups find_path get_levels ...]
+                                    [--output results.json] [--baseline benchmarks/baseline.json]
+                                    [--threshold 0.25] [--save-baseline]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from benchmarks.startup_benchmark import import_times
+from benchmarks.stub_window import StubGameWindow, stub_photo_images
+from benchmarks.synthetic import make_rows, write_level
+from domain.grid import Grid
+from service import level_parser
+from service.game_engine import GameEngine, MINOTAUR_STEPS
+from service.level_cache import CACHE_FILE_NAME
+from service.load_level import check_validity, get_levels
+from service.maze_generator import parse_size
+from service.pathfinder import ENGINES, get_path_finder
+from utils.thumbnails import render_thumbnail
+
+GROUPS = ("find_path", "move_minotaurs", "check_validity", "get_levels", "load_level", "render_level", "render_moves",
+          "resize_image", "import_main")
+PROFILES = {
+    "quick": {"sizes": [(30, 15), (100, 100), (500, 500)], "directories": [10, 100]},
+    "full": {"sizes": [(30, 15), (100, 100), (500, 500), (1000, 1000), (2000, 2000), (4000, 4000)],
+             "directories": [10, 100, 1000, 10000]}
+}
+RENDER_MODES = ("bitmap", "tiles")
+MINOTAUR_COUNTS = (1, 100)
+BASELINE_PATH = os.path.join("benchmarks", "baseline.json")
+DIRECTORY_LEVEL_SIZE = (30, 15)  # Taille des niveaux des répertoires de get_levels
+THUMBNAIL_IMAGE = "./ressources/levels/01.png"
+THUMBNAIL_SIZE = (400, 240)
+MOVES = 100  # Nombre de déplacements du joueur par mesure de render_moves
+BLUNDER_EVERY = 10  # Un déplacement sur BLUNDER_EVERY est une erreur (le minotaure avance)
+MIN_SAMPLE_MS = 50  # Durée minimale d'une mesure : les opérations plus rapides sont répétées
+MAX_CALLS = 1000  # Nombre maximal d'appels d'une opération rapide par mesure
+MIN_DELTA_MS = 0.1  # Écart minimal (ms) pour qu'un ralentissement soit considéré comme une régression
+
+
+class Fixtures:
+    """
+    Classe créant (une seule fois) les niveaux et les répertoires de niveaux synthétiques des benchmarks.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.rows = {}
+        self.levels = {}
+        self.directories = {}
+
+    def level_rows(self, size, minotaurs=1):
+        key = (size, minotaurs)
+        if key not in self.rows:
+            self.rows[key] = make_rows(*size, minotaurs=minotaurs)
+        return self.rows[key]
+
+    def level_path(self, size):
+        """
+        Méthode retournant le chemin d'un niveau synthétique de la taille demandée (écrit au premier appel).
+        :param size: Tuple (largeur, hauteur).
+        :return: Chemin du fichier .txt.
+        """
+        if size not in self.levels:
+            path = os.path.join(self.directory, f"level_{size[0]}x{size[1]}.txt")
+            write_level(path, self.level_rows(size))
+            self.levels[size] = path
+        return self.levels[size]
+
+    def levels_directory(self, count):
+        """
+        Méthode retournant un répertoire de `count` niveaux (les images .png sont des fichiers vides :
+        get_levels ne vérifie que leur présence).
+        :param count: Nombre de niveaux.
+        :return: Chemin du répertoire.
+        """
+        if count not in self.directories:
+            path = os.path.join(self.directory, f"levels_{count}")
+            rows = self.level_rows(DIRECTORY_LEVEL_SIZE)
+            for index in range(count):
+                write_level(os.path.join(path, f"{index:05}.txt"), rows)
+                open(os.path.join(path, f"{index:05}.png"), "wb").close()
+            self.directories[count] = path
+        return self.directories[count]
+
+
+def timed(prepare):
+    """
+    Fonction retournant la mesure d'une opération. Les opérations rapides sont répétées jusqu'à durer
+    MIN_SAMPLE_MS au total : chaque mesure est alors la moyenne de plusieurs appels.
+    :param prepare: Fonction (non mesurée) appelée avant chaque appel, retournant la fonction à mesurer.
+    :return: Fonction sans paramètre retournant la durée (ms) d'un appel de la fonction mesurée.
+    """
+    calls = None
+
+    def call():
+        function = prepare()
+        start = time.perf_counter()
+        function()
+        return (time.perf_counter() - start) * 1000
+
+    def sample():
+        nonlocal calls
+        if calls is None:
+            duration = call()
+            calls = min(MAX_CALLS, max(1, math.ceil(MIN_SAMPLE_MS / max(duration, 1e-3))))
+            if calls == 1:
+                return duration
+        return sum(call() for _ in range(calls)) / calls
+    return sample
+
+
+def measure(sample, repeat, budget):
+    """
+    Fonction répétant une mesure.
+    :param sample: Fonction sans paramètre retournant une durée en millisecondes (voir timed).
+    :param repeat: Nombre de mesures.
+    :param budget: Durée (s) après laquelle on s'arrête, même si moins de `repeat` mesures ont été faites.
+    :return: Liste des durées en millisecondes.
+    """
+    samples = []
+    while len(samples) < repeat and (not samples or sum(samples) < budget * 1000):
+        samples.append(sample())
+    return samples
+
+
+def size_name(size):
+    return f"{size[0]}x{size[1]}"
+
+
+def find_path_cases(fixtures, sizes):
+    for size in sizes:
+        grid = Grid.from_rows(fixtures.level_rows(size))
+        player = (1, 1)
+        minotaur = (size[0] - 2, size[1] - 2)
+        for engine in ENGINES:
+            def prepare(engine=engine, grid=grid, minotaur=minotaur, player=player):
+                # Nouveau moteur à chaque mesure : le champ de distances de "distance_field" part de zéro,
+                # la table de "route_cache" est calculée ici (au chargement du niveau dans le jeu)
+                find = get_path_finder(engine, grid)
+                return lambda: find(grid, minotaur, player)
+            yield f"find_path[{engine}-{size_name(size)}]", timed(prepare)
+
+
+def move_minotaurs_cases(fixtures, sizes):
+    for size in sizes:
+        for count in MINOTAUR_COUNTS:
+            rows = fixtures.level_rows(size, count)
+            grid = Grid.from_rows(rows)
+            minotaurs = [(x, y) for y, row in enumerate(rows) for x, char in enumerate(row) if char == "$"]
+
+            def prepare(grid=grid, minotaurs=minotaurs):
+                # Nouvelle partie à chaque mesure : le champ de distances part de zéro
+                engine = GameEngine(grid.copy(), (1, 1), minotaurs, 3600)
+                engine.start()
+                return lambda: engine.move_minotaur(MINOTAUR_STEPS)
+            yield f"move_minotaurs[{count}-{size_name(size)}]", timed(prepare)
+
+
+def check_validity_cases(fixtures, sizes):
+    for size in sizes:
+        path = fixtures.level_path(size)
+
+        def prepare(path=path):
+            level_parser._parsed_levels.clear()
+            return lambda: check_validity(path)
+        yield f"check_validity[{size_name(size)}]", timed(prepare)
+
+
+def get_levels_cases(fixtures, counts):
+    for count in counts:
+        path = fixtures.levels_directory(count)
+        cache_path = os.path.join(path, CACHE_FILE_NAME)
+
+        def prepare_cold(path=path, cache_path=cache_path):
+            level_parser._parsed_levels.clear()
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            return lambda: get_levels(path)
+        yield f"get_levels[cold-{count}]", timed(prepare_cold)
+
+        def prepare_warm(path=path):
+            level_parser._parsed_levels.clear()
+            get_levels(path)
+            return lambda: get_levels(path)
+        yield f"get_levels[warm-{count}]", timed(prepare_warm)
+
+
+def load_level_cases(fixtures, sizes):
+    for size in sizes:
+        path = fixtures.level_path(size)
+
+        def prepare(path=path):
+            level_parser._parsed_levels.clear()
+            window = StubGameWindow()
+            return lambda: window.load_level(path)
+        yield f"load_level[{size_name(size)}]", timed(prepare)
+
+
+def render_level_cases(fixtures, sizes):
+    for size in sizes:
+        path = fixtures.level_path(size)
+        for mode in RENDER_MODES:
+            def prepare(path=path, mode=mode):
+                window = StubGameWindow(render_mode=mode)
+                window.load_level(path)
+                return window.render_level
+            yield f"render_level[{mode}-{size_name(size)}]", timed(prepare)
+
+
+def render_moves_cases(fixtures, sizes):
+    for size in sizes:
+        path = fixtures.level_path(size)
+        for mode in RENDER_MODES:
+            def prepare(path=path, mode=mode):
+                window = StubGameWindow(render_mode=mode)
+                window.load_level(path)
+                window.render_level()
+                window.engine.start()
+                return lambda: play_moves(window, MOVES)
+            yield f"render_moves[{mode}-{size_name(size)}]", timed(prepare)
+
+
+def play_moves(window, moves):
+    """
+    Procédure déplaçant le joueur au hasard (toujours de la même façon), avec une erreur tous les BLUNDER_EVERY
+    déplacements. S'arrête si la partie se termine.
+    """
+    rng = random.Random(0)
+    engine = window.engine
+    grid = engine.grid
+    for move in range(moves):
+        if engine.is_over():
+            return
+        x, y = engine.player
+        free, blocked = [], []
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nx, ny = x + dx, y + dy
+            if not grid.in_bounds(nx, ny) or grid.is_exit(nx, ny) or (nx, ny) in engine.minotaur_cells:
+                continue
+            (free if grid.is_walkable(nx, ny) else blocked).append((dx, dy))
+        choices = blocked if blocked and move % BLUNDER_EVERY == BLUNDER_EVERY - 1 else free
+        if choices:
+            window.queue_move(*rng.choice(choices))
+            window.process_input()
+
+
+def resize_image_cases():
+    def prepare():
+        return lambda: render_thumbnail(THUMBNAIL_IMAGE, THUMBNAIL_SIZE, "01")
+    yield f"resize_image[{size_name(THUMBNAIL_SIZE)}]", timed(prepare)
+
+
+def import_main_cases():
+    # Temps d'import mesuré par l'interpréteur (-X importtime), sans le démarrage du sous-processus
+    yield "import_main", lambda: import_times(0)[0]
+
+
+def iter_cases(groups, fixtures, sizes, counts):
+    factories = {
+        "find_path": lambda: find_path_cases(fixtures, sizes),
+        "move_minotaurs": lambda: move_minotaurs_cases(fixtures, sizes),
+        "check_validity": lambda: check_validity_cases(fixtures, sizes),
+        "get_levels": lambda: get_levels_cases(fixtures, counts),
+        "load_level": lambda: load_level_cases(fixtures, sizes),
+        "render_level": lambda: render_level_cases(fixtures, sizes),
+        "render_moves": lambda: render_moves_cases(fixtures, sizes),
+        "resize_image": resize_image_cases,
+        "import_main": import_main_cases
+    }
+    for group in groups:
+        yield from factories[group]()
+
+
+def summarize(samples):
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "max_ms": max(samples),
+            "runs": len(samples)}
+
+
+def run_benchmarks(groups, sizes, counts, repeat, budget, verbose=True):
+    """
+    Fonction exécutant les benchmarks des groupes demandés.
+    :param groups: Groupes de mesures (voir GROUPS).
+    :param sizes: Tailles des niveaux synthétiques (largeur, hauteur).
+    :param counts: Nombres de niveaux des répertoires de get_levels.
+    :param repeat: Nombre de mesures par benchmark.
+    :param budget: Durée maximale (s) des mesures d'un benchmark (au moins une mesure est faite).
+    :param verbose: True pour afficher chaque résultat.
+    :return: Dictionnaire nom du benchmark → résumé des mesures.
+    """
+    results = {}
+    directory = tempfile.mkdtemp(prefix="minotaur_bench_")
+    try:
+        fixtures = Fixtures(directory)
+        with stub_photo_images():
+            for name, sample in iter_cases(groups, fixtures, sizes, counts):
+                samples = measure(sample, repeat, budget)
+                results[name] = summarize(samples)
+                if verbose:
+                    print(f"{name:<40}{results[name]['median_ms']:>14.3f} ms  ({len(samples)} runs)", flush=True)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Fonction comparant des résultats à des résultats de référence.
+    Les meilleures mesures (minimum) sont comparées : elles sont les moins sensibles à la charge de la machine.
+    :param results: Résultats mesurés (voir run_benchmarks).
+    :param baseline: Résultats de référence.
+    :param threshold: Ralentissement toléré (0.25 : 25 % plus lent que la référence).
+    :return: Liste des (nom, durée de référence, durée mesurée, rapport) des régressions.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<40}{'baseline (ms)':>16}{'current (ms)':>16}{'ratio':>9}")
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<40}{'-':>16}{result['min_ms']:>16.3f}{'new':>9}")
+            continue
+        before, after = reference["min_ms"], result["min_ms"]
+        ratio = after / before if before else float("inf")
+        regressed = after > before * (1 + threshold) and after - before > MIN_DELTA_MS
+        print(f"{name:<40}{before:>16.3f}{after:>16.3f}{ratio:>8.2f}x" + ("  REGRESSION" if regressed else ""))
+        if regressed:
+            regressions.append((name, before, after, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", choices=PROFILES, default="quick",
+                        help="Tailles des niveaux et des répertoires mesurés")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", help="Tailles des niveaux (LARGEURxHAUTEUR)")
+    parser.add_argument("--directories", type=int, nargs="+", help="Nombres de niveaux des répertoires")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--repeat", type=int, default=5, help="Nombre de mesures par benchmark")
+    parser.add_argument("--budget", type=float, default=5.0,
+                        help="Durée maximale (s) des mesures d'un benchmark")
+    parser.add_argument("--output", help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", help="Résultats de référence (JSON) auxquels comparer les mesures")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Ralentissement toléré par rapport à la référence (proportion)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Enregistrer les résultats comme référence ({BASELINE_PATH} par défaut)")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.profile]
+    results = run_benchmarks(args.groups, args.sizes or profile["sizes"], args.directories or profile["directories"],
+                             args.repeat, args.budget)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "profile": args.profile,
+        "results": results
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline or BASELINE_PATH, "w") as file:
+            json.dump(report, file, indent=2)
+        return 0
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+        print("\nNo regression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
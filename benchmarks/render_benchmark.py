@@ -0,0 +1,103 @@
+"""
+Micro-benchmark du rendu de GameWindow : latence par déplacement avec un redessin de toute la carte à chaque
+déplacement (ancien comportement, tous les chunks sont recréés, y compris hors de la zone visible) et avec la
+mise à jour des seules cases modifiées des chunks affichés.
+
+Utilisation (depuis la racine du projet, un affichage ou Xvfb est nécessaire) :
+    python benchmarks/render_benchmark.py [--moves 200] [--mode bitmap|tiles]
+"""
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from tkinter import Tk, IntVar
+
+from benchmarks.synthetic import make_rows, write_level
+import game_play
+from game_play import GameWindow
+
+
+def legal_moves(window):
+    """
+    Retourne les déplacements du joueur qui ne terminent pas la partie et ne font pas avancer le minotaure.
+    """
+    engine = window.engine
+    moves = []
+    for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        x, y = engine.player[0] + dx, engine.player[1] + dy
+        if (engine.grid.in_bounds(x, y) and engine.grid.is_walkable(x, y) and not engine.grid.is_exit(x, y)
+                and (x, y) not in engine.minotaur_cells):
+            moves.append((dx, dy))
+    return moves
+
+
+def render_full_map(window):
+    """
+    Redessine toute la carte : render_level ne crée que les chunks visibles, les autres sont créés ici.
+    """
+    window.render_level()
+    grid = window.engine.grid
+    for chunk_y in range((grid.height - 1) // game_play.CHUNK_SIZE + 1):
+        for chunk_x in range((grid.width - 1) // game_play.CHUNK_SIZE + 1):
+            if (chunk_x, chunk_y) not in window.chunks:
+                window.materialize_chunk(chunk_x, chunk_y)
+
+
+def run(root, level_path, moves, full_redraw):
+    """
+    Mesure la latence de `moves` déplacements du joueur, canvas compris (update_idletasks).
+    :return: Liste des latences en millisecondes.
+    """
+    window = GameWindow(root=root, level_path=level_path, timer_limit=IntVar(value=3600))
+    window.engine.start()
+    root.update()
+    rng = random.Random(0)
+    timings = []
+    for _ in range(moves):
+        dx, dy = rng.choice(legal_moves(window))
+        start = time.perf_counter()
+        window.queue_move(dx, dy)
+        window.process_input()
+        if full_redraw:
+            render_full_map(window)
+        window.canvas.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    window.destroy()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument("--size", type=int, default=500, help="Côté du niveau synthétique")
+    parser.add_argument("--mode", choices=("bitmap", "tiles"), default=game_play.RENDER_MODE)
+    args = parser.parse_args()
+    game_play.RENDER_MODE = args.mode
+
+    levels = sorted(glob.glob("./ressources/levels/*.txt"))
+    tmp_dir = tempfile.mkdtemp()
+    synthetic = os.path.join(tmp_dir, f"synthetic_{args.size}.txt")
+    write_level(synthetic, make_rows(args.size, args.size))
+    levels.append(synthetic)
+
+    root = Tk()
+    root.withdraw()
+    print(f"{'level':<24}{'full map redraw (ms)':>22}{'dirty cells (ms)':>20}")
+    for level_path in levels:
+        before = statistics.median(run(root, level_path, args.moves, full_redraw=True))
+        after = statistics.median(run(root, level_path, args.moves, full_redraw=False))
+        print(f"{os.path.basename(level_path):<24}{before:>22.3f}{after:>20.3f}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
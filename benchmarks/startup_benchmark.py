@@ -0,0 +1,104 @@
+"""
+Benchmark du démarrage du jeu, à suivre d'une version à l'autre :
+    * temps d'import de main (python -X importtime), avec les modules les plus coûteux ;
+    * temps jusqu'au premier affichage du menu ;
+    * temps jusqu'à ce que la liste des niveaux soit complète.
+Chaque mesure est faite dans un nouvel interpréteur ; la médiane de --runs lancements est retenue.
+
+Utilisation (depuis la racine du projet, un affichage ou Xvfb est nécessaire pour les mesures d'affichage) :
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 10] [--output startup.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Script exécuté dans un nouvel interpréteur : affiche les temps (s) depuis le début du script en JSON.
+PAINT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from tkinter import Tk
+import main
+root = Tk()
+menu = main.GameMenu(root)
+root.update()
+first_paint = time.perf_counter() - start
+while not menu.levels_loaded:
+    root.update()
+levels_loaded = time.perf_counter() - start
+root.destroy()
+print(json.dumps({"first_paint": first_paint, "levels_loaded": levels_loaded}))
+"""
+
+
+def import_times(top):
+    """
+    Mesure le temps d'import de main avec -X importtime.
+    :param top: Nombre de modules les plus coûteux (temps cumulé) à retourner.
+    :return: Tuple (temps total en ms, liste des (module, temps cumulé en ms)).
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  ") and name.strip() != "main":
+            # Module de premier niveau importé au démarrage de l'interpréteur (site, encodings...) : ignoré
+            modules = []
+            continue
+        modules.append((name.strip(), int(cumulative) / 1000))
+    total = next(ms for name, ms in modules if name == "main")
+    modules = [(name, ms) for name, ms in modules if name != "main"]
+    return total, sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+
+
+def paint_times():
+    """
+    Mesure les temps d'affichage du menu dans un nouvel interpréteur.
+    :return: Dictionnaire des temps en ms, None si aucun affichage n'est disponible.
+    """
+    result = subprocess.run([sys.executable, "-c", PAINT_SCRIPT], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return {name: seconds * 1000 for name, seconds in json.loads(result.stdout.splitlines()[-1]).items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Nombre de modules les plus coûteux à afficher")
+    parser.add_argument("--output", default=None, help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args(argv)
+
+    imports = [import_times(args.top) for _ in range(args.runs)]
+    results = {"import_main_ms": statistics.median(total for total, _ in imports),
+               "slowest_imports_ms": dict(imports[-1][1])}
+
+    paints = [paint_times() for _ in range(args.runs)]
+    if all(paints):
+        for name in paints[0]:
+            results[f"{name}_ms"] = statistics.median(paint[name] for paint in paints)
+    else:
+        print("No display available : first paint not measured", file=sys.stderr)
+
+    print(f"import main : {results['import_main_ms']:.1f} ms")
+    for name, ms in results["slowest_imports_ms"].items():
+        print(f"    {name:<40} {ms:8.1f} ms")
+    for name in ("first_paint_ms", "levels_loaded_ms"):
+        if name in results:
+            print(f"{name[:-3].replace('_', ' ')} : {results[name]:.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
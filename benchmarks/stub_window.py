@@ -0,0 +1,162 @@
+"""
+Fenêtre de jeu sans affichage pour les benchmarks : GameWindow dessine dans un canvas factice qui ne fait
+qu'enregistrer ses items. Le coût mesuré est celui du code Python du rendu (chunks, composition des images
+du terrain, cases modifiées), sans celui de Tk.
+"""
+import contextlib
+from collections import OrderedDict, deque
+
+import game_play
+from domain.grid import BUSH, FLOOR, EXIT, EXIT_WITH_PLAYER
+from domain.tile import TILE_SIZE
+from game_play import GameWindow
+from utils.assets import assets
+
+VIEW_SIZE = (1920, 1080)  # Taille (en pixels) de la zone visible simulée
+
+
+class StubCanvas:
+    """
+    Canvas factice ayant les méthodes de tkinter.Canvas utilisées par GameWindow.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.items = {}  # identifiant → [x, y, image, tags]
+        self.next_id = 1
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def create_image(self, x, y, image=None, anchor="nw", tags=()):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = [x, y, image, tags]
+        return item
+
+    def itemconfig(self, item, image=None, state=None):
+        if image is not None:
+            self.items[item][2] = image
+
+    def coords(self, item, x, y):
+        self.items[item][0] = x
+        self.items[item][1] = y
+
+    def delete(self, tag):
+        if tag == "all":
+            self.items.clear()
+            return
+        for item in [item for item, values in self.items.items() if values[3] == tag]:
+            del self.items[item]
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def tag_lower(self, item):
+        pass
+
+    def configure(self, **options):
+        pass
+
+    def xview_moveto(self, fraction):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+class StubSprite:
+    """
+    Sprite factice : même interface que domain.tile.Tile, l'image du canvas est le nom du sprite.
+    """
+
+    def __init__(self, name):
+        self.image = name
+        self.pil_image = assets.get_image(name, (TILE_SIZE, TILE_SIZE))
+
+    def render(self, canvas, x, y, tags=()):
+        return canvas.create_image(x, y, image=self.image, anchor="nw", tags=tags)
+
+    def update(self, canvas, item):
+        canvas.itemconfig(item, image=self.image)
+
+
+class StubPhotoImage:
+    """
+    Remplace ImageTk.PhotoImage (qui nécessite Tk) : garde seulement l'image Pillow composée.
+    """
+
+    def __init__(self, image):
+        self.image = image
+
+
+class StubImageTk:
+    PhotoImage = StubPhotoImage
+
+
+class StubValue:
+    """
+    Remplace l'IntVar du temps maximal choisi dans le menu.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class StubGameWindow(GameWindow):
+    """
+    GameWindow sans Toplevel : seuls les attributs utilisés par le chargement du niveau et le rendu sont créés.
+    Le niveau n'est pas chargé par le constructeur, pour pouvoir mesurer load_level et render_level séparément.
+    """
+
+    def __init__(self, render_mode=game_play.RENDER_MODE, view_size=VIEW_SIZE, timer_limit=3600):
+        self.timer_limit = StubValue(timer_limit)
+        self.canvas = StubCanvas(*view_size)
+        self.tile_sprites = {
+            BUSH: StubSprite("bush"),
+            FLOOR: StubSprite("floor"),
+            EXIT: StubSprite("exit"),
+            EXIT_WITH_PLAYER: StubSprite("exitWithPlayer")
+        }
+        self.player_sprite = StubSprite("player")
+        self.minotaur_sprite = StubSprite("minotaur")
+        self.chunks = {}
+        self.camera_x = 0
+        self.camera_y = 0
+        self.dirty_cells = set()
+        self.render_mode = render_mode
+        self.chunk_images = OrderedDict()
+        self.actor_items = {}
+        self.engine = None
+        self.input_queue = deque()
+        self.max_moves_per_frame = game_play.MAX_MOVES_PER_FRAME
+        self.replay = None
+        self.recorder = None
+        # Les minotaures sont déplacés immédiatement (sans worker) : le pathfinding fait partie du coût mesuré
+        self.background_minotaurs = False
+        # La table de routage est construite pendant load_level : aucun thread ne reste actif entre deux mesures
+        self.background_routes = False
+        self.minotaur_worker = None
+
+    def end_game(self, is_lost=False, is_timeout=False):
+        pass
+
+
+@contextlib.contextmanager
+def stub_photo_images():
+    """
+    Contexte dans lequel les images des chunks (mode "bitmap") sont créées sans Tk.
+    """
+    image_tk = game_play.ImageTk
+    game_play.ImageTk = StubImageTk
+    try:
+        yield
+    finally:
+        game_play.ImageTk = image_tk
@@ -0,0 +1,54 @@
+import os
+import random
+
+
+def make_rows(width, height, wall_density=0.2, seed=0, minotaurs=1):
+    """
+    Fonction permettant de générer un niveau synthétique ouvert (bordure de buissons, buissons aléatoires).
+    Le joueur est placé en haut à gauche, le premier minotaure en bas à droite et la sortie sur la bordure droite.
+    Les minotaures suivants sont placés au hasard sur les couloirs garantissant la connexité (ils peuvent donc
+    toujours atteindre le joueur), loin du joueur.
+    Les cases voisines du joueur, du premier minotaure et de la sortie sont toujours libres.
+    :param width: Largeur du niveau (>= 5).
+    :param height: Hauteur du niveau (>= 5).
+    :param wall_density: Proportion de buissons à l'intérieur du niveau.
+    :param seed: Graine du générateur aléatoire.
+    :param minotaurs: Nombre de minotaures.
+    :return: Liste des lignes du niveau au format texte.
+    """
+    rng = random.Random(seed)
+    grid = [["#"] * width for _ in range(height)]
+    for y in range(1, height - 1):
+        row = grid[y]
+        for x in range(1, width - 1):
+            row[x] = "#" if rng.random() < wall_density else "-"
+    # Couloirs garantissant la connexité : première ligne et dernière colonne intérieures.
+    for x in range(1, width - 1):
+        grid[1][x] = "-"
+    for y in range(1, height - 1):
+        grid[y][width - 2] = "-"
+        grid[y][1] = "-"
+    for x in range(1, width - 1):
+        grid[height - 2][x] = "-"
+    grid[1][1] = "@"
+    grid[height - 2][width - 2] = "$"
+    grid[height // 2][width - 1] = "."
+
+    corridors = [(x, height - 2) for x in range(3, width - 2)]
+    corridors += [(width - 2, y) for y in range(3, height - 2) if y != height // 2]
+    corridors += [(1, y) for y in range(height // 2, height - 1)]
+    for x, y in rng.sample(corridors, min(minotaurs - 1, len(corridors))):
+        grid[y][x] = "$"
+    return ["".join(row) for row in grid]
+
+
+def write_level(path, rows):
+    """
+    Procédure permettant d'écrire un niveau synthétique sur le disque.
+    :param path: Chemin du fichier .txt à écrire.
+    :param rows: Lignes du niveau.
+    :return: NONE
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        file.write("\n".join(rows))
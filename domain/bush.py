@@ -1,7 +1,7 @@
 from domain.tile import Tile
 
 class Bush(Tile):
-    _image_path = "./ressources/images/bush.png"
+    _sprite = "bush"
 
     def is_walkable(self):
         return False
\ No newline at end of file
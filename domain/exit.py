@@ -1,7 +1,7 @@
 from domain.tile import Tile
 
 class Exit(Tile):
-    _image_path = "./ressources/images/exit.png"
+    _sprite = "exit"
 
     def is_exit(self):
         return True
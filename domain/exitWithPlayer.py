@@ -1,4 +1,4 @@
 from domain.tile import Tile
 
 class ExitWithPlayer(Tile):
-    _image_path = "./ressources/images/exitWithPlayer.png"
+    _sprite = "exitWithPlayer"
@@ -1,4 +1,4 @@
 from domain.tile import Tile
 
 class Floor(Tile):
-    _image_path = "./ressources/images/floor.png"
+    _sprite = "floor"
@@ -0,0 +1,108 @@
+BUSH = 0
+FLOOR = 1
+EXIT = 2
+EXIT_WITH_PLAYER = 3
+
+# Tables de correspondance indexées par le code de la tuile.
+WALKABLE = bytes((0, 1, 1, 1))
+IS_EXIT = bytes((0, 0, 1, 0))
+
+# Table de traduction caractère du fichier → code de tuile (utilisée avec bytes.translate).
+# Tout caractère inconnu (ainsi que le joueur et le minotaure) correspond à un sol.
+_char_table = bytearray([FLOOR]) * 256
+_char_table[ord("#")] = BUSH
+_char_table[ord(".")] = EXIT
+CHAR_TABLE = bytes(_char_table)
+
+
+class Grid:
+    """
+    Classe représentant le terrain d'un niveau sous forme de tableau plat d'octets.
+    Chaque case occupe un seul octet (code de tuile) ; le joueur et le minotaure ne sont pas stockés
+    dans la grille, leurs positions sont gérées à côté.
+    """
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, fill: int = BUSH):
+        """
+        Constructeur de la classe Grid.
+        :param width: Largeur de la grille (nombre de colonnes).
+        :param height: Hauteur de la grille (nombre de lignes).
+        :param fill: Code de tuile utilisé pour remplir la grille.
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Méthode permettant de construire une grille à partir des lignes (déjà nettoyées) d'un fichier de niveau.
+        Les lignes plus courtes que la plus longue sont complétées par des buissons.
+        :param rows: Liste de chaînes de caractères décrivant le niveau.
+        :return: La grille correspondante.
+        """
+        width = max((len(row) for row in rows), default=0)
+        grid = cls(width, len(rows))
+        for y, row in enumerate(rows):
+            start = y * width
+            grid.cells[start:start + len(row)] = row.encode("ascii", "replace").translate(CHAR_TABLE)
+        return grid
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, cells):
+        """
+        Méthode permettant de construire une grille à partir de codes de tuiles déjà traduits
+        (par exemple avec bytes.translate(CHAR_TABLE)).
+        :param width: Largeur de la grille.
+        :param height: Hauteur de la grille.
+        :param cells: Codes des cases, ligne par ligne (width * height octets).
+        :return: La grille correspondante.
+        """
+        grid = cls.__new__(cls)
+        grid.width = width
+        grid.height = height
+        grid.cells = bytearray(cells)
+        return grid
+
+    @classmethod
+    def from_buffer(cls, width: int, height: int, buffer, offset: int = 0):
+        """
+        Méthode permettant de construire une grille sans copie au-dessus d'un buffer existant (par exemple un mmap).
+        La grille obtenue est en lecture seule si le buffer l'est : utiliser copy() avant de la modifier.
+        :param width: Largeur de la grille.
+        :param height: Hauteur de la grille.
+        :param buffer: Objet supportant le protocole buffer contenant les codes des cases.
+        :param offset: Position du premier code de case dans le buffer.
+        :return: La grille correspondante.
+        """
+        grid = cls.__new__(cls)
+        grid.width = width
+        grid.height = height
+        grid.cells = memoryview(buffer)[offset:offset + width * height]
+        return grid
+
+    def copy(self):
+        """
+        Méthode retournant une copie indépendante de la grille.
+        :return: La copie de la grille.
+        """
+        return Grid.from_cells(self.width, self.height, self.cells)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, code: int):
+        self.cells[y * self.width + x] = code
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        return WALKABLE[self.cells[y * self.width + x]] == 1
+
+    def is_exit(self, x: int, y: int) -> bool:
+        return IS_EXIT[self.cells[y * self.width + x]] == 1
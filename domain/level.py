@@ -1,9 +1,16 @@
 import os
 
 class Level:
-    def __init__(self, name: str, path: str):
+    def __init__(self, name: str, path: str, width: int = None, height: int = None,
+                 exit_distance: int = None, minotaur_distance: int = None, extension: str = ".txt"):
         self.name = name
         self.path = path
+        self.extension = extension  # ".txt" ou ".lvl" pour un niveau compilé
+        # Métadonnées calculées lors de la validation du niveau (voir service.load_level.analyse_level)
+        self.width = width
+        self.height = height
+        self.exit_distance = exit_distance          # Plus court chemin joueur → sortie
+        self.minotaur_distance = minotaur_distance  # Plus court chemin minotaure le plus proche → joueur
 
     def __str__(self):
         return f"Level: {self.name}"
@@ -14,5 +21,14 @@ class Level:
     def get_txt_path(self) -> str:
         return os.path.join(self.path + ".txt")
 
+    def get_level_path(self) -> str:
+        return os.path.join(self.path + self.extension)
+
     def get_png_path(self) -> str:
-        return os.path.join(self.path + ".png")
\ No newline at end of file
+        return os.path.join(self.path + ".png")
+
+    def get_dimensions(self):
+        return self.width, self.height
+
+    def get_optimal_length(self):
+        return self.exit_distance
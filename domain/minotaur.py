@@ -1,7 +1,7 @@
 from domain.tile import Tile
 
 class Minotaur(Tile):
-    _image_path = "./ressources/images/minotaur.png"
+    _sprite = "minotaur"
 
     def __init__(self):
         super().__init__()
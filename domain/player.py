@@ -1,7 +1,7 @@
 from domain.tile import Tile
 
 class Player(Tile):
-    _image_path = "./ressources/images/player.png"
+    _sprite = "player"
 
     def __init__(self):
         super().__init__()
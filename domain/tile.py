@@ -1,16 +1,13 @@
-from PIL import Image, ImageTk
+from utils.assets import assets
 
 TILE_SIZE = 32
 
 class Tile:
-    _image_path = None
-    _image = None
+    _sprite = None  # Nom du sprite dans l'atlas (voir utils.assets.SPRITES)
 
     def __init__(self):
-        if not self.__class__._image:
-            img = Image.open(self.__class__._image_path).resize((TILE_SIZE, TILE_SIZE))
-            self.__class__._image = ImageTk.PhotoImage(img)
-        self.image = self.__class__._image
+        self.image = assets.get_photo(self._sprite, (TILE_SIZE, TILE_SIZE))
+        self.pil_image = assets.get_image(self._sprite, (TILE_SIZE, TILE_SIZE))
 
     def is_walkable(self):
         return True
@@ -18,5 +15,8 @@ class Tile:
     def is_exit(self):
         return False
 
-    def render(self, canvas, x, y):
-        canvas.create_image(x, y, image=self.image, anchor="nw")
+    def render(self, canvas, x, y, tags=()):
+        return canvas.create_image(x, y, image=self.image, anchor="nw", tags=tags)
+
+    def update(self, canvas, item):
+        canvas.itemconfig(item, image=self.image)
@@ -1,36 +1,75 @@
-import time
+import os
+from collections import OrderedDict, deque
 from tkinter import Toplevel, Canvas, Label, Button
 
+from PIL import Image, ImageTk
+
 from domain.bush import Bush
 from domain.exit import Exit
 from domain.exitWithPlayer import ExitWithPlayer
 from domain.floor import Floor
+from domain.grid import BUSH, FLOOR, EXIT, EXIT_WITH_PLAYER
 from domain.minotaur import Minotaur
 from domain.player import Player
-from service.pathfinder import find_path
+from service.game_engine import GameEngine, SimulatedClock, PLAYING, CAUGHT, TIMEOUT
+from service.level_parser import load_parsed_level
+from service.minotaur_worker import MinotaurWorker, ASYNC_MIN_CELLS, walkable_cells
+from service.pathfinder import get_path_finder
+from service.replay import Replay, apply_input, level_hash, replay_path
+from utils import instrumentation
+from utils.scheduler import scheduler
 
 TILE_SIZE = 32  # Taille d'une tuile en pixels
+PATHFINDING_ENGINE = "route_cache"  # Moteur de pathfinding du minotaure (voir service.pathfinder.ENGINES)
+# Sur les grands niveaux (à partir de ASYNC_MIN_CELLS cases franchissables), les minotaures sont calculés en
+# arrière-plan (voir service.minotaur_worker). Cela change les règles : les pas dus après une erreur ne sont
+# appliqués qu'une fois le calcul terminé pour la position actuelle du joueur, un joueur qui bouge sans arrêt
+# repousse donc l'avance des minotaures (elle est cumulée, pas perdue).
+BACKGROUND_MINOTAURS = True
+CHUNK_SIZE = 16  # Côté d'un chunk en cases : la carte est affichée par morceaux de CHUNK_SIZE x CHUNK_SIZE cases
+VIEWPORT_MARGIN = 1  # Nombre de chunks gardés affichés autour de la zone visible
+# "bitmap" : terrain pré-rendu en une image par chunk, joueur et minotaures dessinés par-dessus ;
+# "tiles" : un item du canvas par case.
+RENDER_MODE = "bitmap"
+TIMER_INTERVAL = 0.05  # Intervalle (s) de mise à jour du chronomètre
+FRAME_INTERVAL = 1 / 60  # Intervalle (s) de traitement des touches : les déplacements sont appliqués par image
+MAX_MOVES_PER_FRAME = 4  # Nombre maximal de déplacements appliqués par image
+INPUT_QUEUE_SIZE = 16  # Nombre maximal de touches en attente, les suivantes sont ignorées (répétition des touches)
+OVERLAY_INTERVAL = 0.5  # Intervalle (s) de mise à jour des mesures affichées lorsque l'instrumentation est active
+CHUNK_IMAGE_CACHE_SIZE = 64  # Nombre d'images de chunks gardées en mémoire (mode "bitmap")
+
+
+def format_time(seconds):
+    """
+    Fonction retournant le texte affiché pour une durée (minutes:secondes.centièmes).
+    :param seconds: Durée en secondes.
+    :return: Le texte formaté.
+    """
+    minutes = int(seconds // 60)
+    centiseconds = int((seconds - int(seconds)) * 100)
+    return f"{minutes:02}:{int(seconds % 60):02}.{centiseconds:02}"
 
 
 class GameWindow(Toplevel):
     """
     Classe de la fenêtre de jeu.
     Affiche différentes informations comme la carte (niveau) et le chronomètre.
-    Gère de manière générale le déroulement du jeu.
+    Les règles du jeu sont gérées par service.game_engine.GameEngine ; la fenêtre ne fait que l'afficher.
     """
 
-    def __init__(self, root, level_path, timer_limit):
+    def __init__(self, root, level_path, timer_limit, replay=None, replay_speed=1.0):
         """
         Constructeur de la classe GameWindow
         :param root: fenêtre parent à laquelle on sera rattaché.
         :param level_path: Niveau choisit par l'utilisateur dans le menu.
-        :param timer_limit: Temps maximal pour le timer choisit par l'utilisateur.
+        :param timer_limit: Temps maximal pour le timer choisit par l'utilisateur (ignoré pour un replay).
+        :param replay: Replay à relire (service.replay.Replay) au lieu de laisser jouer l'utilisateur.
+        :param replay_speed: Vitesse de relecture (1.0 : temps réel), None pour relire aussi vite que possible.
         """
         super().__init__(root)
-        self.title("Minotaur - play")
+        self.title("Minotaur - replay" if replay is not None else "Minotaur - play")
         self.attributes("-fullscreen", True)
         self.configure(bg="green")
-        self.start_time = None
         self.timer_limit = timer_limit
         # Canvas du jeu
         self.canvas = Canvas(self, bg="green")
@@ -38,22 +77,44 @@ class GameWindow(Toplevel):
         # Permet de fermer la fenêtre de jeu quand le joueur appuie sur Escape
         self.bind("<Escape>", lambda e: self.destroy())
 
-        # Gestion d'association classes de tuiles et caractères du fichier.
-        ## Chargement des images et association des caractères aux classes de tuiles
-        self.tile_classes = {
-            "#": Bush,
-            "-": Floor,
-            "$": Minotaur,
-            "@": Player,
-            ".": Exit
+        # Association codes de la grille et tuiles affichées.
+        ## Une seule instance de tuile par code : les tuiles ne servent plus qu'à l'affichage.
+        self.tile_sprites = {
+            BUSH: Bush(),
+            FLOOR: Floor(),
+            EXIT: Exit(),
+            EXIT_WITH_PLAYER: ExitWithPlayer()
         }
-        self.tiles = []     # Grille des tuiles du niveau
-        self.player = None  # Référence au joueur
-        self.minotaur = None  # Référence au minotaure
+        self.player_sprite = Player()
+        self.minotaur_sprite = Minotaur()
+        self.chunks = {}  # Chunks affichés : (cx, cy) → identifiants des items du canvas, ligne par ligne
+        self.camera_x = 0  # Position (en pixels) du coin haut-gauche de la zone visible dans la carte
+        self.camera_y = 0
+        self.dirty_cells = set()  # Cases à redessiner lors du prochain flush_render
+        self.render_mode = RENDER_MODE
+        self.chunk_images = OrderedDict()  # Images du terrain des chunks déjà composées : (cx, cy) → PhotoImage
+        self.actor_items = {}  # Items du canvas du joueur et des minotaures (mode "bitmap")
+        self.engine = None  # État et règles de la partie
+        self.timer_text = None  # Texte affiché par le chronomètre
+        self.timer_subscription = None  # Abonnement du chronomètre au scheduler
+        self.input_queue = deque()  # Déplacements (dx, dy) demandés et pas encore appliqués
+        self.input_subscription = None  # Abonnement du traitement des touches au scheduler
+        self.max_moves_per_frame = MAX_MOVES_PER_FRAME
+        self.replay = replay  # Replay relu (None pour une partie jouée)
+        self.replay_speed = replay_speed
+        self.replay_inputs = None  # Entrées du replay restant à appliquer
+        self.next_input = None  # Prochaine entrée du replay (temps, dx, dy)
+        self.replay_start = None  # Début de la relecture (horloge du scheduler)
+        self.recorder = None  # Enregistrement de la partie jouée
+        self.background_minotaurs = BACKGROUND_MINOTAURS
+        self.background_routes = True  # Préparation du moteur de pathfinding dans un thread (voir load_level)
+        self.minotaur_worker = None  # Calcul des minotaures en arrière-plan (grands niveaux)
 
         # Chargement du niveau depuis le fichier
         self.load_level(level_path)
         self.render_level()
+        # La zone visible change de taille lorsque la fenêtre passe en plein écran
+        self.canvas.bind("<Configure>", lambda e: self.follow_player())
 
         # Interface : Chronomètre et bouton de démarrage
         self.timer_label = Label(self, text=f"00:00:00", font=("Arial", 40), bg="green", fg="red")
@@ -64,39 +125,242 @@ class GameWindow(Toplevel):
         self.bind("<Return>", lambda event: self.start_game())
         self.canvas.focus_set()
 
+        # Mesures affichées en haut à gauche lorsque l'instrumentation est active (voir utils.instrumentation)
+        if instrumentation.enabled:
+            self.overlay_label = Label(self, font=("Courier", 12), bg="black", fg="white")
+            self.overlay_label.place(x=10, y=10)
+            self.overlay_frames = 0
+            self.overlay_time = scheduler.clock()
+            scheduler.subscribe(self.update_overlay, OVERLAY_INTERVAL, self.overlay_label)
+
+    @instrumentation.timed("load_level")
     def load_level(self, level_path):
         """
-        Méthode permettant de lire le fichier .txt du niveau et d'instancier les différentes tiles.
-        :param level_path: Contient le chemin vers le fichier texte qui décrit la structure du niveau.
+        Méthode permettant de charger le niveau et de créer la partie correspondante.
+        Réutilise la lecture faite lors de la validation du niveau dans le menu si elle est encore en mémoire.
+        Pour un replay, la partie utilise une horloge simulée avancée par les entrées relues.
+        Sur un grand niveau, les minotaures sont calculés en arrière-plan : la partie est en mode différé.
+        :param level_path: Contient le chemin vers le fichier qui décrit la structure du niveau.
         :return: NONE
         """
-        with open(level_path, "r") as file:
-            lines = file.readlines()
+        parsed = load_parsed_level(level_path)
+        # Le moteur prépare ses données (table de routage des petits niveaux) dès le chargement, dans un thread
+        path_finder = get_path_finder(PATHFINDING_ENGINE, parsed.grid, background=self.background_routes)
+        if self.replay is not None:
+            # Les pas dus des minotaures d'une partie en mode différé sont calculés lors de leur entrée (apply_input)
+            self.engine = GameEngine.from_level_file(level_path, self.replay.timer_limit, path_finder=path_finder,
+                                                     clock=SimulatedClock(), defer_minotaurs=self.replay.deferred)
+            self.replay_inputs = self.replay.iter_inputs()
+            self.next_input = next(self.replay_inputs, None)
+            return
 
-        for y, line in enumerate(lines):
-            row = []
-            for x, char in enumerate(line.strip()):
-                tile_class = self.tile_classes.get(char, Floor)
-                tile = tile_class()
-                # Cas où la tile correspond au joueur ou au minotaur afin d'enregistrer leur position.
-                if isinstance(tile, Player):
-                    tile.move_to(x, y)
-                    self.player = tile
-                elif isinstance(tile, Minotaur):
-                    tile.move_to(x, y)
-                    self.minotaur = tile
-                row.append(tile)
-            self.tiles.append(row)
+        deferred = (self.background_minotaurs and bool(parsed.get_minotaurs())
+                    and walkable_cells(parsed.grid) >= ASYNC_MIN_CELLS)
+        self.engine = GameEngine.from_level_file(level_path, self.timer_limit.get(), path_finder=path_finder,
+                                                 defer_minotaurs=deferred)
+        if deferred:
+            self.minotaur_worker = MinotaurWorker(self.engine.grid, PATHFINDING_ENGINE)
+        level_name = os.path.splitext(os.path.basename(level_path))[0]
+        self.recorder = Replay(level_name, level_hash(parsed), self.engine.timer_limit, deferred=deferred)
 
+    @instrumentation.timed("render_level")
     def render_level(self):
         """
         Méthode permettant d'afficher les différentes tiles dans le canvas.
+        Seuls les chunks visibles (plus une marge) ont des items dans le canvas ; ils sont créés et supprimés
+        au fil des déplacements de la caméra, qui suit le joueur (voir follow_player et update_viewport).
         :return: NONE
         """
+        grid = self.engine.grid
         self.canvas.delete("all")
-        for y, row in enumerate(self.tiles):
-            for x, tile in enumerate(row):
-                tile.render(self.canvas, x * TILE_SIZE, y * TILE_SIZE)
+        self.chunks.clear()
+        self.dirty_cells.clear()
+        self.canvas.configure(scrollregion=(0, 0, grid.width * TILE_SIZE, grid.height * TILE_SIZE))
+        if self.render_mode == "bitmap":
+            self.actor_items = {
+                "player": self.player_sprite.render(self.canvas, 0, 0, tags="actor"),
+                "minotaurs": [self.minotaur_sprite.render(self.canvas, 0, 0, tags="actor")
+                              for _ in self.engine.minotaurs]
+            }
+            self.update_actors()
+        self.follow_player()
+        if instrumentation.enabled:
+            instrumentation.observe("render_level.items", len(self.canvas.find_all()))
+
+    def viewport_size(self):
+        """
+        Méthode retournant la taille (en pixels) de la zone visible du canvas.
+        Tant que le canvas n'est pas affiché, la taille de l'écran est utilisée (la fenêtre est en plein écran).
+        :return: Tuple (largeur, hauteur).
+        """
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.winfo_screenwidth(), self.winfo_screenheight()
+        return width, height
+
+    def follow_player(self):
+        """
+        Méthode centrant la caméra sur le joueur, sans sortir des limites de la carte.
+        :return: NONE
+        """
+        grid = self.engine.grid
+        view_width, view_height = self.viewport_size()
+        map_width = grid.width * TILE_SIZE
+        map_height = grid.height * TILE_SIZE
+        player_x, player_y = self.engine.player
+
+        camera_x = min(max(0, player_x * TILE_SIZE + TILE_SIZE // 2 - view_width // 2), max(0, map_width - view_width))
+        camera_y = min(max(0, player_y * TILE_SIZE + TILE_SIZE // 2 - view_height // 2), max(0, map_height - view_height))
+        if (camera_x, camera_y) != (self.camera_x, self.camera_y):
+            self.camera_x, self.camera_y = camera_x, camera_y
+            self.canvas.xview_moveto(camera_x / map_width)
+            self.canvas.yview_moveto(camera_y / map_height)
+        self.update_viewport()
+
+    def update_viewport(self):
+        """
+        Méthode créant les chunks entrés dans la zone visible (plus la marge) et supprimant ceux qui en sont sortis.
+        Le coût dépend de la taille de l'écran et non de celle de la carte.
+        :return: NONE
+        """
+        grid = self.engine.grid
+        view_width, view_height = self.viewport_size()
+        chunk_pixels = CHUNK_SIZE * TILE_SIZE
+        last_chunk_x = (grid.width - 1) // CHUNK_SIZE
+        last_chunk_y = (grid.height - 1) // CHUNK_SIZE
+
+        first_x = max(0, self.camera_x // chunk_pixels - VIEWPORT_MARGIN)
+        last_x = min(last_chunk_x, (self.camera_x + view_width) // chunk_pixels + VIEWPORT_MARGIN)
+        first_y = max(0, self.camera_y // chunk_pixels - VIEWPORT_MARGIN)
+        last_y = min(last_chunk_y, (self.camera_y + view_height) // chunk_pixels + VIEWPORT_MARGIN)
+
+        for chunk in [c for c in self.chunks if not (first_x <= c[0] <= last_x and first_y <= c[1] <= last_y)]:
+            self.canvas.delete(f"chunk_{chunk[0]}_{chunk[1]}")
+            del self.chunks[chunk]
+
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                if (chunk_x, chunk_y) not in self.chunks:
+                    self.materialize_chunk(chunk_x, chunk_y)
+
+    def materialize_chunk(self, chunk_x, chunk_y):
+        """
+        Méthode créant les items du canvas des cases d'un chunk.
+        :param chunk_x: Position du chunk sur l'axe des X (en chunks).
+        :param chunk_y: Position du chunk sur l'axe des Y (en chunks).
+        :return: NONE
+        """
+        grid = self.engine.grid
+        tag = f"chunk_{chunk_x}_{chunk_y}"
+        if self.render_mode == "bitmap":
+            image = self.chunk_image(chunk_x, chunk_y)
+            item = self.canvas.create_image(chunk_x * CHUNK_SIZE * TILE_SIZE, chunk_y * CHUNK_SIZE * TILE_SIZE,
+                                            image=image, anchor="nw", tags=tag)
+            self.canvas.tag_lower(item)
+            # L'image est gardée avec l'item : elle ne doit pas être libérée tant que le chunk est affiché.
+            self.chunks[(chunk_x, chunk_y)] = [item, image]
+            return
+
+        xs = range(chunk_x * CHUNK_SIZE, min(grid.width, (chunk_x + 1) * CHUNK_SIZE))
+        ys = range(chunk_y * CHUNK_SIZE, min(grid.height, (chunk_y + 1) * CHUNK_SIZE))
+        self.chunks[(chunk_x, chunk_y)] = [
+            self.cell_tile(x, y).render(self.canvas, x * TILE_SIZE, y * TILE_SIZE, tags=tag)
+            for y in ys
+            for x in xs
+        ]
+
+    def chunk_image(self, chunk_x, chunk_y):
+        """
+        Méthode retournant l'image du terrain d'un chunk, composée une seule fois avec Pillow puis gardée en cache.
+        Le terrain ne change pas pendant la partie : la sortie occupée par le joueur est dessinée par l'item du joueur.
+        :param chunk_x: Position du chunk sur l'axe des X (en chunks).
+        :param chunk_y: Position du chunk sur l'axe des Y (en chunks).
+        :return: L'image (PhotoImage) du chunk.
+        """
+        key = (chunk_x, chunk_y)
+        image = self.chunk_images.get(key)
+        if image is not None:
+            self.chunk_images.move_to_end(key)
+            return image
+
+        grid = self.engine.grid
+        x0, y0 = chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE
+        x1, y1 = min(grid.width, x0 + CHUNK_SIZE), min(grid.height, y0 + CHUNK_SIZE)
+        bitmap = Image.new("RGBA", ((x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE))
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                code = grid.get(x, y)
+                tile = self.tile_sprites[EXIT if code == EXIT_WITH_PLAYER else code]
+                bitmap.alpha_composite(tile.pil_image, ((x - x0) * TILE_SIZE, (y - y0) * TILE_SIZE))
+
+        image = ImageTk.PhotoImage(bitmap)
+        self.chunk_images[key] = image
+        if len(self.chunk_images) > CHUNK_IMAGE_CACHE_SIZE:
+            self.chunk_images.popitem(last=False)
+        return image
+
+    def update_actors(self):
+        """
+        Méthode déplaçant les items du joueur et des minotaures (mode "bitmap").
+        :return: NONE
+        """
+        player_x, player_y = self.engine.player
+        player_sprite = self.player_sprite
+        if self.engine.grid.get(player_x, player_y) == EXIT_WITH_PLAYER:
+            player_sprite = self.tile_sprites[EXIT_WITH_PLAYER]
+        self.canvas.coords(self.actor_items["player"], player_x * TILE_SIZE, player_y * TILE_SIZE)
+        player_sprite.update(self.canvas, self.actor_items["player"])
+
+        for item, (minotaur_x, minotaur_y) in zip(self.actor_items["minotaurs"], self.engine.minotaurs):
+            self.canvas.coords(item, minotaur_x * TILE_SIZE, minotaur_y * TILE_SIZE)
+
+    def cell_tile(self, x, y):
+        """
+        Méthode retournant la tuile à afficher pour une case : un minotaure ou le joueur s'ils s'y trouvent,
+        sinon la tuile correspondant au terrain.
+        :param x: Position de la case sur l'axe des X.
+        :param y: Position de la case sur l'axe des Y.
+        :return: La tuile à afficher.
+        """
+        code = self.engine.grid.get(x, y)
+        if (x, y) in self.engine.minotaur_cells:
+            return self.minotaur_sprite
+        if code != EXIT_WITH_PLAYER and (x, y) == self.engine.player:
+            return self.player_sprite
+        return self.tile_sprites[code]
+
+    def mark_dirty(self, x, y):
+        """
+        Méthode permettant de signaler qu'une case a changé et doit être redessinée.
+        :param x: Position de la case sur l'axe des X.
+        :param y: Position de la case sur l'axe des Y.
+        :return: NONE
+        """
+        self.dirty_cells.add(self.engine.grid.index(x, y))
+
+    def flush_render(self):
+        """
+        Méthode permettant de mettre à jour dans le canvas uniquement les cases modifiées depuis le dernier flush.
+        Les cases des chunks non affichés sont ignorées : elles seront dessinées à jour lors de leur création.
+        En mode "bitmap", seuls les items du joueur et des minotaures sont déplacés.
+        :return: NONE
+        """
+        if self.render_mode == "bitmap":
+            self.dirty_cells.clear()
+            self.update_actors()
+            return
+
+        width = self.engine.grid.width
+        for idx in self.dirty_cells:
+            x, y = idx % width, idx // width
+            items = self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+            if items is None:
+                continue
+            chunk_width = min(CHUNK_SIZE, width - x // CHUNK_SIZE * CHUNK_SIZE)
+            item = items[(y % CHUNK_SIZE) * chunk_width + x % CHUNK_SIZE]
+            self.cell_tile(x, y).update(self.canvas, item)
+        self.dirty_cells.clear()
 
     def start_game(self):
         """
@@ -104,37 +368,184 @@ class GameWindow(Toplevel):
         :return: NONE
         """
         self.start_button.destroy()
-        self.bind("<Up>", lambda e: self.move_player(0, -1))
-        self.bind("<Down>", lambda e: self.move_player(0, 1))
-        self.bind("<Left>", lambda e: self.move_player(-1, 0))
-        self.bind("<Right>", lambda e: self.move_player(1, 0))
         self.focus_set()
+        self.engine.start()
+        # Le chronomètre continue même si la fenêtre est cachée : la fin de partie ne doit pas être retardée.
+        self.timer_subscription = scheduler.subscribe(self.update_timer, TIMER_INTERVAL, self.timer_label,
+                                                      pause_hidden=False)
+
+        if self.replay is not None:
+            self.replay_start = scheduler.clock()
+            self.input_subscription = scheduler.subscribe(self.process_replay, FRAME_INTERVAL, self.canvas,
+                                                          pause_hidden=False)
+            return
+
+        self.bind("<Up>", lambda e: self.queue_move(0, -1))
+        self.bind("<Down>", lambda e: self.queue_move(0, 1))
+        self.bind("<Left>", lambda e: self.queue_move(-1, 0))
+        self.bind("<Right>", lambda e: self.queue_move(1, 0))
+        # Les images sautées ne sont pas rattrapées : les déplacements restent dans la file
+        self.input_subscription = scheduler.subscribe(lambda elapsed: self.process_input(), FRAME_INTERVAL,
+                                                      self.canvas, pause_hidden=False)
+
+    def queue_move(self, dx, dy):
+        """
+        Méthode appelée par les touches : le déplacement est mis en file et appliqué à la prochaine image.
+        Les touches reçues lorsque la file est pleine sont ignorées, pour que le jeu ne prenne pas de retard
+        sur le clavier pendant une répétition de touche.
+        :param dx: Déplacement en direction de l'axe des X
+        :param dy: Déplacement en direction de l'axe des Y.
+        :return: NONE
+        """
+        if len(self.input_queue) < INPUT_QUEUE_SIZE:
+            self.input_queue.append((dx, dy))
+
+    def process_input(self):
+        """
+        Méthode appelée à chaque image par le scheduler : applique le déplacement des minotaures calculé en
+        arrière-plan s'il est arrivé, puis au plus max_moves_per_frame déplacements en attente, et met à jour
+        l'affichage une seule fois.
+        :return: NONE
+        """
+        if instrumentation.enabled:
+            instrumentation.count("frames")
+        changed = self.minotaur_worker is not None and self.receive_minotaurs()
+        if not self.input_queue and not changed:
+            return
+        for _ in range(min(self.max_moves_per_frame, len(self.input_queue))):
+            self.apply_move(*self.input_queue.popleft())
+            if self.engine.is_over():
+                self.input_queue.clear()
+                break
+        if self.engine.defer_minotaurs:
+            self.request_minotaurs()
+        self.follow_player()
+        self.flush_render()
 
-        self.start_time = time.time()
-        self.update_timer()
+        if self.engine.is_over():
+            self.end_game(is_lost=self.engine.status == CAUGHT, is_timeout=self.engine.status == TIMEOUT)
 
-    def update_timer(self):
+    def receive_minotaurs(self):
+        """
+        Méthode appliquant les positions des minotaures calculées en arrière-plan, si le calcul demandé par
+        request_minotaurs est terminé. Si le calcul a échoué, le worker est arrêté et les positions sont calculées
+        ici (ainsi que pour le reste de la partie, voir request_minotaurs).
+        :return: True si les minotaures ont été déplacés.
+        """
+        result = self.minotaur_worker.poll()
+        if result is None:
+            return False
+        request, positions = result
+        engine = self.engine
+        # Les calculs devenus inutiles sont annulés par request_minotaurs : le résultat correspond à la partie
+        if engine.status != PLAYING or request != (engine.player, tuple(engine.minotaurs), engine.pending_steps):
+            return False
+        if positions is None:
+            self.stop_minotaur_worker()
+        self.apply_pending_minotaurs(positions)
+        return True
+
+    def request_minotaurs(self):
         """
-        Méthode permettant de mettre à jour le timer (dont l'affichage) toutes les 50 ms.
-        Si le timer est écoulé, on termine la partie.
+        Méthode demandant au worker le déplacement des minotaures si des pas sont dus. Un calcul en cours pour
+        une autre position du joueur (ou moins de pas) est annulé et remplacé.
+        Sans worker (arrêté après une erreur), les pas dus sont appliqués immédiatement.
         :return: NONE
         """
-        if not self.timer_label.winfo_exists():
+        engine = self.engine
+        if not engine.pending_steps or engine.is_over():
             return
+        worker = self.minotaur_worker
+        if worker is not None and worker.submit(engine.player, engine.minotaurs, engine.pending_steps):
+            return
+        self.stop_minotaur_worker()
+        self.apply_pending_minotaurs()
 
-        elapsed = time.time() - self.start_time
-        remaining = max(0, self.timer_limit.get() - elapsed)
+    def apply_pending_minotaurs(self, positions=None):
+        """
+        Méthode appliquant les pas dus des minotaures (voir GameEngine.move_pending_minotaurs) et l'enregistrant
+        dans le replay.
+        :param positions: Positions calculées par le worker, None pour les calculer maintenant.
+        :return: NONE
+        """
+        engine = self.engine
+        elapsed = engine.elapsed()
+        for x, y in engine.move_pending_minotaurs(positions):
+            self.mark_dirty(x, y)
+        if engine.status != TIMEOUT:
+            self.recorder.record_minotaurs(elapsed)
+
+    def process_replay(self, elapsed=1):
+        """
+        Méthode appelée à chaque image par le scheduler pendant un replay : applique les entrées dont le temps
+        (multiplié par la vitesse de relecture) est atteint, ou max_moves_per_frame entrées en vitesse maximale,
+        puis met à jour l'affichage une seule fois.
+        :param elapsed: Nombre d'images écoulées depuis l'appel précédent (voir utils.scheduler).
+        :return: NONE
+        """
+        if instrumentation.enabled:
+            instrumentation.count("frames")
+        clock = self.engine.clock
+        if self.replay_speed is None:
+            target = float("inf")
+            budget = self.max_moves_per_frame
+        else:
+            target = (scheduler.clock() - self.replay_start) * self.replay_speed
+            budget = None
+
+        applied = 0
+        while self.next_input is not None and self.next_input[0] <= target and applied != budget:
+            clock.now, dx, dy = self.next_input
+            self.next_input = next(self.replay_inputs, None)
+            self.apply_move(dx, dy)
+            applied += 1
+            if self.engine.is_over():
+                break
 
-        minutes = int(remaining // 60)
-        seconds = int(remaining % 60)
-        milliseconds = int((remaining - int(remaining)) * 100)
+        if self.next_input is None:
+            # Plus d'entrées : le temps continue jusqu'à la fin du chronomètre
+            clock.now = max(clock.now, self.engine.timer_limit if self.replay_speed is None else target)
+        elif self.replay_speed is not None:
+            clock.now = max(clock.now, target)
 
-        self.timer_label.config(text=f"{minutes:02}:{seconds:02}.{milliseconds:02}")
+        if applied:
+            self.follow_player()
+            self.flush_render()
+        if self.engine.is_over():
+            self.end_game(is_lost=self.engine.status == CAUGHT, is_timeout=self.engine.status == TIMEOUT)
 
-        if remaining <= 0:
+    def update_overlay(self, elapsed=1):
+        """
+        Méthode affichant les images par seconde et le coût du dernier calcul de chemin du minotaure.
+        :param elapsed: Nombre d'échéances écoulées depuis l'appel précédent (voir utils.scheduler).
+        :return: NONE
+        """
+        now = scheduler.clock()
+        frames = instrumentation.stats.counters.get("frames", 0)
+        fps = (frames - self.overlay_frames) / max(now - self.overlay_time, 1e-6)
+        self.overlay_frames, self.overlay_time = frames, now
+
+        text = f"FPS {fps:3.0f}"
+        path_time = instrumentation.stats.last("find_path.ms")
+        if path_time is not None:
+            text += f" | find_path {path_time:.2f} ms, {instrumentation.stats.last('find_path.nodes')} nodes"
+        self.overlay_label.config(text=text)
+
+    @instrumentation.timed("timer_tick")
+    def update_timer(self, elapsed=1):
+        """
+        Méthode permettant de mettre à jour le timer (appelée par le scheduler toutes les TIMER_INTERVAL secondes).
+        Le label n'est modifié que si le texte affiché change. Si le timer est écoulé, on termine la partie.
+        :param elapsed: Nombre d'échéances écoulées depuis l'appel précédent (voir utils.scheduler).
+        :return: NONE
+        """
+        text = format_time(self.engine.remaining())
+        if text != self.timer_text:
+            self.timer_text = text
+            self.timer_label.config(text=text)
+
+        if self.engine.check_timeout():
             self.end_game(is_timeout=True)
-        else:
-            self.after(50, self.update_timer)
 
     def end_game(self, is_lost=False, is_timeout=False):
         """
@@ -144,6 +555,17 @@ class GameWindow(Toplevel):
         :param is_timeout: True : si le timer est écoulé.
         :return: NONE
         """
+        if self.timer_subscription is not None:
+            self.timer_subscription.cancel()
+            self.input_subscription.cancel()
+        self.stop_minotaur_worker()
+        if self.recorder is not None:
+            self.recorder.finish(self.engine)
+            try:
+                self.recorder.save(replay_path(self.recorder.level_name))
+            except OSError:
+                # Répertoire des replays non accessible en écriture : la partie se termine sans replay
+                pass
         self.timer_label.destroy()
         self.unbind("<Up>")
         self.unbind("<Down>")
@@ -155,83 +577,37 @@ class GameWindow(Toplevel):
         elif is_timeout:
             message = "You lost, time's up..."
         else:
-            elapsed = time.time() - self.start_time
-            minutes = int(elapsed // 60)
-            seconds = int(elapsed % 60)
-            milliseconds = int((elapsed - int(elapsed)) * 100)
-            message = f"You won in {minutes:02}:{seconds:02}.{milliseconds:02}"
+            message = f"You won in {format_time(self.engine.elapsed())}"
         end_label = Label(self, text=message, font=("Arial", 26), bg="green", fg="white")
         end_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # Ferme la fenêtre GameWindow après 3 secondes
         self.after(3000, func=self.destroy)
 
-    def move_player(self, dx, dy):
-        """
-        Méthode utilisée pour déplacer le joueur sur la carte.
-        Comprend les vérifications :
-            * Limites de la carte
-            * Tile peut être marché par le joueur
-                - Si oui, on déplace et vérifie que si la destination est la tile correspond à la sortie
-                - Sinon, on déplace le minotaure
-        :param dx: Déplacement en direction de l'axe des X
-        :param dy: Déplacement en direction de l'axe des Y.
-        :return: NONE
-        """
-        if not self.player:
-            return
-
-        old_x, old_y = self.player.x, self.player.y
-        new_x = old_x + dx
-        new_y = old_y + dy
-
-        # Vérification que le joueur reste dans la carte.
-        if not (0 <= new_y < len(self.tiles) and 0 <= new_x < len(self.tiles[0])):
-            return
+    def stop_minotaur_worker(self):
+        if self.minotaur_worker is not None:
+            self.minotaur_worker.shutdown()
+            self.minotaur_worker = None
 
-        target_tile = self.tiles[new_y][new_x]
-
-        if target_tile.is_walkable():
-            # Ancienne tile du joueur devient un Floor
-            self.tiles[old_y][old_x] = Floor()
-
-            # Cas où le joueur atteint la sortie
-            if target_tile.is_exit():
-                self.tiles[new_y][new_x] = ExitWithPlayer()
-                self.end_game()
-            # Simple déplacement
-            else:
-                self.player.move_to(new_x, new_y)
-                self.tiles[new_y][new_x] = self.player
-            self.render_level()
-        # Si la tile n'est pas franchissable par le joueur
-        else:
-            self.move_minotaur(steps=5)
+    def destroy(self):
+        self.stop_minotaur_worker()
+        super().destroy()
 
-    def move_minotaur(self, steps=5):
+    def apply_move(self, dx, dy):
         """
-        Méthode permettant de déplacer le minotaure vers le joueur en utilisant du pathfinding.
-        :param steps: Nombre de cases dont le minotaure va avancer par coup.
+        Méthode appliquant un déplacement du joueur à la partie et notant les cases à redessiner,
+        sans mettre à jour l'affichage (voir flush_render). Le déplacement est enregistré dans le replay,
+        sauf s'il est refusé parce que la partie est déjà terminée (plusieurs déplacements sont appliqués par
+        image) ou que le temps est écoulé (le replay se termine alors par le chronomètre).
+        Pendant un replay, l'entrée peut aussi être l'application des pas dus des minotaures (voir apply_input).
+        :param dx: Déplacement en direction de l'axe des X
+        :param dy: Déplacement en direction de l'axe des Y.
         :return: NONE
         """
-        if not self.minotaur or not self.player: return
-
-        start = (self.minotaur.x, self.minotaur.y)
-        goal = (self.player.x, self.player.y)
-        path = find_path(self.tiles, start, goal)
-
-        if not path:
-            print("Level ERROR : Minotaur cannot reach the player!!")
-            return
-
-        for (new_x, new_y) in path[:steps]:
-            old_x, old_y = self.minotaur.x, self.minotaur.y
-
-            self.tiles[old_y][old_x] = Floor()
-            self.minotaur.move_to(new_x, new_y)
-            self.tiles[new_y][new_x] = self.minotaur
-
-            if (new_x, new_y) == (self.player.x, self.player.y):
-                self.end_game(is_lost=True)
-                break
-        self.render_level()
\ No newline at end of file
+        engine = self.engine
+        playing = engine.status == PLAYING
+        elapsed = engine.elapsed()
+        for x, y in apply_input(engine, dx, dy):
+            self.mark_dirty(x, y)
+        if self.recorder is not None and playing and engine.status != TIMEOUT:
+            self.recorder.record(elapsed, dx, dy)
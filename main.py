@@ -1,11 +1,13 @@
-from tkinter import Tk, Frame, PhotoImage, PanedWindow, Label, Toplevel, Button, Spinbox, IntVar
+import time
+from tkinter import Tk, Frame, PanedWindow, Label, Toplevel, Button, Spinbox, IntVar
 from tkinter.constants import HORIZONTAL
 
-from game_play import GameWindow
 from ressources.rules import RULES
-from service.load_level import get_levels
-from utils.GifClass import AnimatedGIF
-from utils.image_button import ImageButton
+from utils import instrumentation
+
+LEVELS_DIR = "./ressources/levels"
+REPLAY_SPEEDS = {"1": 1.0, "10": 10.0, "max": None}  # Vitesses de relecture proposées (None : maximale)
+LEVELS_BATCH_TIME = 0.01  # Temps maximal (s) passé à charger des niveaux entre deux passages de la boucle Tk
 
 
 def play_level(root_window, level, max_timer):
@@ -17,7 +19,31 @@ def play_level(root_window, level, max_timer):
     :param max_timer: temps maximal pour la partie
     :return: NONE
     """
-    GameWindow(root=root_window, level_path=level.get_txt_path(), timer_limit=max_timer)
+    # Import au premier niveau lancé : le menu s'affiche sans charger le jeu (tuiles, moteur, pathfinding)
+    from game_play import GameWindow
+
+    GameWindow(root=root_window, level_path=level.get_level_path(), timer_limit=max_timer)
+
+def play_replay(root_window, path, speed):
+    """
+    Procédure ouvrant la fenêtre de jeu pour relire un replay enregistré ; l'application se ferme avec elle.
+    :param root_window: Fenêtre mère (cachée pendant la relecture).
+    :param path: Chemin du fichier .rpl.
+    :param speed: Vitesse de relecture (voir REPLAY_SPEEDS).
+    :return: NONE
+    """
+    from game_play import GameWindow
+    from service.replay import Replay, find_level
+
+    replay = Replay.load(path)
+    level_path = find_level(replay, LEVELS_DIR)
+    if level_path is None:
+        raise SystemExit(f"Level {replay.level_name} not found or modified since the replay was recorded")
+
+    root_window.withdraw()
+    window = GameWindow(root=root_window, level_path=level_path, timer_limit=None, replay=replay,
+                        replay_speed=speed)
+    window.bind("<Destroy>", lambda event: root_window.destroy() if event.widget is window else None)
 
 def show_rules(root_window):
     """
@@ -25,9 +51,11 @@ def show_rules(root_window):
     :param root_window: Fenêtre parente du Modal.
     :return: NONE
     """
+    from utils.assets import assets
+
     modal = Toplevel(root_window)
     modal.title("Minotaur - rules")
-    modal.iconphoto(False, PhotoImage(file="./ressources/images/game_menu/minotaur.png"))
+    modal.iconphoto(False, assets.get_photo("icon"))
 
     modal_width = (root_window.winfo_width() * 2) // 3
     modal_height = (root_window.winfo_height() * 2) // 3
@@ -57,17 +85,20 @@ class GameMenu(Frame):
         self._root = root
         self._root.title("Game Menu")
         self.max_timer = IntVar(value=20)
+        self.levels_loaded = False
         self.manage_window_size()
         self.manage_window_info()
         self.manage_paned()
+        # Le reste du menu (icône, GIF, liste des niveaux) est construit après le premier affichage
+        self.after_idle(lambda: self.after(0, self.finish_startup))
 
     def manage_window_info(self):
         """
-        Méthode utilisée pour configurer les informations générales de la fenêtre, comme le titre et l'icône.
+        Méthode utilisée pour configurer les informations générales de la fenêtre, comme le titre
+        (l'icône est ajoutée par finish_startup).
         :return: NONE
         """
         self._root.title("Minotaur game")
-        self._root.iconphoto(False, PhotoImage(file="./ressources/images/game_menu/minotaur.png"))
 
     def manage_window_size(self):
         """
@@ -107,9 +138,7 @@ class GameMenu(Frame):
         # Label du titre du jeu
         p1_label = Label(title_frame, text="The Minotaur", bg="green", fg="black", font=("Arial", 40))
         p1_label.grid(row=0, column=0, padx=20, pady=10, sticky="e")
-        # Animation GIF du minotaure
-        gif_widget = AnimatedGIF(title_frame, "./ressources/images/game_menu/minotaur.gif")
-        gif_widget.grid(row=0, column=1, padx=20, pady=10, sticky="w")
+        self.title_frame = title_frame
 
         # Sous-cadre pour centrer les deux widgets côte à côte
         controls_frame = Frame(title_frame, bg="green")
@@ -129,40 +158,83 @@ class GameMenu(Frame):
         # Section 2 - liste des niveaux
         self._root.paned_levels = PanedWindow(self._root, orient=HORIZONTAL, height=two_third_height, bd=0)
         self._root.paned_levels.pack(fill="both", expand=True)
+
+    def finish_startup(self):
+        """
+        Méthode construisant les parties coûteuses du menu une fois la fenêtre affichée :
+        icône, GIF animé du minotaure et liste des niveaux.
+        :return: NONE
+        """
+        from utils.GifClass import AnimatedGIF
+        from utils.assets import assets
+
+        # Les sprites sont décodés en arrière-plan pendant la construction du reste du menu
+        assets.preload()
+        self._root.iconphoto(False, assets.get_photo("icon"))
+
+        # Animation GIF du minotaure
+        gif_widget = AnimatedGIF(self.title_frame, "./ressources/images/game_menu/minotaur.gif")
+        gif_widget.grid(row=0, column=1, padx=20, pady=10, sticky="w")
+
         self.display_levels(self._root.paned_levels)
 
     def display_levels(self, paned_levels: PanedWindow):
         """
-        Méthode permettant d'afficher les niveaux sous forme d'image-bouton et de les organiser proprement.
+        Méthode permettant d'afficher les niveaux dans une liste défilante virtualisée (voir LevelBrowser).
+        Les niveaux sont ajoutés par lots pendant que la boucle Tk tourne : le menu s'affiche sans attendre
+        la fin de l'analyse du répertoire.
         :param paned_levels: PanedWindows qui va contenir la liste des niveaux
         :return: NONE
         """
-        levels = get_levels("./ressources/levels")
-        columns = 3  # Nombre de colonnes pour la grille de boutons
-        grid_frame = Frame(paned_levels, bg="green", padx=30, pady=30)
-        paned_levels.add(grid_frame)
-
-        for idx, level in enumerate(levels):
-            row = idx // columns
-            col = idx % columns
-            # Création du bouton image avec action au clic
-            img_button = ImageButton(
-                grid_frame,
-                image_path=level.get_png_path(),
-                label_text=level.get_name(),
-                command=lambda lvl=level: play_level(self._root, lvl, self.max_timer)
-            )
-            img_button.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            grid_frame.grid_columnconfigure(col, weight=1)
-            grid_frame.grid_rowconfigure(row, weight=1)
-
-        # Permet d'équilibrer la largeur des colonnes
-        for i in range(columns):
-            grid_frame.grid_columnconfigure(i, weight=1)
+        from service.load_level import iter_levels
+        from utils.level_browser import LevelBrowser
+
+        self.browser = LevelBrowser(paned_levels, command=lambda lvl: play_level(self._root, lvl, self.max_timer),
+                                    bg="green", padx=20, pady=20)
+        paned_levels.add(self.browser)
+        self.pending_levels = iter_levels(LEVELS_DIR)
+        self.after(0, self.load_levels_batch)
 
+    def load_levels_batch(self):
+        """
+        Méthode ajoutant à la liste les niveaux trouvés pendant au plus LEVELS_BATCH_TIME secondes,
+        puis se reprogrammant tant qu'il reste des niveaux.
+        :return: NONE
+        """
+        batch = []
+        start = time.perf_counter()
+        deadline = start + LEVELS_BATCH_TIME
+        for level in self.pending_levels:
+            batch.append(level)
+            if time.perf_counter() >= deadline:
+                self.after(1, self.load_levels_batch)
+                break
+        else:
+            self.levels_loaded = True
+        self.browser.add_levels(batch)
+        if instrumentation.enabled:
+            instrumentation.stats.record_time("get_levels.batch", time.perf_counter() - start)
+            instrumentation.count("get_levels.levels", len(batch))
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Minotaur game")
+    parser.add_argument("--replay", help="Fichier .rpl à relire au lieu d'ouvrir le menu")
+    parser.add_argument("--speed", choices=REPLAY_SPEEDS, default="1", help="Vitesse de relecture")
+    parser.add_argument("--profile", nargs="?", const=instrumentation.DEFAULT_OUTPUT, default=None,
+                        help="Activer l'instrumentation et écrire les mesures dans ce fichier JSON à la fermeture")
+    parser.add_argument("--cprofile", action="store_true", help="Avec --profile : capture cProfile (.prof)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Avec --profile : suivi des allocations")
+    args = parser.parse_args()
+    if args.profile:
+        # Avant l'import (différé) des modules instrumentés
+        instrumentation.enable(args.profile, cprofile=args.cprofile, trace_memory=args.tracemalloc)
+
     # Lancement de l'application
     game_window = Tk()
-    game = GameMenu(game_window)
-    game.mainloop()
\ No newline at end of file
+    if args.replay:
+        play_replay(game_window, args.replay, REPLAY_SPEEDS[args.speed])
+    else:
+        game = GameMenu(game_window)
+    game_window.mainloop()
\ No newline at end of file
@@ -5,7 +5,8 @@ Le joueur doit sortir du labyrinthe aussi vite que possible mais aussi lentement
 Pour cela, il doit trouver la sortie en moins de 20 secondes (temps par défaut) et faire un minimum d'erreurs.
 Est considéré comme erreur, lorsque le joueur essaie de marcher en direction d'un buisson.
 A chaque erreur, le Minotaure avance de 5 cases en direction du joueur.
-Si ce dernier rattrape le joueur, alors il a perdu.
+Certains niveaux contiennent plusieurs Minotaures : ils avancent tous à chaque erreur.
+Si l'un d'eux rattrape le joueur, alors il a perdu.
 
 Conditions de victoire :
     - Le joueur a trouvé la sortie dans le temps imparti sans se faire rattraper par le Minotaure.
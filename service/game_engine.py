@@ -0,0 +1,284 @@
+import time
+
+from domain.grid import EXIT_WITH_PLAYER, WALKABLE, IS_EXIT
+from service.level_parser import load_parsed_level
+from service.pathfinder import DistanceField, get_path_finder
+from utils import instrumentation
+
+READY = "ready"        # Partie chargée, pas encore commencée
+PLAYING = "playing"
+WON = "won"            # Le joueur a atteint la sortie
+CAUGHT = "caught"      # Le minotaure a rattrapé le joueur
+TIMEOUT = "timeout"    # Le temps imparti est écoulé
+
+MINOTAUR_STEPS = 5  # Nombre de cases dont chaque minotaure avance à chaque erreur du joueur
+# Moteur des parties sans affichage (replays, simulations) : pas de table de routage à calculer par partie.
+# La fenêtre de jeu utilise "route_cache" (voir game_play.PATHFINDING_ENGINE).
+DEFAULT_PATHFINDING_ENGINE = "distance_field"
+
+
+class SimulatedClock:
+    """
+    Horloge injectable dans GameEngine (simulations, replays) : le temps n'avance que lorsque `now` est modifié,
+    par exemple à chaque coup du joueur simulé.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class GameEngine:
+    """
+    Classe contenant l'état et les règles d'une partie, sans aucune dépendance à Tkinter ou Pillow.
+    Permet de jouer une partie dans une fenêtre (GameWindow) comme de la simuler sans affichage.
+    """
+
+    def __init__(self, grid, player, minotaurs, timer_limit, path_finder=None, clock=time.monotonic,
+                 defer_minotaurs=False, shared_grid=False):
+        """
+        Constructeur de la classe GameEngine.
+        :param grid: Grille du niveau (domain.grid.Grid), modifiée pendant la partie.
+        :param player: Position (x, y) initiale du joueur.
+        :param minotaurs: Liste des positions (x, y) initiales des minotaures (vide s'il n'y en a pas).
+        :param timer_limit: Temps maximal de la partie en secondes.
+        :param path_finder: Fonction de pathfinding, utilisée lorsqu'il n'y a qu'un minotaure
+                            (voir service.pathfinder.get_path_finder).
+        :param clock: Fonction retournant le temps courant en secondes (injectable pour les simulations).
+        :param defer_minotaurs: True pour que les erreurs du joueur ne déplacent pas les minotaures immédiatement :
+                                les pas dus sont cumulés (pending_steps) et appliqués plus tard par
+                                move_pending_minotaurs, par exemple avec des positions calculées en arrière-plan
+                                (voir service.minotaur_worker).
+        :param shared_grid: True si la grille ne doit pas être modifiée (niveau lu gardé en cache, mmap d'un .lvl) :
+                            elle n'est copiée qu'à sa première modification.
+        """
+        self.grid = grid
+        self.grid_shared = shared_grid
+        self.player = player
+        self.minotaurs = list(minotaurs)
+        self.minotaur_cells = set(self.minotaurs)  # Cases occupées par les minotaures
+        self.timer_limit = timer_limit
+        self.find_path = path_finder or get_path_finder(DEFAULT_PATHFINDING_ENGINE)
+        self.field = DistanceField()  # Champ de distances au joueur partagé par les minotaures (s'il y en a plusieurs)
+        self.clock = clock
+        self.status = READY
+        self.start_time = None
+        self.end_time = None
+        self.moves = 0      # Déplacements réussis du joueur
+        self.blunders = 0   # Erreurs du joueur (tentatives de marcher dans un buisson)
+        self.defer_minotaurs = defer_minotaurs
+        self.pending_steps = 0  # Pas des minotaures dus aux erreurs du joueur et pas encore appliqués (mode différé)
+
+    @classmethod
+    def from_level_file(cls, level_path, timer_limit, path_finder=None, clock=time.monotonic, defer_minotaurs=False):
+        """
+        Méthode permettant de créer une partie à partir d'un fichier de niveau (.txt ou .lvl).
+        Les autres paramètres sont ceux du constructeur.
+        :param level_path: Chemin du fichier du niveau.
+        :return: La partie créée.
+        """
+        parsed = load_parsed_level(level_path)
+        # La grille lue est partagée (et en lecture seule pour un .lvl) : elle est copiée si la partie la modifie
+        return cls(parsed.grid, parsed.get_player(), parsed.get_minotaurs(), timer_limit, path_finder, clock,
+                   defer_minotaurs, shared_grid=True)
+
+    def start(self):
+        """
+        Méthode permettant de commencer la partie et de démarrer le chronomètre.
+        :return: NONE
+        """
+        self.status = PLAYING
+        self.start_time = self.clock()
+
+    def is_over(self):
+        return self.status not in (READY, PLAYING)
+
+    def elapsed(self):
+        """
+        Méthode retournant le temps écoulé depuis le début de la partie (figé une fois la partie terminée).
+        :return: Temps écoulé en secondes.
+        """
+        if self.start_time is None:
+            return 0.0
+        end = self.end_time if self.end_time is not None else self.clock()
+        return end - self.start_time
+
+    def remaining(self):
+        return max(0, self.timer_limit - self.elapsed())
+
+    def check_timeout(self):
+        """
+        Méthode terminant la partie si le temps imparti est écoulé.
+        :return: True si la partie vient de se terminer à cause du temps.
+        """
+        if self.status == PLAYING and self.remaining() <= 0:
+            self.finish(TIMEOUT)
+            return True
+        return False
+
+    def finish(self, status):
+        self.status = status
+        self.end_time = self.clock()
+
+    def move_player(self, dx, dy):
+        """
+        Méthode utilisée pour déplacer le joueur sur la carte.
+        Comprend les vérifications :
+            * Limites de la carte
+            * Case peut être marchée par le joueur (un minotaure bloque le passage comme un buisson)
+                - Si oui, on déplace et vérifie si la destination correspond à la sortie
+                - Sinon, on déplace les minotaures (ou on cumule leurs pas en mode différé)
+        :param dx: Déplacement en direction de l'axe des X
+        :param dy: Déplacement en direction de l'axe des Y.
+        :return: Liste des cases (x, y) dont l'affichage a changé.
+        """
+        if self.status != PLAYING or self.check_timeout():
+            return []
+
+        grid = self.grid
+        old_x, old_y = self.player
+        new_x = old_x + dx
+        new_y = old_y + dy
+
+        # Vérification que le joueur reste dans la carte.
+        if not (0 <= new_x < grid.width and 0 <= new_y < grid.height):
+            return []
+
+        idx = new_y * grid.width + new_x
+        new_position = (new_x, new_y)
+
+        if WALKABLE[grid.cells[idx]] and new_position not in self.minotaur_cells:
+            self.player = new_position
+            self.moves += 1
+
+            # Cas où le joueur atteint la sortie
+            if IS_EXIT[grid.cells[idx]]:
+                if self.grid_shared:
+                    grid = self.grid = grid.copy()
+                    self.grid_shared = False
+                grid.cells[idx] = EXIT_WITH_PLAYER
+                self.finish(WON)
+            return [(old_x, old_y), new_position]
+
+        # Si la case n'est pas franchissable par le joueur
+        self.blunders += 1
+        if self.defer_minotaurs:
+            self.pending_steps += MINOTAUR_STEPS
+            return []
+        return self.move_minotaur(MINOTAUR_STEPS)
+
+    def move_minotaur(self, steps=MINOTAUR_STEPS):
+        """
+        Méthode permettant de déplacer les minotaures vers le joueur en utilisant du pathfinding
+        (voir plan_minotaurs).
+        :param steps: Nombre de cases dont chaque minotaure va avancer par coup.
+        :return: Liste des cases (x, y) dont l'affichage a changé.
+        """
+        if not self.minotaurs or not self.player or steps <= 0:
+            return []
+        return self.place_minotaurs(self.plan_minotaurs(self.player, self.minotaurs, steps))
+
+    def move_pending_minotaurs(self, positions=None):
+        """
+        Méthode appliquant les pas des minotaures cumulés en mode différé (voir defer_minotaurs).
+        :param positions: Positions des minotaures calculées en arrière-plan par plan_minotaurs pour la position
+                          actuelle du joueur et pending_steps, None pour les calculer maintenant.
+        :return: Liste des cases (x, y) dont l'affichage a changé.
+        """
+        if self.status != PLAYING or self.check_timeout() or not self.pending_steps:
+            return []
+        if not self.minotaurs:
+            self.pending_steps = 0
+            return []
+        if positions is None:
+            positions = self.plan_minotaurs(self.player, self.minotaurs, self.pending_steps)
+        self.pending_steps = 0
+        return self.place_minotaurs(positions)
+
+    def place_minotaurs(self, positions):
+        """
+        Méthode plaçant les minotaures et terminant la partie si l'un d'eux a rattrapé le joueur.
+        :param positions: Nouvelles positions (x, y) des minotaures, dans l'ordre de self.minotaurs.
+        :return: Liste des cases (x, y) dont l'affichage a changé.
+        """
+        changed = []
+        for old_position, new_position in zip(self.minotaurs, positions):
+            if old_position != new_position:
+                changed.append(old_position)
+                changed.append(new_position)
+        self.minotaurs = list(positions)
+        self.minotaur_cells = set(self.minotaurs)
+        # Les minotaures n'avancent pas au-delà du joueur : un chemin se termine sur sa case.
+        if self.player in self.minotaur_cells:
+            self.finish(CAUGHT)
+        return changed
+
+    def plan_minotaurs(self, player, minotaurs, steps):
+        """
+        Méthode calculant les positions des minotaures après leur déplacement vers le joueur, sans modifier
+        la partie : elle peut être appelée dans un thread ou un processus de calcul (voir service.minotaur_worker).
+        Un minotaure seul suit le chemin calculé par le moteur de pathfinding de la partie ; plusieurs
+        minotaures descendent un même champ de distances (voir plan_shared).
+        :param player: Position (x, y) du joueur.
+        :param minotaurs: Positions (x, y) des minotaures.
+        :param steps: Nombre de cases dont chaque minotaure va avancer.
+        :return: Liste des nouvelles positions des minotaures.
+        """
+        if len(minotaurs) > 1:
+            return self.plan_shared(player, minotaurs, steps)
+
+        path = self.find_path(self.grid, minotaurs[0], player)
+        if not path:
+            print("Level ERROR : Minotaur cannot reach the player!!")
+            return list(minotaurs)
+        return [path[min(steps, len(path)) - 1]]
+
+    @instrumentation.timed("find_path")
+    def plan_shared(self, player, minotaurs, steps):
+        """
+        Méthode déplaçant plusieurs minotaures avec un seul BFS inversé depuis le joueur : le champ de distances
+        est étendu jusqu'au minotaure le plus lointain (O(carte) quel que soit le nombre de minotaures), puis
+        chaque minotaure descend le champ case par case (O(pas)).
+        Les minotaures les plus proches du joueur avancent en premier. Un minotaure ne peut pas entrer sur une
+        case occupée par un autre : il emprunte un autre plus court chemin s'il y en a un, sinon il attend.
+        Les minotaures suivants ne bougent plus dès que le joueur est rattrapé.
+        Mesuré comme un calcul de chemin (find_path, find_path.nodes : cases atteintes par le champ lors de l'appel).
+        :param player: Position (x, y) du joueur.
+        :param minotaurs: Positions (x, y) des minotaures.
+        :param steps: Nombre de cases dont chaque minotaure va avancer.
+        :return: Liste des nouvelles positions des minotaures.
+        """
+        width = self.grid.width
+        field = self.field
+        field.set_source(self.grid, player)
+        distances = field.distances
+        player_idx = player[1] * width + player[0]
+
+        indices = [y * width + x for x, y in minotaurs]
+        if instrumentation.enabled:
+            unreached = distances.count(-1)
+        reachable = [i for i, idx in enumerate(indices) if field.expand_until(idx)]
+        if instrumentation.enabled:
+            instrumentation.observe("find_path.nodes", unreached - distances.count(-1))
+        if len(reachable) != len(indices):
+            print("Level ERROR : Minotaur cannot reach the player!!")
+        reachable.sort(key=lambda i: distances[indices[i]])
+
+        occupied = set(indices)
+        for i in reachable:
+            idx = indices[i]
+            for _ in range(steps):
+                next_idx = field.next_step(idx, occupied)
+                if next_idx == -1:
+                    break
+                occupied.discard(idx)
+                occupied.add(next_idx)
+                idx = next_idx
+                if idx == player_idx:
+                    break
+            indices[i] = idx
+            if idx == player_idx:
+                break
+        return [(idx % width, idx // width) for idx in indices]
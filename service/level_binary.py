@@ -0,0 +1,117 @@
+import hashlib
+import mmap
+import struct
+
+from domain.grid import Grid
+
+BINARY_EXTENSION = ".lvl"
+MAGIC = b"MINO"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)  # La version 1 n'a qu'un minotaure : elle se lit comme une version 2 sans minotaure en plus
+
+# En-tête : magic, version, nombre de minotaures supplémentaires, largeur, hauteur, positions (x, y) du joueur,
+# du premier minotaure et de la sortie, distances précalculées joueur → sortie et minotaure le plus proche → joueur
+# (-1 si inconnues), empreinte SHA-1 des cases.
+# Les cases (un code de tuile par octet, voir domain.grid) suivent directement l'en-tête, puis les positions (x, y)
+# des minotaures supplémentaires.
+HEADER = struct.Struct("<4sHHIIIIIIIIii20s")
+HEADER_SIZE = HEADER.size
+POSITION = struct.Struct("<II")
+
+
+class BinaryHeader:
+    """
+    Classe représentant l'en-tête d'un niveau compilé.
+    """
+
+    def __init__(self, width, height, player, minotaurs, exit_position,
+                 exit_distance=-1, minotaur_distance=-1, cells_hash=b""):
+        self.width = width
+        self.height = height
+        self.player = player
+        self.minotaurs = minotaurs  # Positions de tous les minotaures (seul le premier est dans l'en-tête)
+        self.exit = exit_position
+        self.exit_distance = exit_distance
+        self.minotaur_distance = minotaur_distance
+        self.cells_hash = cells_hash
+
+    def pack(self) -> bytes:
+        return HEADER.pack(MAGIC, VERSION, len(self.minotaurs) - 1, self.width, self.height, *self.player,
+                           *self.minotaurs[0], *self.exit, self.exit_distance, self.minotaur_distance, self.cells_hash)
+
+    def pack_extra_minotaurs(self) -> bytes:
+        return b"".join(POSITION.pack(*position) for position in self.minotaurs[1:])
+
+    @classmethod
+    def unpack(cls, buffer, whole_file=True):
+        """
+        Méthode lisant l'en-tête au début du buffer.
+        :param buffer: Contenu du fichier (bytes ou mmap).
+        :param whole_file: True si le buffer contient tout le fichier : sa taille est vérifiée et les positions
+                           des minotaures supplémentaires sont lues. False si seul l'en-tête a été lu.
+        :return: L'en-tête, ou None si le buffer n'est pas un niveau compilé de version connue.
+        """
+        if len(buffer) < HEADER_SIZE:
+            return None
+        (magic, version, extra_minotaurs, width, height, player_x, player_y, minotaur_x, minotaur_y, exit_x, exit_y,
+         exit_distance, minotaur_distance, cells_hash) = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version not in SUPPORTED_VERSIONS:
+            return None
+        minotaurs = [(minotaur_x, minotaur_y)]
+        if whole_file:
+            extra_start = HEADER_SIZE + width * height
+            if len(buffer) < extra_start + extra_minotaurs * POSITION.size:
+                return None
+            minotaurs += POSITION.iter_unpack(buffer[extra_start:extra_start + extra_minotaurs * POSITION.size])
+        return cls(width, height, (player_x, player_y), minotaurs, (exit_x, exit_y),
+                   exit_distance, minotaur_distance, cells_hash)
+
+
+def write_level_binary(path, grid: Grid, player, minotaurs, exit_position, exit_distance=-1, minotaur_distance=-1):
+    """
+    Procédure écrivant un niveau au format compilé.
+    :param path: Chemin du fichier à écrire.
+    :param grid: Grille du niveau.
+    :param player: Position (x, y) du joueur.
+    :param minotaurs: Liste des positions (x, y) des minotaures (au moins un).
+    :param exit_position: Position (x, y) de la sortie.
+    :param exit_distance: Longueur du plus court chemin joueur → sortie (-1 si inconnue).
+    :param minotaur_distance: Longueur du plus court chemin minotaure le plus proche → joueur (-1 si inconnue).
+    :return: NONE
+    """
+    header = BinaryHeader(grid.width, grid.height, player, list(minotaurs), exit_position, exit_distance,
+                          minotaur_distance, hashlib.sha1(grid.cells).digest())
+    with open(path, "wb") as file:
+        file.write(header.pack())
+        file.write(grid.cells)
+        file.write(header.pack_extra_minotaurs())
+
+
+def read_header(path):
+    """
+    Fonction lisant uniquement l'en-tête d'un niveau compilé.
+    :param path: Chemin du fichier .lvl.
+    :return: L'en-tête, ou None si le fichier n'est pas un niveau compilé valide.
+    """
+    with open(path, "rb") as file:
+        return BinaryHeader.unpack(file.read(HEADER_SIZE), whole_file=False)
+
+
+def map_level_binary(path):
+    """
+    Fonction projetant un niveau compilé en mémoire. La grille retournée référence directement le mmap
+    (aucune copie, lecture seule) : le temps de chargement ne dépend pas de la taille du niveau.
+    :param path: Chemin du fichier .lvl.
+    :return: Tuple (en-tête, grille), ou (None, None) si le fichier n'est pas un niveau compilé valide.
+    """
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Fichier vide
+            return None, None
+    header = BinaryHeader.unpack(buffer)
+    if header is None:
+        buffer.close()
+        return None, None
+    return header, Grid.from_buffer(header.width, header.height, buffer, HEADER_SIZE)
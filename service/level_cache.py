@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+
+CACHE_FILE_NAME = ".levels_cache.json"
+CACHE_VERSION = 2  # À incrémenter à chaque changement du format des entrées (2 : empreinte de tout le fichier .lvl)
+
+MISSING = object()  # Valeur retournée par LevelCache.get lorsque le niveau doit être (ré)analysé
+
+
+def file_hash(path):
+    """
+    Fonction retournant l'empreinte SHA-1 du contenu d'un fichier.
+    Pour un niveau compilé, tout le fichier est utilisé : l'empreinte des cases de l'en-tête ne couvre pas
+    les positions du joueur, de la sortie et des minotaures.
+    :param path: Chemin du fichier.
+    :return: Empreinte hexadécimale.
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+class LevelCache:
+    """
+    Cache sur disque des résultats d'analyse des niveaux d'un répertoire.
+    Une entrée est identifiée par le nom du fichier et reste valable tant que la date de modification,
+    la taille et l'empreinte du contenu du fichier correspondent. Tout le cache est ignoré si les règles
+    d'analyse ont changé depuis son écriture.
+    """
+
+    def __init__(self, levels_dir: str, analysis_version: int = 0):
+        """
+        Constructeur de la classe LevelCache : charge le cache existant du répertoire s'il y en a un.
+        :param levels_dir: Répertoire des niveaux, qui contient aussi le fichier de cache.
+        :param analysis_version: Version des règles d'analyse des niveaux (voir service.load_level.ANALYSIS_VERSION).
+        """
+        self.cache_path = os.path.join(levels_dir, CACHE_FILE_NAME)
+        self.analysis_version = analysis_version
+        self.entries = {}
+        self.used = set()  # Niveaux consultés : les autres (fichiers supprimés) sont retirés à l'écriture
+        self.modified = False
+        try:
+            with open(self.cache_path, "r") as file:
+                data = json.load(file)
+            if data.get("version") == CACHE_VERSION and data.get("analysis") == analysis_version:
+                self.entries = data["levels"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # Cache absent ou illisible : tous les niveaux seront analysés.
+            pass
+
+    def get(self, path: str, stat: os.stat_result):
+        """
+        Méthode retournant les métadonnées en cache d'un niveau.
+        Si seule la date de modification a changé, le contenu est comparé via son empreinte.
+        :param path: Chemin du fichier .txt du niveau.
+        :param stat: Résultat de os.stat pour ce fichier.
+        :return: Les métadonnées (None si le niveau est invalide) ou MISSING si le niveau doit être analysé.
+        """
+        name = os.path.basename(path)
+        self.used.add(name)
+        entry = self.entries.get(name)
+        if entry is None or entry["size"] != stat.st_size:
+            return MISSING
+        if entry["mtime"] != stat.st_mtime_ns:
+            if entry["hash"] != file_hash(path):
+                return MISSING
+            entry["mtime"] = stat.st_mtime_ns
+            self.modified = True
+        return entry["metadata"]
+
+    def put(self, path: str, stat: os.stat_result, metadata, content_hash: str = None):
+        """
+        Méthode enregistrant le résultat de l'analyse d'un niveau.
+        :param path: Chemin du fichier .txt du niveau.
+        :param stat: Résultat de os.stat pour ce fichier.
+        :param metadata: Métadonnées du niveau, None s'il est invalide.
+        :param content_hash: Empreinte du contenu si elle est déjà connue (sinon le fichier est relu).
+        :return: NONE
+        """
+        name = os.path.basename(path)
+        self.used.add(name)
+        self.entries[name] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": content_hash or file_hash(path),
+            "metadata": metadata
+        }
+        self.modified = True
+
+    def save(self):
+        """
+        Méthode écrivant le cache sur le disque s'il a été modifié.
+        Une erreur d'écriture (répertoire en lecture seule...) est ignorée.
+        :return: NONE
+        """
+        stale = self.entries.keys() - self.used
+        if stale:
+            for name in stale:
+                del self.entries[name]
+            self.modified = True
+        if not self.modified:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as file:
+                json.dump({"version": CACHE_VERSION, "analysis": self.analysis_version, "levels": self.entries}, file)
+            os.replace(tmp_path, self.cache_path)
+            self.modified = False
+        except OSError:
+            pass
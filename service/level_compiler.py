@@ -0,0 +1,80 @@
+"""
+Convertisseur de niveaux entre le format texte (.txt) et le format compilé (.lvl).
+
+Utilisation (depuis la racine du projet) :
+    python -m service.level_compiler ressources/levels/01.txt            → ressources/levels/01.lvl
+    python -m service.level_compiler ressources/levels/01.lvl out.txt    → out.txt
+"""
+import argparse
+import os
+import sys
+
+from domain.grid import BUSH, FLOOR, EXIT, EXIT_WITH_PLAYER
+from service.level_binary import BINARY_EXTENSION, write_level_binary
+from service.level_parser import load_parsed_level, parse_level_binary
+from service.load_level import analyse_level
+
+CODE_CHARS = {BUSH: "#", FLOOR: "-", EXIT: ".", EXIT_WITH_PLAYER: "."}
+
+
+def compile_level(txt_path, lvl_path):
+    """
+    Fonction compilant un niveau texte. Le niveau est validé et ses distances précalculées dans l'en-tête.
+    :param txt_path: Chemin du niveau texte.
+    :param lvl_path: Chemin du niveau compilé à écrire.
+    :return: True si le niveau a été compilé, False s'il est invalide.
+    """
+    metadata = analyse_level(txt_path)
+    if metadata is None:
+        return False
+    parsed = load_parsed_level(txt_path)
+    write_level_binary(lvl_path, parsed.grid, parsed.get_player(), parsed.get_minotaurs(), parsed.get_exit(),
+                       metadata["exit_distance"], metadata["minotaur_distance"])
+    return True
+
+
+def decompile_level(lvl_path, txt_path):
+    """
+    Fonction reconvertissant un niveau compilé au format texte.
+    :param lvl_path: Chemin du niveau compilé.
+    :param txt_path: Chemin du niveau texte à écrire.
+    :return: True si le niveau a été converti, False si le fichier compilé est invalide.
+    """
+    parsed = parse_level_binary(lvl_path)
+    if not parsed.is_valid():
+        print(parsed.error, "in file :", lvl_path)
+        return False
+
+    grid = parsed.grid
+    elements = [("@", parsed.get_player()), (".", parsed.get_exit())]
+    elements += [("$", minotaur) for minotaur in parsed.get_minotaurs()]
+    with open(txt_path, "w") as file:
+        for y in range(grid.height):
+            row = [CODE_CHARS[code] for code in grid.cells[y * grid.width:(y + 1) * grid.width]]
+            for element, (x, element_y) in elements:
+                if element_y == y:
+                    row[x] = element
+            file.write("".join(row))
+            if y < grid.height - 1:
+                file.write("\n")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="Niveau à convertir (.txt ou .lvl)")
+    parser.add_argument("destination", nargs="?", help="Fichier à écrire (par défaut : même nom, autre extension)")
+    args = parser.parse_args(argv)
+
+    base_path, extension = os.path.splitext(args.source)
+    if extension == BINARY_EXTENSION:
+        destination = args.destination or base_path + ".txt"
+        converted = decompile_level(args.source, destination)
+    else:
+        destination = args.destination or base_path + BINARY_EXTENSION
+        converted = compile_level(args.source, destination)
+    return 0 if converted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+import hashlib
+import mmap
+import os
+from collections import OrderedDict
+
+from domain.grid import Grid, CHAR_TABLE
+from service.level_binary import BINARY_EXTENSION, map_level_binary
+
+ELEMENTS = ("#", "-", ".", "@", "$")
+MANDATORY_ELEMENTS = ELEMENTS
+UNIQUE_ELEMENTS = (".", "@")  # Le niveau peut contenir plusieurs minotaures
+PARSED_CACHE_SIZE = 32  # Nombre de niveaux analysés gardés en mémoire pendant la session
+
+_element_bytes = tuple((element, element.encode("ascii")) for element in ELEMENTS)
+_parsed_levels = OrderedDict()  # chemin → (mtime, taille, ParsedLevel)
+
+
+class ParsedLevel:
+    """
+    Classe contenant le résultat de la lecture d'un fichier de niveau :
+    grille, dimensions, nombre et position des éléments ainsi que la validité du format.
+    """
+
+    def __init__(self, grid: Grid, counts: dict, positions: dict, error: str = None, content_hash: str = None,
+                 exit_distance: int = None, minotaur_distance: int = None, minotaurs: list = None):
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        self.counts = counts        # Nombre d'occurrences de chaque élément
+        self.positions = positions  # Position (x, y) de la première occurrence de chaque élément
+        # Positions (x, y) de tous les minotaures, ligne par ligne
+        self.minotaurs = minotaurs if minotaurs is not None else [positions["$"]] if "$" in positions else []
+        self.error = error          # Raison pour laquelle le niveau est invalide (None s'il est valide)
+        self.content_hash = content_hash
+        # Plus courts chemins joueur → sortie et minotaure le plus proche → joueur, lorsqu'ils sont précalculés
+        # (niveaux compilés)
+        self.exit_distance = exit_distance
+        self.minotaur_distance = minotaur_distance
+
+    def is_valid(self):
+        return self.error is None
+
+    def get_player(self):
+        return self.positions.get("@")
+
+    def get_minotaur(self):
+        return self.positions.get("$")
+
+    def get_minotaurs(self):
+        return self.minotaurs
+
+    def get_exit(self):
+        return self.positions.get(".")
+
+
+def parse_level_bytes(buffer) -> ParsedLevel:
+    """
+    Fonction lisant le contenu d'un niveau en une seule passe, ligne par ligne.
+    Produit la grille, les dimensions, le nombre et la position des éléments, et vérifie le format :
+    éléments obligatoires présents, sortie / joueur uniques, lignes de même longueur.
+    :param buffer: Contenu du fichier (bytes ou mmap).
+    :return: Le niveau lu (ParsedLevel).
+    """
+    counts = dict.fromkeys(ELEMENTS, 0)
+    positions = {}
+    minotaurs = []
+    rows = []
+    length = len(buffer)
+    start = 0
+
+    while start < length:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = length
+        row = buffer[start:end].strip()
+        start = end + 1
+
+        y = len(rows)
+        for element, element_byte in _element_bytes:
+            count = row.count(element_byte)
+            if count:
+                if not counts[element]:
+                    positions[element] = (row.find(element_byte), y)
+                counts[element] += count
+                if element == "$":
+                    x = row.find(element_byte)
+                    while x != -1:
+                        minotaurs.append((x, y))
+                        x = row.find(element_byte, x + 1)
+        rows.append(row)
+
+    # Les lignes vides en fin de fichier sont ignorées.
+    while rows and not rows[-1]:
+        rows.pop()
+
+    width = max((len(row) for row in rows), default=0)
+    is_ragged = any(len(row) != width for row in rows)
+    if is_ragged:
+        grid = Grid.from_rows([row.decode("ascii", "replace") for row in rows])
+    else:
+        grid = Grid.from_cells(width, len(rows), b"".join(rows).translate(CHAR_TABLE))
+
+    return ParsedLevel(grid, counts, positions, _format_error(counts, is_ragged), minotaurs=minotaurs)
+
+
+def parse_level_file(path) -> ParsedLevel:
+    """
+    Fonction lisant un fichier de niveau une seule fois (projeté en mémoire) et calculant l'empreinte de son contenu.
+    :param path: Chemin du fichier .txt du niveau.
+    :return: Le niveau lu (ParsedLevel).
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            buffer = b""
+        else:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            parsed = parse_level_bytes(buffer)
+            parsed.content_hash = hashlib.sha1(buffer).hexdigest()
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+    return parsed
+
+
+def parse_level_binary(path) -> ParsedLevel:
+    """
+    Fonction chargeant un niveau compilé (voir service.level_binary) sans recopier ses cases.
+    Seuls la sortie, le joueur et les minotaures sont comptés.
+    :param path: Chemin du fichier .lvl du niveau.
+    :return: Le niveau lu (ParsedLevel).
+    """
+    header, grid = map_level_binary(path)
+    if header is None or not _valid_header(header, grid):
+        return ParsedLevel(Grid(0, 0), dict.fromkeys(ELEMENTS, 0), {}, "Invalid binary level")
+
+    positions = {"@": header.player, "$": header.minotaurs[0], ".": header.exit}
+    counts = dict.fromkeys(UNIQUE_ELEMENTS, 1)
+    counts["$"] = len(header.minotaurs)
+    # Pas d'empreinte du contenu : celle des cases ne couvre pas tout le fichier (calculée par le cache)
+    return ParsedLevel(grid, counts, positions,
+                       exit_distance=header.exit_distance if header.exit_distance >= 0 else None,
+                       minotaur_distance=header.minotaur_distance if header.minotaur_distance >= 0 else None,
+                       minotaurs=header.minotaurs)
+
+
+def load_parsed_level(path) -> ParsedLevel:
+    """
+    Fonction retournant le niveau lu depuis un fichier, en réutilisant la lecture déjà faite pendant la session
+    tant que le fichier n'a pas été modifié.
+    La grille retournée est partagée : elle doit être copiée avant d'être modifiée.
+    :param path: Chemin du fichier .txt ou .lvl (compilé) du niveau.
+    :return: Le niveau lu (ParsedLevel).
+    """
+    stat = os.stat(path)
+    entry = _parsed_levels.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        _parsed_levels.move_to_end(path)
+        return entry[2]
+
+    if path.endswith(BINARY_EXTENSION):
+        parsed = parse_level_binary(path)
+    else:
+        parsed = parse_level_file(path)
+    _parsed_levels[path] = (stat.st_mtime_ns, stat.st_size, parsed)
+    if len(_parsed_levels) > PARSED_CACHE_SIZE:
+        _parsed_levels.popitem(last=False)
+    return parsed
+
+
+def _valid_header(header, grid):
+    """
+    Retourne True si les positions et les distances de l'en-tête d'un niveau compilé sont cohérentes avec ses cases
+    (fichier modifié à la main ou corrompu sinon) : positions dans la carte, sortie sur une case de sortie,
+    joueur et minotaures sur des cases franchissables, distances inconnues (-1) ou inférieures au nombre de cases.
+    """
+    for x, y in (header.player, *header.minotaurs):
+        if not grid.in_bounds(x, y) or not grid.is_walkable(x, y):
+            return False
+    if not grid.in_bounds(*header.exit) or not grid.is_exit(*header.exit):
+        return False
+    cell_count = grid.width * grid.height
+    return -1 <= header.exit_distance < cell_count and -1 <= header.minotaur_distance < cell_count
+
+
+def _format_error(counts, is_ragged):
+    """
+    Retourne la raison pour laquelle le format du niveau est invalide (None s'il est valide).
+    """
+    # Vérification de la présence des éléments obligatoires
+    for element in MANDATORY_ELEMENTS:
+        if not counts[element]:
+            return f"Missing : {element}"
+
+    # Vérification d'unicité du joueur et de la sortie
+    for unique_el in UNIQUE_ELEMENTS:
+        if counts[unique_el] != 1:
+            return f"Not unique : {unique_el}"
+
+    if is_ragged:
+        return "Rows of different lengths"
+    return None
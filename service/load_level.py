@@ -1,57 +1,174 @@
-import glob
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 from domain.level import Level
+from service.level_binary import BINARY_EXTENSION
+from service.level_cache import LevelCache, MISSING
+from service.level_parser import load_parsed_level
+from service.pathfinder import DistanceField, find_path
+from utils import instrumentation
 
-mandatory_elements = ["#", "-", ".", "@", "$"]
-unique_elements = [".", "@", "$"]
+# Nombre de niveaux à analyser à partir duquel le pool de processus est utilisé : ses processus (spawn) mettent
+# environ 0,2 s à démarrer, soit l'analyse de quelques centaines de petits niveaux
+PARALLEL_THRESHOLD = 512
+# Version des règles d'analyse des niveaux (_analyse_parsed), gardée dans le cache : à incrémenter à chaque
+# changement du résultat de l'analyse (2 : lignes de longueurs différentes refusées, 3 : plusieurs minotaures).
+ANALYSIS_VERSION = 3
 
-def get_levels(levels_dir: str):
+@instrumentation.timed("get_levels", size=len)
+def get_levels(levels_dir: str, parallel=None, max_workers=None):
     """
-    Fonction permettant de retourner une liste de niveaux par rapports aux fichiers .txt d'un répertoire.
+    Fonction permettant de retourner une liste de niveaux par rapports aux fichiers .txt (ou .lvl compilés) d'un répertoire.
+    Les résultats de l'analyse des niveaux sont mis en cache dans le répertoire : seuls les fichiers
+    modifiés depuis le dernier appel sont ré-analysés.
     :param levels_dir: Répertoire dans lequel on va chercher les .txt des niveaux.
-    :return: une liste des niveaux.
+    :param parallel: True/False pour forcer ou non l'analyse dans un pool de processus,
+                     None pour l'activer automatiquement à partir de PARALLEL_THRESHOLD niveaux à analyser
+                     (s'il y a plusieurs cœurs).
+    :param max_workers: Nombre de processus du pool (par défaut : nombre de cœurs).
+    :return: une liste des niveaux, triée par nom de fichier.
     """
-    txt_files = glob.glob(os.path.join(levels_dir, '*.txt'))
-    levels = []
-    for txt_path in txt_files:
-        # Vérification que le fichier .txt n'est pas vide.
-        if os.stat(txt_path).st_size == 0:
-            continue
+    return list(iter_levels(levels_dir, parallel, max_workers))
 
-        # Vérification qu'un PNG correspondant au niveau existe.
-        modified_path = txt_path.replace('\\', '/')
-        base_name = modified_path.split('/')[-1].split('.')[0]
-        png_path = os.path.join(levels_dir, base_name + '.png')
+def iter_levels(levels_dir: str, parallel=None, max_workers=None):
+    """
+    Générateur retournant les niveaux d'un répertoire au fur et à mesure de leur validation, dans l'ordre
+    des noms de fichiers. Permet de commencer à afficher les niveaux avant la fin de l'analyse.
+    Les paramètres sont les mêmes que ceux de get_levels.
+    :return: un itérateur de niveaux.
+    """
+    cache = LevelCache(levels_dir, ANALYSIS_VERSION)
+    candidates = []  # (chemin, stat, métadonnées en cache ou MISSING)
+    for level_path, stat in _scan_level_files(levels_dir):
+        candidates.append((level_path, stat, cache.get(level_path, stat)))
 
-        if not os.path.isfile(png_path):
-            continue
+    to_analyse = [level_path for level_path, _, metadata in candidates if metadata is MISSING]
+    if parallel is None:
+        parallel = len(to_analyse) >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
+
+    executor = None
+    if parallel and to_analyse:
+        workers = max_workers or os.cpu_count() or 1
+        # "spawn" : le jeu a déjà des threads (préchargement des images, miniatures) et un fork les copierait
+        # dans un état quelconque (verrous pris)
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        analysed = executor.map(_analyse_with_hash, to_analyse,
+                                chunksize=max(1, len(to_analyse) // (workers * 4)))
+    else:
+        analysed = map(_analyse_with_hash, to_analyse)
+
+    try:
+        for level_path, stat, metadata in candidates:
+            if metadata is MISSING:
+                metadata, content_hash = next(analysed)
+                cache.put(level_path, stat, metadata, content_hash)
+
+            if metadata is None:
+                continue
+
+            base_path, extension = os.path.splitext(level_path)
+            yield Level(os.path.basename(base_path), base_path, extension=extension, **metadata)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        cache.save()
+
+def _scan_level_files(levels_dir: str):
+    """
+    Fonction parcourant le répertoire en une seule passe (os.scandir) pour trouver les niveaux candidats :
+    fichiers .txt ou compilés (.lvl) non vides accompagnés d'un .png du même nom.
+    Si un niveau existe dans les deux formats, la version compilée est utilisée.
+    :param levels_dir: Répertoire des niveaux.
+    :return: Liste triée de tuples (chemin du niveau, os.stat_result).
+    """
+    level_entries = {}
+    png_names = set()
+    with os.scandir(levels_dir) as entries:
+        for entry in entries:
+            name, extension = os.path.splitext(entry.name)
+            if extension == BINARY_EXTENSION or (extension == ".txt" and name not in level_entries):
+                level_entries[name] = entry
+            elif extension == ".png":
+                png_names.add(name)
 
-        if not check_validity(txt_path):
+    files = []
+    for name in sorted(level_entries):
+        # Vérification qu'un PNG correspondant au niveau existe.
+        if name not in png_names:
+            continue
+        entry = level_entries[name]
+        stat = entry.stat()
+        # Vérification que le fichier n'est pas vide.
+        if stat.st_size == 0:
             continue
+        files.append((os.path.join(levels_dir, entry.name), stat))
+    return files
 
-        levels.append(Level(base_name, txt_path.split('.txt')[0]))
-    return levels
+def _analyse_with_hash(path):
+    """
+    Fonction exécutée par les processus du pool : analyse un niveau et retourne aussi l'empreinte de son contenu.
+    """
+    parsed = load_parsed_level(path)
+    return _analyse_parsed(path, parsed), parsed.content_hash
 
 def check_validity(path) -> bool:
     """
     Fonction utilisée pour vérifier la validité du niveau.
-    Vérification que le fichier contienne bien les éléments obligatoires et un seul Minotaure, sortie et joueur.
+    Vérification que le fichier contienne bien les éléments obligatoires, une seule sortie et un seul joueur (et au moins un Minotaure),
+    que toutes les lignes aient la même longueur, que le joueur puisse atteindre la sortie et que chaque Minotaure puisse atteindre le joueur.
     :param path: chemin du fichier à vérifier.
     :return: renvoie un booléen si le niveau est valide ou non
     """
+    return analyse_level(path) is not None
+
+def analyse_level(path):
+    """
+    Fonction utilisée pour valider un niveau et calculer ses métadonnées.
+    :param path: chemin du fichier à analyser.
+    :return: un dictionnaire (width, height, exit_distance, minotaur_distance) ou None si le niveau est invalide.
+    """
+    return _analyse_parsed(path, load_parsed_level(path))
+
+def _analyse_parsed(path, parsed):
+    """
+    Fonction validant un niveau déjà lu (format puis possibilité de le résoudre) et calculant ses métadonnées.
+    """
+    if not parsed.is_valid():
+        print(parsed.error, "in file :", path)
+        return None
+
+    # Niveau compilé : les distances ont été vérifiées et calculées lors de la compilation.
+    if parsed.exit_distance is not None and parsed.minotaur_distance is not None:
+        return {
+            "width": parsed.width,
+            "height": parsed.height,
+            "exit_distance": parsed.exit_distance,
+            "minotaur_distance": parsed.minotaur_distance
+        }
+
+    # Vérification que le niveau peut être résolu
+    player = parsed.get_player()
 
-    with open(path, "r") as file:
-        content = file.read()
+    exit_path = find_path(parsed.grid, player, parsed.get_exit())
+    if not exit_path:
+        print("Exit unreachable by the player in file :", path)
+        return None
 
-    # Vérification de la présence des éléments obligatoires
-    for element in mandatory_elements:
-        if element not in content:
-            return False
+    # Un seul BFS depuis le joueur, étendu jusqu'au Minotaure le plus lointain, quel que soit leur nombre.
+    field = DistanceField()
+    field.reset(parsed.grid, player)
+    width = parsed.width
+    minotaur_distances = []
+    for x, y in parsed.get_minotaurs():
+        if not field.expand_until(y * width + x):
+            print("Player unreachable by the Minotaur in file :", path)
+            return None
+        minotaur_distances.append(field.distances[y * width + x])
 
-    # Vérification d'unicité du Minotaure, joueur et de sortie
-    for unique_el in unique_elements:
-        if content.count(unique_el) != 1:
-            print("Missing :", unique_el, "in file :", path)
-            return False
-    return True
+    return {
+        "width": parsed.width,
+        "height": parsed.height,
+        "exit_distance": len(exit_path),
+        "minotaur_distance": min(minotaur_distances)
+    }
@@ -0,0 +1,278 @@
+"""
+Génération procédurale de niveaux (labyrinthes) au format texte habituel, avec leur aperçu .png.
+
+Algorithmes :
+    * backtracker : parcours en profondeur aléatoire (longs couloirs sinueux) ;
+    * prim        : algorithme de Prim aléatoire (nombreux petits embranchements) ;
+    * rooms       : salles rectangulaires reliées par des couloirs.
+
+Le niveau est construit et écrit par bandes horizontales de BAND_ROWS lignes de cellules : seule la bande en cours
+est en mémoire, ce qui permet de générer des niveaux de 10 000 x 10 000 cases. Chaque bande est entièrement
+connexe et reliée à la suivante par une ouverture : toutes les cases libres sont reliées entre elles,
+le niveau peut donc toujours être résolu.
+
+Utilisation (depuis la racine du projet) :
+    python -m service.maze_generator ressources/levels --size 41x21 --algorithm prim --count 5 --seed 1
+"""
+import argparse
+import os
+import random
+import sys
+
+from PIL import Image
+
+ALGORITHMS = ("backtracker", "prim", "rooms")
+BAND_ROWS = 32  # Nombre de lignes de cellules générées à la fois
+ROOM_MIN = 2  # Côté minimal d'une salle (en cellules)
+ROOM_MAX = 6  # Côté maximal d'une salle (en cellules)
+PREVIEW_SIZE = 1000  # Plus grande dimension (en pixels) de l'aperçu .png
+PREVIEW_TILE = 32  # Taille maximale (en pixels) d'une case dans l'aperçu
+MIN_SIZE = 5  # Plus petite largeur / hauteur permettant de placer la sortie, le joueur et le minotaure
+
+FLOOR = ord("-")
+
+# Couleurs de l'aperçu : index de palette par caractère du fichier
+PREVIEW_COLORS = {"#": (34, 100, 34), "-": (205, 190, 150), ".": (40, 90, 220), "@": (240, 200, 30),
+                  "$": (200, 30, 30)}
+_preview_table = bytearray(256)
+for _index, _char in enumerate(PREVIEW_COLORS):
+    _preview_table[ord(_char)] = _index
+PREVIEW_TABLE = bytes(_preview_table)
+PREVIEW_PALETTE = [component for color in PREVIEW_COLORS.values() for component in color]
+
+
+def iter_level_chunks(width, height, algorithm="backtracker", seed=0):
+    """
+    Générateur produisant le niveau par morceaux de lignes complètes (chaque ligne se termine par "\\n").
+    Les cellules du labyrinthe sont les cases de coordonnées impaires, les murs les cases entre elles.
+    Le joueur est placé en haut à gauche, le minotaure en haut à droite et la sortie en bas à droite.
+    :param width: Largeur du niveau en cases (>= MIN_SIZE).
+    :param height: Hauteur du niveau en cases (>= MIN_SIZE).
+    :param algorithm: Algorithme de génération (voir ALGORITHMS).
+    :param seed: Graine du générateur aléatoire.
+    :return: un itérateur de bytearray.
+    """
+    if width < MIN_SIZE or height < MIN_SIZE:
+        raise ValueError(f"Level size must be at least {MIN_SIZE}x{MIN_SIZE}")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm : {algorithm}")
+
+    rng = random.Random(seed)
+    stride = width + 1
+    cell_width = (width - 1) // 2
+    cell_height = (height - 1) // 2
+    elements = {(0, 0): "@", (cell_width - 1, 0): "$", (cell_width - 1, cell_height - 1): "."}
+
+    yield bytearray(b"#" * width + b"\n")  # Bordure du haut
+
+    entry_column = None  # Colonne de l'ouverture depuis la bande précédente
+    for first_row in range(0, cell_height, BAND_ROWS):
+        band_height = min(BAND_ROWS, cell_height - first_row)
+        is_last = first_row + band_height == cell_height
+        band = bytearray((b"#" * width + b"\n") * (band_height * 2))
+        exit_column = None if is_last else rng.randrange(cell_width)
+
+        anchors = [(x, y - first_row) for x, y in elements if first_row <= y < first_row + band_height]
+        if entry_column is not None:
+            anchors.append((entry_column, 0))
+        if exit_column is not None:
+            anchors.append((exit_column, band_height - 1))
+
+        if algorithm == "backtracker":
+            _carve_backtracker(band, stride, cell_width, band_height, rng)
+        elif algorithm == "prim":
+            _carve_prim(band, stride, cell_width, band_height, rng)
+        else:
+            _carve_rooms(band, stride, cell_width, band_height, rng, anchors)
+
+        if exit_column is not None:
+            # Ouverture dans la ligne de murs sous la bande, vers la première ligne de la bande suivante
+            band[(band_height * 2 - 1) * stride + exit_column * 2 + 1] = FLOOR
+        for (x, y), char in elements.items():
+            if first_row <= y < first_row + band_height:
+                band[(y - first_row) * 2 * stride + x * 2 + 1] = ord(char)
+        entry_column = exit_column
+        yield band
+
+    if height % 2 == 0:
+        yield bytearray(b"#" * width + b"\n")  # Hauteur paire : ligne de buissons supplémentaire
+
+
+def _open_cell(band, stride, x, y):
+    band[y * 2 * stride + x * 2 + 1] = FLOOR
+
+
+def _open_wall(band, stride, x, y, nx, ny):
+    # Case du mur entre deux cellules voisines : milieu de leurs cases ((2x + 1 + 2nx + 1) / 2, (2y + 2ny) / 2)
+    band[(y + ny) * stride + x + nx + 1] = FLOOR
+
+
+def _carve_backtracker(band, stride, cell_width, band_height, rng):
+    """
+    Procédure creusant un labyrinthe parfait dans la bande par parcours en profondeur aléatoire (pile explicite).
+    """
+    visited = bytearray(cell_width * band_height)
+    start = rng.randrange(len(visited))
+    visited[start] = 1
+    _open_cell(band, stride, start % cell_width, start // cell_width)
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        x, y = cell % cell_width, cell // cell_width
+        neighbors = []
+        if x > 0 and not visited[cell - 1]:
+            neighbors.append(cell - 1)
+        if x < cell_width - 1 and not visited[cell + 1]:
+            neighbors.append(cell + 1)
+        if y > 0 and not visited[cell - cell_width]:
+            neighbors.append(cell - cell_width)
+        if y < band_height - 1 and not visited[cell + cell_width]:
+            neighbors.append(cell + cell_width)
+        if not neighbors:
+            stack.pop()
+            continue
+        neighbor = neighbors[rng.randrange(len(neighbors))] if len(neighbors) > 1 else neighbors[0]
+        visited[neighbor] = 1
+        nx, ny = neighbor % cell_width, neighbor // cell_width
+        _open_wall(band, stride, x, y, nx, ny)
+        _open_cell(band, stride, nx, ny)
+        stack.append(neighbor)
+
+
+def _carve_prim(band, stride, cell_width, band_height, rng):
+    """
+    Procédure creusant un labyrinthe parfait dans la bande avec l'algorithme de Prim aléatoire.
+    """
+    size = cell_width * band_height
+    state = bytearray(size)  # 0 : non atteinte, 1 : dans la frontière, 2 : creusée
+    frontier = []
+
+    def add_neighbors(cell):
+        x, y = cell % cell_width, cell // cell_width
+        for neighbor, valid in ((cell - 1, x > 0), (cell + 1, x < cell_width - 1),
+                                (cell - cell_width, y > 0), (cell + cell_width, y < band_height - 1)):
+            if valid and not state[neighbor]:
+                state[neighbor] = 1
+                frontier.append(neighbor)
+
+    start = rng.randrange(size)
+    state[start] = 2
+    _open_cell(band, stride, start % cell_width, start // cell_width)
+    add_neighbors(start)
+    while frontier:
+        index = rng.randrange(len(frontier))
+        cell = frontier[index]
+        frontier[index] = frontier[-1]
+        frontier.pop()
+
+        x, y = cell % cell_width, cell // cell_width
+        carved = [neighbor for neighbor, valid in ((cell - 1, x > 0), (cell + 1, x < cell_width - 1),
+                                                   (cell - cell_width, y > 0),
+                                                   (cell + cell_width, y < band_height - 1))
+                  if valid and state[neighbor] == 2]
+        neighbor = carved[rng.randrange(len(carved))]
+        _open_wall(band, stride, x, y, neighbor % cell_width, neighbor // cell_width)
+        _open_cell(band, stride, x, y)
+        state[cell] = 2
+        add_neighbors(cell)
+
+
+def _carve_rooms(band, stride, cell_width, band_height, rng, anchors):
+    """
+    Procédure creusant des salles dans la bande, puis des couloirs en L reliant salles et points d'ancrage
+    (joueur, minotaure, sortie et ouvertures vers les bandes voisines) de gauche à droite.
+    """
+    nodes = list(anchors)
+    rooms = max(1, cell_width * band_height // (ROOM_MAX * ROOM_MAX))
+    for _ in range(rooms):
+        room_width = min(cell_width, rng.randint(ROOM_MIN, ROOM_MAX))
+        room_height = min(band_height, rng.randint(ROOM_MIN, ROOM_MAX))
+        x = rng.randrange(cell_width - room_width + 1)
+        y = rng.randrange(band_height - room_height + 1)
+        for row in range(y * 2, (y + room_height - 1) * 2 + 1):
+            start = row * stride + x * 2 + 1
+            band[start:start + room_width * 2 - 1] = b"-" * (room_width * 2 - 1)
+        nodes.append((x + room_width // 2, y + room_height // 2))
+
+    nodes.sort()
+    _open_cell(band, stride, *nodes[0])
+    for (x0, y0), (x1, y1) in zip(nodes, nodes[1:]):
+        # Couloir horizontal sur la ligne de départ puis vertical sur la colonne d'arrivée
+        start = y0 * 2 * stride + min(x0, x1) * 2 + 1
+        band[start:start + abs(x1 - x0) * 2 + 1] = b"-" * (abs(x1 - x0) * 2 + 1)
+        for row in range(min(y0, y1) * 2, max(y0, y1) * 2 + 1):
+            band[row * stride + x1 * 2 + 1] = FLOOR
+
+
+def generate_level(path, width, height, algorithm="backtracker", seed=0, preview=True):
+    """
+    Procédure écrivant un niveau généré (.txt) et son aperçu (.png du même nom), bande par bande.
+    :param path: Chemin du fichier .txt à écrire.
+    :param width: Largeur du niveau en cases.
+    :param height: Hauteur du niveau en cases.
+    :param algorithm: Algorithme de génération (voir ALGORITHMS).
+    :param seed: Graine du générateur aléatoire.
+    :param preview: False pour ne pas écrire l'aperçu .png.
+    :return: NONE
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    stride = width + 1
+    scale = min(PREVIEW_TILE, PREVIEW_SIZE / max(width, height))
+    image = Image.new("RGB", (max(1, round(width * scale)), max(1, round(height * scale)))) if preview else None
+    resample = Image.NEAREST if scale >= 1 else Image.BOX
+
+    row = 0
+    with open(path, "wb") as file:
+        for chunk in iter_level_chunks(width, height, algorithm, seed):
+            file.write(chunk)
+            rows = len(chunk) // stride
+            if image is not None:
+                top, bottom = round(row * scale), round((row + rows) * scale)
+                if bottom > top:
+                    strip = Image.frombytes("P", (width, rows), bytes(chunk.translate(PREVIEW_TABLE)),
+                                            "raw", "P", stride)
+                    strip.putpalette(PREVIEW_PALETTE)
+                    image.paste(strip.convert("RGB").resize((image.width, bottom - top), resample), (0, top))
+            row += rows
+
+    if image is not None:
+        image.save(os.path.splitext(path)[0] + ".png")
+
+
+def parse_size(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output_dir", help="Répertoire où écrire les niveaux")
+    parser.add_argument("--size", type=parse_size, default=(41, 21), help="Taille en cases (LARGEURxHAUTEUR)")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="backtracker")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du premier niveau (+1 pour chaque suivant)")
+    parser.add_argument("--count", type=int, default=1, help="Nombre de niveaux à générer")
+    parser.add_argument("--prefix", default="maze_", help="Préfixe des noms de fichiers")
+    parser.add_argument("--no-preview", action="store_true", help="Ne pas écrire les aperçus .png")
+    parser.add_argument("--verify", action="store_true", help="Vérifier chaque niveau avec check_validity")
+    args = parser.parse_args(argv)
+
+    width, height = args.size
+    if width < MIN_SIZE or height < MIN_SIZE:
+        parser.error(f"size must be at least {MIN_SIZE}x{MIN_SIZE}")
+
+    failures = 0
+    for index in range(args.count):
+        seed = args.seed + index
+        name = f"{args.prefix}{args.algorithm}_{width}x{height}_{seed}"
+        path = os.path.join(args.output_dir, name + ".txt")
+        generate_level(path, width, height, args.algorithm, seed, preview=not args.no_preview)
+        if args.verify:
+            from service.load_level import check_validity
+
+            if not check_validity(path):
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
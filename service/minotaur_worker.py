@@ -0,0 +1,173 @@
+"""
+Calcul des déplacements des minotaures en arrière-plan, pour que la boucle Tk (affichage, chronomètre) ne soit
+pas bloquée pendant le pathfinding d'un grand niveau.
+
+    * La partie est en mode différé (GameEngine.defer_minotaurs) : une erreur du joueur cumule les pas dus.
+    * La fenêtre demande les nouvelles positions des minotaures (submit) ; elles sont calculées par
+      GameEngine.plan_minotaurs dans un processus : dans un thread, le BFS en Python garderait le GIL et
+      ralentirait encore la boucle Tk (un thread peut être forcé avec use_process=False).
+    * Les résultats sont déposés dans une file thread-safe, lue par la fenêtre à chaque image (poll).
+    * Une recherche devenue inutile (le joueur a bougé ou commis une nouvelle erreur) est annulée : elle est
+      retirée de la file d'attente si elle n'a pas commencé, son résultat est ignoré sinon. Les pas dus restent
+      cumulés et sont appliqués avec le résultat de la recherche suivante.
+
+Un résultat n'est appliqué que s'il correspond à l'état actuel de la partie : la partie obtenue est la même
+qu'en appliquant les pas dus à cet instant (GameEngine.move_pending_minotaurs sans positions), ce qui permet de
+la relire (voir service.replay).
+
+Si le worker échoue (exception du calcul, processus de calcul arrêté), l'erreur est affichée et la fenêtre
+calcule les minotaures elle-même pour le reste de la partie.
+"""
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from domain.grid import WALKABLE
+from service.game_engine import GameEngine
+from service.pathfinder import get_path_finder
+
+ASYNC_MIN_CELLS = 10000     # Nombre de cases franchissables à partir duquel les minotaures sont calculés en arrière-plan
+# Nombre de cases franchissables à partir duquel un processus est utilisé au lieu d'un thread : un BFS de quelques
+# millisecondes dans un thread suffit déjà à faire sauter des images
+PROCESS_MIN_CELLS = ASYNC_MIN_CELLS
+
+# Table de traduction code de tuile → 1 si la case est franchissable (utilisée avec bytes.translate)
+_walkable_table = bytes(WALKABLE) + bytes(256 - len(WALKABLE))
+
+_planner = None  # Partie servant aux calculs dans le processus de calcul (voir _init_process)
+
+
+def walkable_cells(grid):
+    """
+    Fonction retournant le nombre de cases franchissables d'une grille.
+    :param grid: Grille du niveau (domain.grid.Grid).
+    :return: Le nombre de cases.
+    """
+    return bytes(grid.cells).translate(_walkable_table).count(1)
+
+
+def _new_planner(grid, engine):
+    """
+    Fonction créant la partie utilisée uniquement pour ses calculs (plan_minotaurs) : elle a son propre moteur
+    de pathfinding et son propre champ de distances, la partie affichée n'est jamais modifiée par le worker.
+    """
+    return GameEngine(grid, None, (), 0, path_finder=get_path_finder(engine, grid))
+
+
+def _init_process(grid, engine):
+    """
+    Initialisation du processus de calcul : la grille n'est transmise qu'une fois par niveau.
+    """
+    global _planner
+    _planner = _new_planner(grid, engine)
+
+
+def _plan_in_process(player, minotaurs, steps):
+    return _planner.plan_minotaurs(player, minotaurs, steps)
+
+
+class MinotaurWorker:
+    """
+    Classe calculant les positions des minotaures en arrière-plan pour une partie en mode différé.
+    Toutes les méthodes sont appelées depuis le thread de Tk ; seuls les calculs sont faits dans le worker.
+    """
+
+    def __init__(self, grid, engine, use_process=None):
+        """
+        Constructeur de la classe MinotaurWorker.
+        :param grid: Grille du niveau (domain.grid.Grid). Elle est lue par le thread de calcul : les cases
+                     franchissables ne doivent pas changer pendant la partie.
+        :param engine: Nom du moteur de pathfinding (voir service.pathfinder.ENGINES).
+        :param use_process: True/False pour forcer ou non le calcul dans un processus,
+                            None pour l'activer automatiquement à partir de PROCESS_MIN_CELLS cases franchissables.
+        """
+        if use_process is None:
+            use_process = walkable_cells(grid) >= PROCESS_MIN_CELLS
+        self.use_process = use_process
+        if use_process:
+            # "spawn" : un fork copierait les threads de Tk et du préchargement des images dans un état quelconque
+            self.executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=_init_process, initargs=(grid, engine))
+            self.plan = _plan_in_process
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="minotaurs")
+            self.plan = _new_planner(grid, engine).plan_minotaurs
+        self.results = queue.SimpleQueue()  # (génération, Future) des recherches terminées
+        self.generation = 0   # Numéro de la recherche en cours : les résultats des précédentes sont ignorés
+        self.request = None   # (joueur, minotaures, pas) de la recherche en cours
+        self.future = None
+        self.cancelled = 0    # Nombre de recherches annulées ou dont le résultat a été ignoré
+
+    def submit(self, player, minotaurs, steps):
+        """
+        Méthode demandant les positions des minotaures après `steps` pas vers le joueur.
+        Sans effet si la même recherche est déjà en cours ; une autre recherche en cours est annulée.
+        :param player: Position (x, y) du joueur.
+        :param minotaurs: Positions (x, y) des minotaures.
+        :param steps: Nombre de cases dont chaque minotaure va avancer.
+        :return: False si le worker ne peut plus calculer (pool de processus arrêté) : les positions doivent
+                 être calculées par l'appelant.
+        """
+        request = (player, tuple(minotaurs), steps)
+        if request == self.request:
+            return True
+        self.cancel()
+        generation = self.generation
+        try:
+            self.future = self.executor.submit(self.plan, player, list(minotaurs), steps)
+        except RuntimeError as error:
+            # BrokenProcessPool (processus de calcul arrêté) ou worker déjà arrêté
+            print(f"Minotaur worker ERROR : {error!r}")
+            return False
+        self.request = request
+        # Appelé dans le thread du worker (ou celui du pool de processus) : le résultat passe par la file
+        self.future.add_done_callback(lambda future: self.results.put((generation, future)))
+        return True
+
+    def cancel(self):
+        """
+        Méthode annulant la recherche en cours : elle ne sera pas commencée si elle attend encore,
+        son résultat sera ignoré sinon.
+        :return: NONE
+        """
+        if self.request is not None:
+            self.future.cancel()
+            self.cancelled += 1
+        self.generation += 1
+        self.request = None
+        self.future = None
+
+    def poll(self):
+        """
+        Méthode lisant les résultats déposés par le worker (sans attendre).
+        :return: Tuple (requête, positions des minotaures) de la recherche en cours si elle est terminée, sinon None.
+                 Les positions valent None si le calcul a échoué : elles doivent être calculées par l'appelant.
+        """
+        result = None
+        while True:
+            try:
+                generation, future = self.results.get_nowait()
+            except queue.Empty:
+                return result
+            if generation != self.generation or future.cancelled():
+                continue
+            try:
+                positions = future.result()
+            except Exception as error:
+                # Erreur du calcul ou BrokenProcessPool : elle ne doit pas remonter dans la boucle Tk
+                print(f"Minotaur worker ERROR : {error!r}")
+                positions = None
+            result = (self.request, positions)
+            self.request = None
+            self.future = None
+
+    def pending(self):
+        return self.request is not None
+
+    def shutdown(self):
+        """
+        Méthode arrêtant le worker (fin de partie) sans attendre la fin d'une recherche en cours.
+        :return: NONE
+        """
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,136 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : service.pathfinder reste utilisé sans lui.
+    np = None
+
+from domain.grid import WALKABLE
+from utils import instrumentation
+
+HAS_NUMPY = np is not None
+
+
+def walkable_array(tiles_map):
+    """
+    Fonction retournant la carte des cases franchissables sous forme de tableau booléen,
+    entouré d'une bordure non franchissable (forme : (hauteur + 2, largeur + 2)).
+    La bordure évite qu'un déplacement horizontal ne passe d'une ligne à l'autre dans l'indexation à plat.
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :return: Tableau NumPy booléen.
+    """
+    codes = np.frombuffer(bytes(tiles_map.cells), dtype=np.uint8).reshape(tiles_map.height, tiles_map.width)
+    padded = np.zeros((tiles_map.height + 2, tiles_map.width + 2), dtype=bool)
+    padded[1:-1, 1:-1] = np.frombuffer(WALKABLE, dtype=np.uint8).astype(bool)[codes]
+    return padded
+
+
+def distance_map(tiles_map, source):
+    """
+    Fonction calculant la distance (en nombre de pas) de chaque case à la source.
+    Expansion par front d'onde : chaque couche du BFS est calculée en une seule opération vectorisée
+    sur les indices du front, ce qui garde un coût total proportionnel au nombre de cases atteintes.
+
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :param source: Position (x, y) de départ, toujours à distance 0 même si elle n'est pas franchissable.
+    :return: Tableau NumPy int32 de forme (hauteur, largeur), -1 pour les cases inatteignables.
+    """
+    walkable = walkable_array(tiles_map)
+    padded_width = tiles_map.width + 2
+    flat_walkable = walkable.ravel()
+
+    distances = np.full(flat_walkable.shape, -1, dtype=np.int32)
+    owner = np.empty(flat_walkable.shape, dtype=np.int64)  # Sert à dédoublonner le front sans tri
+    offsets = np.array([-1, 1, -padded_width, padded_width], dtype=np.int64)
+
+    frontier = np.array([(source[1] + 1) * padded_width + source[0] + 1], dtype=np.int64)
+    distances[frontier] = 0
+    layer = 0
+
+    while frontier.size:
+        layer += 1
+        neighbors = (frontier[:, None] + offsets).ravel()
+        neighbors = neighbors[flat_walkable[neighbors] & (distances[neighbors] == -1)]
+        # Une case atteinte par plusieurs cases du front n'est gardée qu'une fois (la dernière écriture gagne).
+        positions = np.arange(neighbors.size)
+        owner[neighbors] = positions
+        frontier = neighbors[owner[neighbors] == positions]
+        distances[frontier] = layer
+
+    return distances.reshape(walkable.shape)[1:-1, 1:-1].copy()
+
+
+def is_reachable(tiles_map, start, goal):
+    """
+    Fonction indiquant si goal est atteignable depuis start (les mêmes règles que find_path).
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :param start: Position de départ (x, y)
+    :param goal: Position d'arrivée (x, y)
+    :return: True si un chemin existe.
+    """
+    return bool(path_length(tiles_map, start, goal) >= 0)
+
+
+def path_length(tiles_map, start, goal):
+    """
+    Fonction retournant la longueur du plus court chemin de start à goal (-1 si inatteignable).
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :param start: Position de départ (x, y)
+    :param goal: Position d'arrivée (x, y)
+    :return: Nombre de pas du plus court chemin.
+    """
+    if start == goal:
+        return 0
+    distances = distance_map(tiles_map, goal)
+    best = _best_neighbor(distances, start)
+    if best is None:
+        return -1
+    if tiles_map.is_walkable(*start):
+        return int(distances[start[1], start[0]])
+    return int(distances[best[1], best[0]]) + 1
+
+
+@instrumentation.timed("find_path", size=len)
+def find_path_numpy(tiles_map, start, goal):
+    """
+    Fonction utilisée pour calculer le chemin entre une position de départ et une position d'arrivée.
+    Calcule le champ de distances depuis goal puis le descend depuis start.
+    Même signature et même contrat que service.pathfinder.find_path.
+
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :param start: Position de départ (x, y)
+    :param goal: Position d'arrivée (x, y)
+    :return: Une liste de positions pour atteindre le but sans comprendre le départ.
+             Liste vide si pas de path trouvé.
+    """
+    if start == goal:
+        return []
+    distances = distance_map(tiles_map, goal)
+    if instrumentation.enabled:
+        instrumentation.observe("find_path.nodes", int(np.count_nonzero(distances >= 0)))
+
+    path = []
+    current = start
+    while current != goal:
+        current = _best_neighbor(distances, current)
+        if current is None:
+            # Le but n'est pas atteignable.
+            return []
+        path.append(current)
+    return path
+
+
+def _best_neighbor(distances, position):
+    """
+    Retourne la case voisine atteinte la plus proche de la source (None si aucune).
+    """
+    height, width = distances.shape
+    x, y = position
+    best = None
+    best_distance = -1
+    for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+        if not (0 <= nx < width and 0 <= ny < height):
+            continue
+        distance = distances[ny, nx]
+        if distance != -1 and (best is None or distance < best_distance):
+            best = (nx, ny)
+            best_distance = distance
+    return best
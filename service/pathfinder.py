@@ -1,67 +1,355 @@
 from collections import deque
+from heapq import heappop, heappush
 
+from domain.grid import WALKABLE
+from utils import instrumentation
 
+
+@instrumentation.timed("find_path", size=len)
 def find_path(tiles_map, start, goal):
     """
     Fonction utilisée pour calculer le chemin entre une position de départ et une position d'arrivée.
     Basé sur l'algorithme : Breadth-first search (BFS)
 
-    :param tiles_map: grille 2D grid (list of lists) contenant des Tiles
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
     :param start: Position de départ (x, y)
     :param goal: Position d'arrivée (x, y)
     :return: Une liste de positions pour atteindre le but sans comprendre le départ.
              Liste vide si pas de path trouvé.
     """
+    width = tiles_map.width
+    height = tiles_map.height
+    cells = tiles_map.cells
+
+    start_idx = start[1] * width + start[0]
+    goal_idx = goal[1] * width + goal[0]
 
     # Set up BFS stuff
-    queue = deque() # Tiles à explorer
-    came_from = {}  # Utilisé pour reconstruire le chemin (key: position actuelle, value: d'où on vient)
-    seen = set() # Tiles déjà explorée
+    queue = deque()  # Cases à explorer (indices dans la grille)
+    size = width * height
+    came_from = [-1] * size  # Utilisé pour reconstruire le chemin (index : case, valeur : d'où on vient)
+    came_from[start_idx] = start_idx  # Sert aussi de marqueur des cases déjà explorées
 
-    queue.append(start)
-    seen.add(start)
+    queue.append(start_idx)
 
     while queue:
         current = queue.popleft()
 
         # Si on atteint le but alors on s'arrête
-        if current == goal:
+        if current == goal_idx:
             break
 
-        cx, cy = current
+        cx = current % width
+
+        # Vérification des déplacements : gauche, droite, haut, bas (en restant dans les clous).
+        for neighbor in (current - 1 if cx > 0 else -1,
+                         current + 1 if cx < width - 1 else -1,
+                         current - width,
+                         current + width):
+            if neighbor < 0 or neighbor >= size:
+                continue
+
+            # Si on peut marcher sur la case ou si c'est le but.
+            if came_from[neighbor] == -1 and (WALKABLE[cells[neighbor]] or neighbor == goal_idx):
+                queue.append(neighbor)
+                came_from[neighbor] = current
+
+    if instrumentation.enabled:
+        instrumentation.observe("find_path.nodes", size - came_from.count(-1))
+
+    # Construire le chemin du retour à partir de l’objectif.
+    return _build_path(came_from, width, start_idx, goal_idx)
+
 
-        # Vérification des déplacements : haut, bas, gauche, droite.
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = cx + dx, cy + dy
-            neighbor = (nx, ny)
+@instrumentation.timed("find_path", size=len)
+def find_path_astar(tiles_map, start, goal):
+    """
+    Fonction utilisée pour calculer le chemin entre une position de départ et une position d'arrivée.
+    Basé sur l'algorithme : A* avec la distance de Manhattan comme heuristique.
+    Même signature et même contrat que find_path.
 
-            # S'assurer qu'on est encore dans les clous.
-            if ny < 0 or ny >= len(tiles_map):
+    :param tiles_map: Grille du niveau (domain.grid.Grid)
+    :param start: Position de départ (x, y)
+    :param goal: Position d'arrivée (x, y)
+    :return: Une liste de positions pour atteindre le but sans comprendre le départ.
+             Liste vide si pas de path trouvé.
+    """
+    width = tiles_map.width
+    size = width * tiles_map.height
+    cells = tiles_map.cells
+    gx, gy = goal
+
+    start_idx = start[1] * width + start[0]
+    goal_idx = gy * width + gx
+
+    came_from = [-1] * size
+    cost = [-1] * size  # Coût du meilleur chemin connu depuis le départ (-1 : jamais atteint)
+    came_from[start_idx] = start_idx
+    cost[start_idx] = 0
+
+    # File de priorité : (f = coût + heuristique, heuristique, index)
+    open_heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start_idx)]
+
+    while open_heap:
+        _, _, current = heappop(open_heap)
+
+        if current == goal_idx:
+            break
+
+        cx = current % width
+        next_cost = cost[current] + 1
+
+        for neighbor in (current - 1 if cx > 0 else -1,
+                         current + 1 if cx < width - 1 else -1,
+                         current - width,
+                         current + width):
+            if neighbor < 0 or neighbor >= size:
                 continue
-            if nx < 0 or nx >= len(tiles_map[0]):
+            if not (WALKABLE[cells[neighbor]] or neighbor == goal_idx):
                 continue
 
-            tile = tiles_map[ny][nx]
+            known = cost[neighbor]
+            if known == -1 or next_cost < known:
+                cost[neighbor] = next_cost
+                came_from[neighbor] = current
+                h = abs(neighbor % width - gx) + abs(neighbor // width - gy)
+                heappush(open_heap, (next_cost + h, h, neighbor))
 
-            # Si on peut marcher sur la tile ou si c'est le but.
-            if tile.is_walkable() or neighbor == goal:
-                if neighbor not in seen:
-                    queue.append(neighbor)
-                    seen.add(neighbor)
-                    came_from[neighbor] = current
+    if instrumentation.enabled:
+        instrumentation.observe("find_path.nodes", size - came_from.count(-1))
 
-    # Construire le chemin du retour à partir de l’objectif.
-    path = []
-    step = goal
+    return _build_path(came_from, width, start_idx, goal_idx)
+
+
+class DistanceField:
+    """
+    Moteur de pathfinding basé sur un champ de distances calculé depuis la position du joueur (BFS inversé).
+    Le minotaure descend ensuite le gradient du champ : chaque déplacement coûte O(nombre de pas).
+
+    Le champ est construit de manière incrémentale : le BFS s'arrête dès que la case demandée est atteinte
+    et reprend là où il s'était arrêté si une case plus lointaine est demandée plus tard. Il n'est réinitialisé
+    que lorsque le joueur (la source) a bougé ou que la grille a changé (voir invalidate).
+    """
 
-    while step != start:
-        prev = came_from.get(step)
-        if prev is None:
-            # Le but n'est pas atteignable.
+    def __init__(self):
+        self.grid = None
+        self.source = None
+        self.distances = None  # Distance de chaque case à la source (-1 : pas encore atteinte)
+        self.frontier = None   # File du BFS, conservée pour pouvoir reprendre l'expansion
+
+    def invalidate(self):
+        """
+        Méthode à appeler lorsque le caractère franchissable d'une case de la grille a changé.
+        :return: NONE
+        """
+        self.source = None
+
+    def reset(self, tiles_map, source):
+        """
+        Méthode permettant de repartir d'un champ vide centré sur une nouvelle source.
+        :param tiles_map: Grille du niveau (domain.grid.Grid)
+        :param source: Position (x, y) à partir de laquelle les distances sont calculées.
+        :return: NONE
+        """
+        source_idx = source[1] * tiles_map.width + source[0]
+        self.grid = tiles_map
+        self.source = source
+        self.distances = [-1] * (tiles_map.width * tiles_map.height)
+        self.distances[source_idx] = 0
+        self.frontier = deque((source_idx,))
+
+    def set_source(self, tiles_map, source):
+        """
+        Méthode centrant le champ sur une source : le champ déjà calculé est gardé si ni la source ni la grille
+        n'ont changé.
+        :param tiles_map: Grille du niveau (domain.grid.Grid)
+        :param source: Position (x, y) à partir de laquelle les distances sont calculées.
+        :return: NONE
+        """
+        if tiles_map is not self.grid or source != self.source:
+            self.reset(tiles_map, source)
+
+    def expand_until(self, target_idx):
+        """
+        Méthode permettant de poursuivre le BFS jusqu'à ce que la case cible soit atteinte.
+        Une case cible non franchissable est considérée atteinte dès qu'une de ses voisines l'est.
+        :param target_idx: Index de la case cible dans la grille (-1 pour explorer toute la grille).
+        :return: True si la case cible (ou une voisine) est atteinte, False si elle est inatteignable.
+        """
+        width = self.grid.width
+        size = len(self.distances)
+        cells = self.grid.cells
+        distances = self.distances
+        frontier = self.frontier
+
+        if target_idx != -1:
+            if distances[target_idx] != -1:
+                return True
+            if not WALKABLE[cells[target_idx]] and self._best_neighbor(target_idx) != -1:
+                return True
+
+        while frontier:
+            current = frontier.popleft()
+            cx = current % width
+            next_distance = distances[current] + 1
+            reached = False
+
+            for neighbor in (current - 1 if cx > 0 else -1,
+                             current + 1 if cx < width - 1 else -1,
+                             current - width,
+                             current + width):
+                if neighbor < 0 or neighbor >= size:
+                    continue
+                if neighbor == target_idx:
+                    reached = True
+                if distances[neighbor] == -1 and WALKABLE[cells[neighbor]]:
+                    distances[neighbor] = next_distance
+                    frontier.append(neighbor)
+
+            if reached:
+                return True
+        return False
+
+    def expand_all(self):
+        """
+        Méthode terminant le BFS : toutes les cases atteignables depuis la source ont ensuite leur distance.
+        :return: La liste des distances (-1 pour les cases inatteignables).
+        """
+        self.expand_until(-1)
+        return self.distances
+
+    def next_step(self, idx, blocked):
+        """
+        Méthode retournant la case voisine par laquelle on se rapproche de la source en évitant des cases occupées.
+        La case doit déjà être atteinte par le champ (voir expand_until) : ses voisines plus proches le sont aussi.
+        :param idx: Index de la case de départ.
+        :param blocked: Ensemble des index des cases à éviter.
+        :return: L'index de la case voisine, -1 si elles sont toutes occupées (ou si idx est la source).
+        """
+        width = self.grid.width
+        size = len(self.distances)
+        distances = self.distances
+        closer = distances[idx] - 1
+        if closer < 0:
+            return -1
+        cx = idx % width
+        for neighbor in (idx - 1 if cx > 0 else -1,
+                         idx + 1 if cx < width - 1 else -1,
+                         idx - width,
+                         idx + width):
+            if 0 <= neighbor < size and distances[neighbor] == closer and neighbor not in blocked:
+                return neighbor
+        return -1
+
+    def _best_neighbor(self, idx):
+        """
+        Retourne la case voisine déjà atteinte la plus proche de la source (-1 si aucune).
+        """
+        width = self.grid.width
+        size = len(self.distances)
+        distances = self.distances
+        cx = idx % width
+        best = -1
+        for neighbor in (idx - 1 if cx > 0 else -1,
+                         idx + 1 if cx < width - 1 else -1,
+                         idx - width,
+                         idx + width):
+            if neighbor < 0 or neighbor >= size or distances[neighbor] == -1:
+                continue
+            if best == -1 or distances[neighbor] < distances[best]:
+                best = neighbor
+        return best
+
+    @instrumentation.timed("find_path", size=len)
+    def find_path(self, tiles_map, start, goal):
+        """
+        Méthode calculant le chemin de start vers goal (voir descend), avec mesure de sa durée.
+        Même signature et même contrat que find_path.
+        """
+        return self.descend(tiles_map, start, goal)
+
+    def descend(self, tiles_map, start, goal):
+        """
+        Méthode calculant le chemin de start vers goal par descente du champ de distances centré sur goal.
+        Même signature et même contrat que find_path, sans mesure de durée : utilisée par les moteurs qui
+        mesurent déjà leurs appels (service.route_cache).
+
+        :param tiles_map: Grille du niveau (domain.grid.Grid)
+        :param start: Position de départ (x, y)
+        :param goal: Position d'arrivée (x, y), source du champ de distances.
+        :return: Une liste de positions pour atteindre le but sans comprendre le départ.
+                 Liste vide si pas de path trouvé.
+        """
+        self.set_source(tiles_map, goal)
+
+        width = tiles_map.width
+        start_idx = start[1] * width + start[0]
+        goal_idx = goal[1] * width + goal[0]
+
+        if instrumentation.enabled:
+            # Cases atteintes par cet appel uniquement (le champ est réutilisé d'un appel à l'autre)
+            reached = self.distances.count(-1)
+        if start_idx == goal_idx or not self.expand_until(start_idx):
             return []
-        path.append(step)
-        step = prev
+        if instrumentation.enabled:
+            instrumentation.observe("find_path.nodes", reached - self.distances.count(-1))
+
+        path = []
+        current = start_idx
+        while current != goal_idx:
+            current = self._best_neighbor(current)
+            path.append((current % width, current // width))
+        return path
+
+
+def _build_path(came_from, width, start_idx, goal_idx):
+    """
+    Fonction reconstruisant le chemin (sans le départ) à partir du tableau des prédécesseurs.
+    """
+    if came_from[goal_idx] == -1:
+        # Le but n'est pas atteignable.
+        return []
+
+    path = []
+    step = goal_idx
+
+    while step != start_idx:
+        path.append((step % width, step // width))
+        step = came_from[step]
 
     path.reverse()
 
     return path
+
+
+ENGINES = ("bfs", "astar", "distance_field", "numpy", "route_cache")
+
+
+def get_path_finder(engine="bfs", tiles_map=None, background=False):
+    """
+    Fonction retournant une fonction de pathfinding ayant la même signature que find_path.
+    Les moteurs "distance_field" et "route_cache" conservent un état : une instance par partie est nécessaire.
+    Le moteur "numpy" se replie sur find_path lorsque NumPy n'est pas installé.
+    :param engine: Nom du moteur ("bfs", "astar", "distance_field", "numpy" ou "route_cache").
+    :param tiles_map: Grille du niveau, si elle est déjà connue : le moteur "route_cache" calcule alors sa table
+                      de routage immédiatement (au chargement du niveau) plutôt qu'au premier appel.
+    :param background: True pour que le moteur "route_cache" calcule sa table dans un thread (fenêtre de jeu) :
+                       les chemins sont cherchés à la demande tant qu'elle n'est pas prête.
+    :return: Une fonction (tiles_map, start, goal) → liste de positions.
+    """
+    if engine == "bfs":
+        return find_path
+    if engine == "astar":
+        return find_path_astar
+    if engine == "distance_field":
+        return DistanceField().find_path
+    if engine == "numpy":
+        from service.numpy_pathfinder import HAS_NUMPY, find_path_numpy
+        return find_path_numpy if HAS_NUMPY else find_path
+    if engine == "route_cache":
+        from service.route_cache import RouteCache
+        routes = RouteCache()
+        if tiles_map is not None:
+            routes.prepare(tiles_map, background)
+        return routes.find_path
+    raise ValueError(f"Unknown pathfinding engine : {engine}")
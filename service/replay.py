@@ -0,0 +1,273 @@
+"""
+Enregistrement et relecture déterministe des parties.
+
+Format binaire d'un replay (.rpl, little-endian) :
+    en-tête : magic, version, empreinte SHA-1 du niveau, temps maximal (s), issue de la partie,
+              déplacements réussis, erreurs, nombre d'entrées, longueur du nom du niveau,
+              options (version 2 : FLAG_DEFERRED si les minotaures étaient calculés en arrière-plan)
+    nom du niveau (UTF-8)
+    entrées : temps (ms depuis le début de la partie) et direction de chaque touche, 5 octets par entrée.
+              En mode différé, l'entrée MINOTAURS_CODE marque l'application des pas dus des minotaures.
+
+Les règles ne dépendent du temps que pour la fin de partie : rejouer les entrées avec une horloge simulée
+redonne exactement la même partie, tant que les règles et le pathfinding du minotaure n'ont pas changé.
+
+Utilisation (depuis la racine du projet) :
+    python -m service.replay replays/*.rpl [--levels ressources/levels]
+"""
+import argparse
+import hashlib
+import os
+import struct
+import sys
+import time
+
+from service.game_engine import GameEngine, SimulatedClock, READY, PLAYING, WON, CAUGHT, TIMEOUT
+from service.level_binary import BINARY_EXTENSION
+from service.level_parser import load_parsed_level
+
+MAGIC = b"MREP"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)  # La version 1 n'a pas d'options (parties sans mode différé)
+REPLAY_EXTENSION = ".rpl"
+REPLAYS_DIR = "./replays"
+
+HEADER_V1 = struct.Struct("<4sH20sdBIIIH")
+HEADER = struct.Struct("<4sH20sdBIIIHB")
+FLAG_DEFERRED = 1  # Partie en mode différé (voir service.minotaur_worker)
+INPUT = struct.Struct("<IB")
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))  # Haut, bas, gauche, droite
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+MINOTAURS_CODE = len(DIRECTIONS)  # Entrée spéciale : application des pas dus des minotaures (mode différé)
+MINOTAURS = (0, 0)  # Déplacement (dx, dy) retourné par iter_inputs pour l'entrée MINOTAURS_CODE
+STATUSES = (READY, PLAYING, WON, CAUGHT, TIMEOUT)
+
+
+def level_hash(parsed):
+    """
+    Fonction calculant l'empreinte d'un niveau à partir de ses cases, de la position du joueur, de la sortie
+    et des minotaures. L'empreinte est la même pour un niveau texte et sa version compilée.
+    :param parsed: Niveau lu (service.level_parser.ParsedLevel).
+    :return: Empreinte SHA-1 (20 octets).
+    """
+    positions = [coordinate for position in (parsed.get_player(), parsed.get_minotaur(), parsed.get_exit())
+                 for coordinate in (position or (-1, -1))]
+    digest = hashlib.sha1(parsed.grid.cells)
+    digest.update(struct.pack("<II6i", parsed.width, parsed.height, *positions))
+    # Minotaures supplémentaires : l'empreinte d'un niveau à un seul minotaure ne change pas
+    for x, y in parsed.get_minotaurs()[1:]:
+        digest.update(struct.pack("<ii", x, y))
+    return digest.digest()
+
+
+class Replay:
+    """
+    Classe représentant l'enregistrement d'une partie.
+    Les entrées sont ajoutées à la fin d'un buffer d'octets, déjà au format du fichier.
+    """
+
+    def __init__(self, level_name, level_digest, timer_limit, inputs=b"", status=PLAYING, moves=0, blunders=0,
+                 deferred=False):
+        """
+        Constructeur de la classe Replay.
+        :param level_name: Nom du niveau (fichier sans extension).
+        :param level_digest: Empreinte du niveau (voir level_hash).
+        :param timer_limit: Temps maximal de la partie en secondes.
+        :param inputs: Entrées déjà enregistrées (au format INPUT).
+        :param status: Issue de la partie (voir service.game_engine).
+        :param moves: Déplacements réussis du joueur.
+        :param blunders: Erreurs du joueur.
+        :param deferred: True si les minotaures de la partie étaient calculés en arrière-plan (mode différé).
+        """
+        self.level_name = level_name
+        self.level_digest = level_digest
+        self.timer_limit = timer_limit
+        self.inputs = bytearray(inputs)
+        self.status = status
+        self.moves = moves
+        self.blunders = blunders
+        self.deferred = deferred
+
+    def __len__(self):
+        return len(self.inputs) // INPUT.size
+
+    def record(self, elapsed, dx, dy):
+        """
+        Méthode enregistrant une touche.
+        :param elapsed: Temps écoulé depuis le début de la partie (s), arrondi à la milliseconde inférieure.
+        :param dx: Déplacement en direction de l'axe des X
+        :param dy: Déplacement en direction de l'axe des Y.
+        :return: NONE
+        """
+        self.inputs += INPUT.pack(int(elapsed * 1000), DIRECTION_CODES[(dx, dy)])
+
+    def record_minotaurs(self, elapsed):
+        """
+        Méthode enregistrant l'application des pas dus des minotaures (mode différé).
+        :param elapsed: Temps écoulé depuis le début de la partie (s), arrondi à la milliseconde inférieure.
+        :return: NONE
+        """
+        self.inputs += INPUT.pack(int(elapsed * 1000), MINOTAURS_CODE)
+
+    def finish(self, engine):
+        """
+        Méthode enregistrant l'issue de la partie, utilisée pour vérifier les relectures.
+        :param engine: Partie terminée (service.game_engine.GameEngine).
+        :return: NONE
+        """
+        self.status = engine.status
+        self.moves = engine.moves
+        self.blunders = engine.blunders
+
+    def iter_inputs(self):
+        """
+        Générateur retournant les entrées enregistrées.
+        :return: un itérateur de tuples (temps en secondes, dx, dy), (dx, dy) vaut MINOTAURS pour l'application
+                 des pas dus des minotaures (voir apply_input).
+        """
+        for milliseconds, code in INPUT.iter_unpack(self.inputs):
+            dx, dy = DIRECTIONS[code] if code != MINOTAURS_CODE else MINOTAURS
+            yield milliseconds / 1000, dx, dy
+
+    def to_bytes(self):
+        name = self.level_name.encode("utf-8")
+        header = HEADER.pack(MAGIC, VERSION, self.level_digest, self.timer_limit, STATUSES.index(self.status),
+                             self.moves, self.blunders, len(self), len(name), FLAG_DEFERRED if self.deferred else 0)
+        return header + name + self.inputs
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Méthode lisant un replay.
+        :param data: Contenu d'un fichier .rpl.
+        :return: Le replay lu.
+        """
+        if len(data) < HEADER_V1.size:
+            raise ValueError("Invalid replay : truncated header")
+        magic, version = struct.unpack_from("<4sH", data)
+        if magic != MAGIC or version not in SUPPORTED_VERSIONS:
+            raise ValueError("Invalid replay : unknown format")
+        header = HEADER_V1 if version == 1 else HEADER
+        if len(data) < header.size:
+            raise ValueError("Invalid replay : truncated header")
+        _, _, digest, timer_limit, status, moves, blunders, count, name_length, *options = header.unpack_from(data)
+        flags = options[0] if options else 0
+        start = header.size + name_length
+        if len(data) != start + count * INPUT.size:
+            raise ValueError("Invalid replay : truncated inputs")
+        name = bytes(data[header.size:start]).decode("utf-8")
+        return cls(name, digest, timer_limit, data[start:], STATUSES[status], moves, blunders,
+                   bool(flags & FLAG_DEFERRED))
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def replay_path(level_name, replays_dir=REPLAYS_DIR):
+    """
+    Fonction retournant un chemin libre pour enregistrer le replay d'une partie.
+    :param level_name: Nom du niveau joué.
+    :param replays_dir: Répertoire des replays (créé si nécessaire).
+    :return: Le chemin du fichier.
+    """
+    os.makedirs(replays_dir, exist_ok=True)
+    return os.path.join(replays_dir, f"{level_name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}{REPLAY_EXTENSION}")
+
+
+def find_level(replay, levels_dir):
+    """
+    Fonction retrouvant le fichier du niveau d'un replay (compilé de préférence) et vérifiant son empreinte.
+    :param replay: Replay à relire.
+    :param levels_dir: Répertoire des niveaux.
+    :return: Le chemin du niveau, None s'il est introuvable ou a été modifié depuis l'enregistrement.
+    """
+    for extension in (BINARY_EXTENSION, ".txt"):
+        path = os.path.join(levels_dir, replay.level_name + extension)
+        if os.path.isfile(path) and level_hash(load_parsed_level(path)) == replay.level_digest:
+            return path
+    return None
+
+
+def apply_input(engine, dx, dy):
+    """
+    Fonction appliquant une entrée d'un replay à la partie : un déplacement du joueur, ou l'application des pas
+    dus des minotaures (MINOTAURS), calculés ici au lieu de l'être en arrière-plan.
+    :param engine: Partie rejouée (service.game_engine.GameEngine).
+    :param dx: Déplacement en direction de l'axe des X
+    :param dy: Déplacement en direction de l'axe des Y.
+    :return: Liste des cases (x, y) dont l'affichage a changé.
+    """
+    if (dx, dy) == MINOTAURS:
+        return engine.move_pending_minotaurs()
+    return engine.move_player(dx, dy)
+
+
+def play_replay(replay, level_path, path_finder=None):
+    """
+    Fonction rejouant une partie sans affichage.
+    :param replay: Replay à relire.
+    :param level_path: Chemin du niveau.
+    :param path_finder: Fonction de pathfinding du minotaure (par défaut celle de GameEngine).
+    :return: La partie rejouée (GameEngine), terminée.
+    """
+    clock = SimulatedClock()
+    engine = GameEngine.from_level_file(level_path, replay.timer_limit, path_finder=path_finder, clock=clock,
+                                        defer_minotaurs=replay.deferred)
+    engine.start()
+    for elapsed, dx, dy in replay.iter_inputs():
+        clock.now = elapsed
+        apply_input(engine, dx, dy)
+        if engine.is_over():
+            break
+    if not engine.is_over():
+        clock.now = replay.timer_limit
+        engine.check_timeout()
+    return engine
+
+
+def verify_replay(replay, level_path, path_finder=None):
+    """
+    Fonction vérifiant qu'un replay redonne la même partie avec les règles et le pathfinding actuels.
+    :return: True si l'issue, les déplacements et les erreurs sont identiques.
+    """
+    engine = play_replay(replay, level_path, path_finder)
+    return (engine.status, engine.moves, engine.blunders) == (replay.status, replay.moves, replay.blunders)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("replays", nargs="+", help="Fichiers .rpl à vérifier")
+    parser.add_argument("--levels", default="./ressources/levels", help="Répertoire des niveaux")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    start = time.perf_counter()
+    for path in args.replays:
+        try:
+            replay = Replay.load(path)
+        except ValueError as error:
+            print(f"{path} : {error}")
+            failures += 1
+            continue
+        level_path = find_level(replay, args.levels)
+        if level_path is None:
+            print(f"{path} : level {replay.level_name} not found or modified")
+            failures += 1
+        elif not verify_replay(replay, level_path):
+            print(f"{path} : replay diverges")
+            failures += 1
+    duration = time.perf_counter() - start
+
+    print(f"{len(args.replays)} replays verified in {duration:.2f} s "
+          f"({len(args.replays) / duration if duration else 0:.0f}/s), {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
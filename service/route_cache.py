@@ -0,0 +1,255 @@
+"""
+Cache des chemins du minotaure, placé devant le pathfinding à la demande (service.pathfinder).
+
+    * Les chemins déjà calculés sont gardés dans un cache LRU indexé par (départ, arrivée).
+    * Pour les petits niveaux (au plus TABLE_MAX_CELLS cases franchissables), une table de routage est calculée
+      au chargement : pour chaque arrivée possible, la case suivante depuis chaque case (uint16). Chaque pas du
+      minotaure est alors une simple lecture dans la table. Dans le jeu, elle est calculée dans un thread
+      (jusqu'à 0,3 s près de la limite) ; les chemins sont cherchés à la demande tant qu'elle n'est pas prête.
+    * Pour les autres niveaux, les chemins sont calculés à la demande avec un champ de distances (DistanceField).
+
+Les chemins sont identiques à ceux du moteur "distance_field" : à distance égale, la case suivante est choisie
+dans le même ordre (gauche, droite, haut, bas). Les replays enregistrés avec l'un se relisent avec l'autre.
+"""
+import threading
+from array import array
+from collections import OrderedDict
+
+from domain.grid import WALKABLE
+from service.pathfinder import DistanceField
+from utils import instrumentation
+
+TABLE_MAX_CELLS = 1024  # Nombre maximal de cases franchissables pour calculer la table de routage
+CACHE_SIZE = 1024  # Nombre de chemins gardés dans le cache LRU
+MAX_CACHED_PATH = 10000  # Les chemins plus longs (grands niveaux) ne sont pas gardés en cache
+NO_ROUTE = 0xFFFF  # Valeur de la table pour une case sans case suivante (arrivée ou case inatteignable)
+
+# Table de traduction code de tuile → 1 si la case est franchissable (utilisée avec bytes.translate)
+_walkable_table = bytes(WALKABLE) + bytes(256 - len(WALKABLE))
+
+
+@instrumentation.timed("route_table")
+def build_routes(walkable, width):
+    """
+    Fonction calculant la table de routage d'une grille : un BFS depuis chaque case franchissable, puis pour
+    chaque case la première voisine (gauche, droite, haut, bas) plus proche de l'arrivée.
+    N'utilise que ses paramètres : peut être appelée dans un thread.
+    :param walkable: Cases franchissables de la grille (un octet par case, 1 si franchissable).
+    :param width: Largeur de la grille.
+    :return: Tuple (numéro → index des cases franchissables, index → numéro de case (-1 si non franchissable),
+             table : une ligne par arrivée contenant le numéro de la case suivante depuis chaque case).
+    """
+    size = len(walkable)
+    cells = [idx for idx in range(size) if walkable[idx]]
+    cell_ids = array("i", [-1]) * size
+    for cell_id, idx in enumerate(cells):
+        cell_ids[idx] = cell_id
+
+    # Voisines franchissables de chaque case, dans l'ordre de choix de la case suivante
+    neighbors = []
+    for idx in cells:
+        x = idx % width
+        neighbors.append(tuple(cell_ids[neighbor] for neighbor in (idx - 1 if x > 0 else -1,
+                                                                   idx + 1 if x < width - 1 else -1,
+                                                                   idx - width,
+                                                                   idx + width)
+                               if 0 <= neighbor < size and cell_ids[neighbor] != -1))
+
+    count = len(cells)
+    table = array("H")
+    for goal in range(count):
+        distances = [-1] * count
+        distances[goal] = 0
+        frontier = [goal]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for current in frontier:
+                for neighbor in neighbors[current]:
+                    if distances[neighbor] == -1:
+                        distances[neighbor] = distance
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        row = array("H", [NO_ROUTE]) * count
+        for current in range(count):
+            closer = distances[current] - 1
+            if closer >= 0:
+                for neighbor in neighbors[current]:
+                    if distances[neighbor] == closer:
+                        row[current] = neighbor
+                        break
+        table += row
+    return cells, cell_ids, table
+
+
+class RouteCache:
+    """
+    Moteur de pathfinding avec cache. Même contrat que service.pathfinder.find_path (voir find_path).
+    Le cache et la table ne dépendent que des cases franchissables : ils sont gardés tant que la grille a les
+    mêmes cases franchissables. Si une case d'une grille déjà utilisée devient (in)franchissable, appeler
+    invalidate.
+    """
+
+    def __init__(self, table_max_cells=TABLE_MAX_CELLS, cache_size=CACHE_SIZE):
+        """
+        Constructeur de la classe RouteCache.
+        :param table_max_cells: Nombre maximal de cases franchissables pour calculer la table de routage
+                                (0 pour toujours chercher les chemins à la demande).
+        :param cache_size: Nombre de chemins gardés dans le cache LRU.
+        """
+        self.table_max_cells = table_max_cells
+        self.cache_size = cache_size
+        self.grid = None
+        self.walkable = None        # Cases franchissables de la grille préparée (un octet par case)
+        self.paths = OrderedDict()  # (départ, arrivée) → chemin (tuple de positions)
+        self.field = DistanceField()
+        self.cell_ids = None        # Index de case → numéro de case franchissable (-1 si non franchissable)
+        self.cells = None           # Numéro de case franchissable → index de case
+        self.table = None           # Ligne par arrivée : numéro de la case suivante depuis chaque case
+        self.build_token = None     # Identifie le calcul de table en cours (les calculs abandonnés sont ignorés)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if instrumentation.enabled:
+            instrumentation.stats.add_source("route_cache", self.stats)
+
+    def invalidate(self):
+        """
+        Méthode à appeler lorsque le caractère franchissable d'une case de la grille a changé.
+        :return: NONE
+        """
+        self.grid = None
+        self.walkable = None
+        self.paths.clear()
+        self.field.invalidate()
+        with self.lock:
+            self.build_token = None
+            self.table = self.cell_ids = self.cells = None
+
+    def prepare(self, tiles_map, background=False):
+        """
+        Méthode préparant le cache pour une grille : la table de routage est calculée pour un petit niveau.
+        Sans effet si une grille ayant les mêmes cases franchissables est déjà préparée.
+        :param tiles_map: Grille du niveau (domain.grid.Grid)
+        :param background: True pour calculer la table dans un thread (voir build_table).
+        :return: NONE
+        """
+        if tiles_map is self.grid:
+            return
+        walkable = bytes(tiles_map.cells).translate(_walkable_table)
+        if self.grid is not None and walkable == self.walkable and tiles_map.width == self.grid.width:
+            # Même terrain (par exemple la copie de la grille faite par la partie) : tout est gardé
+            self.grid = tiles_map
+            return
+
+        self.invalidate()
+        self.grid = tiles_map
+        self.walkable = walkable
+        if walkable.count(1) <= self.table_max_cells:
+            self.build_table(background)
+
+    def build_table(self, background=False):
+        """
+        Méthode calculant la table de routage de la grille préparée (voir build_routes).
+        :param background: True pour la calculer dans un thread : les chemins sont cherchés à la demande
+                           tant qu'elle n'est pas prête.
+        :return: NONE
+        """
+        walkable, width = self.walkable, self.grid.width
+        token = self.build_token = object()
+
+        def work():
+            routes = build_routes(walkable, width)
+            with self.lock:
+                # Table ignorée si la grille a changé pendant le calcul (voir invalidate)
+                if self.build_token is token:
+                    # La table est affectée en dernier : elle n'est utilisée qu'une fois cells et cell_ids prêts
+                    self.cells, self.cell_ids, self.table = routes
+
+        if background:
+            threading.Thread(target=work, name="route-table", daemon=True).start()
+        else:
+            work()
+
+    @instrumentation.timed("find_path", size=len)
+    def find_path(self, tiles_map, start, goal):
+        """
+        Méthode calculant le chemin de start vers goal : cache LRU, puis table de routage ou recherche à la demande.
+        Même signature et même contrat que service.pathfinder.find_path (mêmes mesures find_path et
+        find_path.nodes : cases lues dans la table, aucune pour un chemin en cache).
+
+        :param tiles_map: Grille du niveau (domain.grid.Grid)
+        :param start: Position de départ (x, y)
+        :param goal: Position d'arrivée (x, y)
+        :return: Une liste de positions pour atteindre le but sans comprendre le départ.
+                 Liste vide si pas de path trouvé.
+        """
+        self.prepare(tiles_map)
+        key = (start, goal)
+        path = self.paths.get(key)
+        if path is not None:
+            self.hits += 1
+            self.paths.move_to_end(key)
+            if instrumentation.enabled:
+                instrumentation.observe("find_path.nodes", 0)
+            return list(path)
+
+        self.misses += 1
+        path = self.table_path(start, goal)
+        if path is None:
+            path = self.field.descend(tiles_map, start, goal)
+        elif instrumentation.enabled:
+            instrumentation.observe("find_path.nodes", len(path))
+        if len(path) <= MAX_CACHED_PATH:
+            self.paths[key] = tuple(path)
+            if len(self.paths) > self.cache_size:
+                self.paths.popitem(last=False)
+        return path
+
+    def table_path(self, start, goal):
+        """
+        Méthode reconstruisant un chemin en suivant la table de routage.
+        :return: Le chemin, ou None si la table n'est pas prête ou si le départ ou l'arrivée n'est pas une case
+                 franchissable de la table.
+        """
+        table = self.table
+        if table is None:
+            return None
+        width = self.grid.width
+        start_id = self.cell_ids[start[1] * width + start[0]]
+        goal_id = self.cell_ids[goal[1] * width + goal[0]]
+        if start_id == -1 or goal_id == -1:
+            return None
+
+        row = goal_id * len(self.cells)
+        cells = self.cells
+        path = []
+        current = start_id
+        while current != goal_id:
+            current = table[row + current]
+            if current == NO_ROUTE:
+                return []
+            idx = cells[current]
+            path.append((idx % width, idx // width))
+        return path
+
+    def stats(self):
+        """
+        Méthode retournant les statistiques du cache : succès, échecs, chemins gardés et mémoire estimée (octets)
+        de la table de routage et des chemins.
+        :return: Dictionnaire des statistiques.
+        """
+        table_memory = 0
+        if self.table is not None:
+            table_memory = (len(self.table) * self.table.itemsize + len(self.cell_ids) * self.cell_ids.itemsize
+                            + len(self.cells) * 8)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "paths": len(self.paths),
+            "paths_memory": sum(len(path) for path in self.paths.values()) * 8,
+            "table_cells": len(self.cells) if self.cells is not None else 0,
+            "table_memory": table_memory
+        }
@@ -0,0 +1,215 @@
+"""
+Simulation en masse de parties sur un répertoire de niveaux, sans interface graphique.
+
+Chaque niveau est joué `--runs` fois par chaque profil de joueur :
+    * optimal : suit toujours le plus court chemin vers la sortie ;
+    * random  : choisit une direction au hasard à chaque coup ;
+    * un nombre entre 0 et 1 : taux d'erreur, probabilité de jouer un coup au hasard au lieu du coup optimal.
+Chaque coup dure `--move-time` secondes de temps simulé, la partie est perdue au-delà de `--timer` secondes.
+
+Utilisation (depuis la racine du projet) :
+    python -m service.simulation ressources/levels --runs 10000 --players optimal random 0.1 --output stats.csv
+"""
+import argparse
+import csv
+import json
+import random
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from domain.grid import WALKABLE
+from service.game_engine import GameEngine, SimulatedClock, WON, CAUGHT, TIMEOUT
+from service.level_parser import load_parsed_level
+from service.load_level import get_levels
+from service.pathfinder import DistanceField
+
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+PLAYER_PROFILES = {"optimal": 0.0, "random": 1.0}
+GAMES_PER_TASK = 500  # Nombre de parties simulées par tâche envoyée au pool de processus
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def simulate_games(level_path, error_rate, runs, timer_limit, move_time, seed):
+    """
+    Fonction simulant plusieurs parties d'un niveau avec un profil de joueur.
+    :param level_path: Chemin du fichier du niveau.
+    :param error_rate: Probabilité de jouer un coup au hasard (0 : joueur optimal, 1 : marche aléatoire).
+    :param runs: Nombre de parties à simuler.
+    :param timer_limit: Temps maximal d'une partie en secondes.
+    :param move_time: Durée simulée d'un coup en secondes.
+    :param seed: Graine du générateur aléatoire.
+    :return: Dictionnaire des résultats bruts (nombre de parties par issue, totaux, temps de sortie).
+    """
+    parsed = load_parsed_level(level_path)
+    grid = parsed.grid
+    width = grid.width
+    rng = random.Random(seed)
+
+    # Distances à la sortie, calculées une fois : le joueur optimal descend ce champ.
+    exit_field = DistanceField()
+    exit_field.reset(grid, parsed.get_exit())
+    exit_distances = exit_field.expand_all()
+
+    results = {"runs": runs, WON: 0, CAUGHT: 0, TIMEOUT: 0, "moves": 0, "blunders": 0, "exit_times": []}
+    # Sans durée de coup, une partie ne peut pas se terminer par le temps : elle est arrêtée après max_turns coups.
+    max_turns = len(exit_distances) * 4 if move_time <= 0 else None
+
+    for _ in range(runs):
+        clock = SimulatedClock()
+        engine = GameEngine(grid, parsed.get_player(), parsed.get_minotaurs(), timer_limit,
+                            path_finder=DistanceField().find_path, clock=clock, shared_grid=True)
+        engine.start()
+        turns = 0
+        while not engine.is_over():
+            if error_rate and rng.random() < error_rate:
+                dx, dy = rng.choice(DIRECTIONS)
+            else:
+                dx, dy = _optimal_direction(engine.player, exit_distances, engine.grid.cells, width)
+            clock.now += move_time
+            engine.move_player(dx, dy)
+            turns += 1
+            if max_turns is not None and turns >= max_turns:
+                engine.finish(TIMEOUT)
+
+        results[engine.status] += 1
+        results["moves"] += engine.moves
+        results["blunders"] += engine.blunders
+        if engine.status == WON:
+            results["exit_times"].append(engine.elapsed())
+    return results
+
+
+def _optimal_direction(player, exit_distances, cells, width):
+    """
+    Retourne la direction qui rapproche le plus le joueur de la sortie.
+    """
+    x, y = player
+    best = DIRECTIONS[0]
+    best_distance = -1
+    for dx, dy in DIRECTIONS:
+        nx, ny = x + dx, y + dy
+        idx = ny * width + nx
+        if not (0 <= nx < width and 0 <= idx < len(exit_distances)) or not WALKABLE[cells[idx]]:
+            continue
+        distance = exit_distances[idx]
+        if distance != -1 and (best_distance == -1 or distance < best_distance):
+            best = (dx, dy)
+            best_distance = distance
+    return best
+
+
+def _simulate_task(task):
+    """
+    Fonction exécutée par les processus du pool (les arguments sont regroupés pour executor.map).
+    """
+    level_path, player, *arguments = task
+    return (level_path, player), simulate_games(level_path, *arguments)
+
+
+def aggregate(level_name, player_name, partials):
+    """
+    Fonction regroupant les résultats bruts de plusieurs tâches en statistiques.
+    :param level_name: Nom du niveau.
+    :param player_name: Nom du profil de joueur.
+    :param partials: Liste des résultats retournés par simulate_games.
+    :return: Dictionnaire des statistiques.
+    """
+    runs = sum(p["runs"] for p in partials)
+    exit_times = sorted(t for p in partials for t in p["exit_times"])
+    stats = {
+        "level": level_name,
+        "player": player_name,
+        "runs": runs,
+        "win_rate": sum(p[WON] for p in partials) / runs,
+        "catch_rate": sum(p[CAUGHT] for p in partials) / runs,
+        "timeout_rate": sum(p[TIMEOUT] for p in partials) / runs,
+        "mean_moves": sum(p["moves"] for p in partials) / runs,
+        "mean_blunders": sum(p["blunders"] for p in partials) / runs,
+        "mean_exit_time": statistics.fmean(exit_times) if exit_times else None
+    }
+    for percentile in PERCENTILES:
+        stats[f"exit_time_p{percentile}"] = (
+            exit_times[min(len(exit_times) - 1, len(exit_times) * percentile // 100)] if exit_times else None
+        )
+    return stats
+
+
+def run_simulations(levels_dir, runs, players, timer_limit=20, move_time=0.2, seed=0, max_workers=None):
+    """
+    Fonction simulant toutes les parties demandées en répartissant le travail sur un pool de processus.
+    :param levels_dir: Répertoire des niveaux.
+    :param runs: Nombre de parties par niveau et par profil de joueur.
+    :param players: Liste de profils ("optimal", "random" ou taux d'erreur sous forme de texte).
+    :param timer_limit: Temps maximal d'une partie en secondes.
+    :param move_time: Durée simulée d'un coup en secondes.
+    :param seed: Graine de base des générateurs aléatoires.
+    :param max_workers: Nombre de processus (par défaut : nombre de cœurs).
+    :return: Liste des statistiques, une entrée par niveau et par profil de joueur.
+    """
+    levels = get_levels(levels_dir)
+    tasks = []
+    for level in levels:
+        for player in players:
+            error_rate = PLAYER_PROFILES[player] if player in PLAYER_PROFILES else float(player)
+            for start in range(0, runs, GAMES_PER_TASK):
+                tasks.append((level.get_level_path(), player, error_rate, min(GAMES_PER_TASK, runs - start),
+                              timer_limit, move_time, seed + len(tasks)))
+
+    partials = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for (level_path, player), result in executor.map(_simulate_task, tasks):
+            partials.setdefault((level_path, player), []).append(result)
+
+    return [aggregate(level.name, player, partials[(level.get_level_path(), player)])
+            for level in levels for player in players]
+
+
+def write_stats(stats, output_path):
+    """
+    Procédure écrivant les statistiques en CSV ou en JSON selon l'extension du fichier.
+    :param stats: Liste des statistiques (voir run_simulations).
+    :param output_path: Chemin du fichier à écrire (.csv ou .json), "-" pour la sortie standard en JSON.
+    :return: NONE
+    """
+    if output_path == "-":
+        json.dump(stats, sys.stdout, indent=2)
+        print()
+    elif output_path.endswith(".csv"):
+        with open(output_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(stats[0]) if stats else [])
+            writer.writeheader()
+            writer.writerows(stats)
+    else:
+        with open(output_path, "w") as file:
+            json.dump(stats, file, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("levels_dir", help="Répertoire des niveaux")
+    parser.add_argument("--runs", type=int, default=1000, help="Parties par niveau et par profil de joueur")
+    parser.add_argument("--players", nargs="+", default=["optimal", "random", "0.1"])
+    parser.add_argument("--timer", type=float, default=20, help="Temps maximal d'une partie (s)")
+    parser.add_argument("--move-time", type=float, default=0.2, help="Durée simulée d'un coup (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--output", default="-", help="Fichier .csv ou .json (défaut : JSON sur la sortie standard)")
+    args = parser.parse_args(argv)
+
+    for player in args.players:
+        if player not in PLAYER_PROFILES:
+            try:
+                if not 0 <= float(player) <= 1:
+                    raise ValueError
+            except ValueError:
+                parser.error(f"invalid player profile : {player}")
+
+    stats = run_simulations(args.levels_dir, args.runs, args.players, args.timer, args.move_time,
+                            args.seed, args.workers)
+    write_stats(stats, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
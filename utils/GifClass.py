@@ -1,28 +1,48 @@
-from tkinter import Label, Image
+from tkinter import Label
 
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
+
+from utils.scheduler import scheduler
+
+FRAME_INTERVAL = 0.1  # Intervalle (s) entre deux images du gif
 
 
 # Stackoverflow
 class AnimatedGIF(Label):
     """
     Classe permettant d'avoir des Gif animés dans Tkinter.
+    Les images du gif sont décodées une par une, lors de leur premier affichage.
+    L'animation est cadencée par le scheduler partagé et s'arrête tant que le widget n'est pas visible.
     """
     def __init__(self, parent, gif_path, bg_color="green"):
         super().__init__(parent, bg=bg_color)
-        self.frames = []
+        self.gif = Image.open(gif_path)
+        # Images du gif déjà converties (None tant qu'une image n'a pas été affichée)
+        self.frames = [None] * getattr(self.gif, "n_frames", 1)
         self.idx = 0
-        gif = Image.open(gif_path)
-        # Récupérer les images du gif et les transformer en liste d'images
-        for frame in ImageSequence.Iterator(gif):
-            self.frames.append(ImageTk.PhotoImage(frame.copy()))
-        self.update_frame()
+        self.subscription = scheduler.subscribe(self.update_frame, FRAME_INTERVAL, widget=self)
+
+    def get_frame(self, idx):
+        """
+        Méthode retournant l'image du gif à l'index donné, décodée au besoin.
+        :param idx: Index de l'image dans le gif.
+        :return: L'image compatible avec Tkinter.
+        """
+        if self.frames[idx] is None:
+            self.gif.seek(idx)
+            self.frames[idx] = ImageTk.PhotoImage(self.gif.copy())
+            if all(self.frames):
+                # Toutes les images sont décodées : le fichier n'est plus nécessaire.
+                self.gif.close()
+        return self.frames[idx]
 
-    def update_frame(self):
+    def update_frame(self, elapsed=1):
         """
-        Méthode permettant de mettre à jour l'image affichée du GIF toutes les 100 ms.
+        Méthode permettant de mettre à jour l'image affichée du GIF (appelée par le scheduler).
+        :param elapsed: Nombre d'images écoulées depuis l'appel précédent : l'animation garde le rythme
+                        même si des échéances ont été manquées.
         :return: NONE
         """
-        self.configure(image=self.frames[self.idx])
+        self.idx = (self.idx + elapsed - 1) % len(self.frames)
+        self.configure(image=self.get_frame(self.idx))
         self.idx = (self.idx + 1) % len(self.frames)
-        self.after(100, self.update_frame)
\ No newline at end of file
@@ -0,0 +1,168 @@
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from utils import instrumentation
+
+ATLAS_PATH = "./ressources/images/atlas.png"
+SPRITE_SIZE = 32  # Taille (en pixels) des sprites dans l'atlas
+# Ordre des sprites dans l'atlas (de gauche à droite) et fichiers d'origine utilisés pour le (re)construire
+SPRITES = (
+    ("bush", "./ressources/images/bush.png"),
+    ("exit", "./ressources/images/exit.png"),
+    ("exitWithPlayer", "./ressources/images/exitWithPlayer.png"),
+    ("floor", "./ressources/images/floor.png"),
+    ("minotaur", "./ressources/images/minotaur.png"),
+    ("player", "./ressources/images/player.png"),
+    ("icon", "./ressources/images/game_menu/minotaur.png"),
+)
+CACHE_SIZE = 128  # Nombre de variantes redimensionnées gardées en mémoire (par type d'image)
+
+
+class AssetManager:
+    """
+    Classe centralisant le chargement des sprites du jeu.
+    Tous les sprites sont lus une seule fois depuis un atlas, puis les variantes redimensionnées sont gardées
+    dans un cache LRU indexé par la taille : un changement de TILE_SIZE ou de zoom ne relit pas les fichiers.
+    """
+
+    def __init__(self, atlas_path=ATLAS_PATH, cache_size=CACHE_SIZE):
+        """
+        Constructeur de la classe AssetManager.
+        :param atlas_path: Chemin de l'atlas (les fichiers d'origine sont utilisés s'il n'existe pas).
+        :param cache_size: Nombre maximal de variantes gardées en cache.
+        """
+        self.atlas_path = atlas_path
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._sprites = None            # nom → image Pillow à la taille d'origine
+        self._images = OrderedDict()    # (nom, taille) → image Pillow redimensionnée
+        self._photos = OrderedDict()    # (nom, taille) → PhotoImage (créées dans le thread de Tk uniquement)
+        self._lock = threading.RLock()
+
+    def _load_sprites(self):
+        """
+        Méthode chargeant tous les sprites depuis l'atlas (une seule fois).
+        :return: Dictionnaire nom → image Pillow.
+        """
+        with self._lock:
+            if self._sprites is None:
+                sprites = {}
+                if os.path.isfile(self.atlas_path):
+                    with Image.open(self.atlas_path) as atlas:
+                        atlas = atlas.convert("RGBA")
+                    for index, (name, _) in enumerate(SPRITES):
+                        box = (index * SPRITE_SIZE, 0, (index + 1) * SPRITE_SIZE, SPRITE_SIZE)
+                        sprites[name] = atlas.crop(box)
+                else:
+                    for name, path in SPRITES:
+                        with Image.open(path) as img:
+                            sprites[name] = img.convert("RGBA")
+                self._sprites = sprites
+            return self._sprites
+
+    def get_image(self, name, size=None):
+        """
+        Méthode retournant un sprite sous forme d'image Pillow, redimensionné si nécessaire.
+        L'image retournée est partagée : elle ne doit pas être modifiée.
+        :param name: Nom du sprite (voir SPRITES).
+        :param size: Tuple (largeur, hauteur), None pour la taille d'origine.
+        :return: L'image Pillow (RGBA).
+        """
+        sprite = self._load_sprites()[name]
+        key = (name, tuple(size) if size else sprite.size)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self.hits += 1
+                self._images.move_to_end(key)
+                return image
+            self.misses += 1
+            image = sprite if key[1] == sprite.size else sprite.resize(key[1])
+            self._store(self._images, key, image)
+            return image
+
+    def get_photo(self, name, size=None):
+        """
+        Méthode retournant un sprite sous forme de PhotoImage utilisable par Tkinter.
+        Doit être appelée depuis le thread de Tk ; la PhotoImage doit être gardée en référence par l'appelant.
+        :param name: Nom du sprite (voir SPRITES).
+        :param size: Tuple (largeur, hauteur), None pour la taille d'origine.
+        :return: La PhotoImage.
+        """
+        from PIL import ImageTk
+
+        image = self.get_image(name, size)
+        key = (name, image.size)
+        with self._lock:
+            photo = self._photos.get(key)
+            if photo is not None:
+                self._photos.move_to_end(key)
+                return photo
+            photo = ImageTk.PhotoImage(image)
+            self._store(self._photos, key, photo)
+            return photo
+
+    def _store(self, cache, key, value):
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def preload(self, sizes=((SPRITE_SIZE, SPRITE_SIZE),)):
+        """
+        Méthode chargeant l'atlas et préparant les variantes redimensionnées dans un thread en arrière-plan.
+        Seules les images Pillow sont préparées : les PhotoImage doivent être créées dans le thread de Tk.
+        :param sizes: Tailles à préparer pour chaque sprite.
+        :return: Le thread lancé.
+        """
+        def work():
+            for name, _ in SPRITES:
+                for size in sizes:
+                    self.get_image(name, size)
+
+        thread = threading.Thread(target=work, name="assets-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        """
+        Méthode retournant les statistiques du cache : succès, échecs, nombre d'images et mémoire estimée (octets).
+        :return: Dictionnaire des statistiques.
+        """
+        with self._lock:
+            images_memory = sum(img.width * img.height * len(img.getbands()) for img in self._images.values())
+            photos_memory = sum(width * height * 4 for _, (width, height) in self._photos)
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "images": len(self._images),
+                "photos": len(self._photos),
+                "memory": images_memory + photos_memory
+            }
+
+
+def build_atlas(atlas_path=ATLAS_PATH):
+    """
+    Procédure (re)construisant l'atlas à partir des fichiers d'origine des sprites.
+    :param atlas_path: Chemin de l'atlas à écrire.
+    :return: NONE
+    """
+    atlas = Image.new("RGBA", (SPRITE_SIZE * len(SPRITES), SPRITE_SIZE))
+    for index, (_, path) in enumerate(SPRITES):
+        with Image.open(path) as img:
+            atlas.paste(img.convert("RGBA").resize((SPRITE_SIZE, SPRITE_SIZE)), (index * SPRITE_SIZE, 0))
+    atlas.save(atlas_path)
+
+
+# Gestionnaire partagé par toute l'application
+assets = AssetManager()
+if instrumentation.enabled:
+    instrumentation.stats.add_source("assets", assets.stats)
+
+
+if __name__ == "__main__":
+    # Utilisation (depuis la racine du projet) : python -m utils.assets
+    build_atlas()
@@ -1,12 +1,20 @@
 from tkinter import Button
 
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from PIL import Image, ImageTk
+
+from utils import instrumentation
+from utils.thumbnails import thumbnails
+
+RESIZE_DELAY = 150  # Délai (ms) sans nouvel événement <Configure> avant de créer la miniature définitive
+POLL_DELAY = 30  # Intervalle (ms) de vérification de la fin de création d'une miniature
 
 
 # Source : https://python-forum.io/thread-34264.html & ChatGPT
 class ImageButton(Button):
     """
     Classe ImageButton qui permet d'avoir des images comme bouton sur Tkinter.
+    Les miniatures sont créées en arrière-plan (voir utils.thumbnails) ; pendant un redimensionnement,
+    une version rapide (moins belle) de l'image déjà affichée est utilisée.
     """
     def __init__(self, parent, image_path, label_text, command):
         """
@@ -17,46 +25,114 @@ class ImageButton(Button):
         :param command: Commande exécutée par le bouton lorsqu'il est pressé.
         """
         self.parent = parent
-        self.original_image = Image.open(image_path)
+        self.image_path = image_path
         self.label_text = label_text
         self.tk_image = None
+        self.shown_image = None   # Image Pillow actuellement affichée
+        self.target_size = None   # Dernière taille demandée
+        self.resize_job = None    # Redimensionnement en attente (after)
+        self.pending = None       # Miniature en cours de création (Future)
+        self.pending_key = None   # (chemin, taille, texte) de la miniature en cours de création
         self.command = command
         super().__init__(parent, command=command)
         self.configure(compound="top", bd=0)
         self.bind("<Configure>", self.resize_image)
 
+    @instrumentation.timed("resize_image")
     def resize_image(self, event):
         """
         Méthode permettant de redimensionner l'image pour l'affichage.
+        Les événements rapprochés sont regroupés : seule la dernière taille demandée est créée.
         :param event:
         :return: NONE
         """
-        new_width = event.width
-        new_height = event.height
+        new_size = (event.width, event.height)
+        if new_size[0] <= 0 or new_size[1] <= 0 or new_size == self.target_size:
+            return
+        self.target_size = new_size
 
-        if new_width > 0 and new_height > 0:
-            resized_image = self.original_image.resize((new_width, new_height), Image.LANCZOS)
-            draw = ImageDraw.Draw(resized_image)
-            try:
-                font_size = new_width // 8
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+        if self.show_cached():
+            return
 
-            # Permet de connaitre la taille de la bounding box
-            bbox = draw.textbbox((0, 0), self.label_text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+        # Image intermédiaire : redimensionnement rapide de l'image déjà affichée
+        if self.shown_image is not None:
+            interim = self.shown_image.resize(new_size, Image.NEAREST)
+            self.show(interim)
 
-            # Compute coordinates to center the text on the image
-            text_x = (new_width - text_width) // 2
-            text_y = (new_height - text_height) // 2
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(RESIZE_DELAY, self.request_thumbnail)
 
-            # Ecrire le texte sur l'image
-            draw.text((text_x, text_y), self.label_text, font=font, fill="red")
+    def rebind(self, image_path, label_text, command):
+        """
+        Méthode permettant de réutiliser le bouton pour une autre image (liste de niveaux virtualisée).
+        :param image_path: Chemin d'accès à la nouvelle image.
+        :param label_text: Nouveau texte du bouton-image.
+        :param command: Nouvelle commande du bouton.
+        :return: NONE
+        """
+        self.image_path = image_path
+        self.label_text = label_text
+        self.command = command
+        self.configure(command=command)
+        self.shown_image = None
+        self.configure(image="")
+        self.tk_image = self.image = None
+        if self.target_size is not None and not self.show_cached():
+            self.request_thumbnail()
 
-            # Conversion de l'image compatible avec Tkinter
-            self.tk_image = ImageTk.PhotoImage(resized_image)
-            self.configure(image=self.tk_image)
-            self.image = self.tk_image
+    def show_cached(self):
+        """
+        Méthode affichant la miniature si elle est déjà en mémoire.
+        :return: True si la miniature a été affichée.
+        """
+        cached = thumbnails.get_cached(self.image_path, self.target_size, self.label_text)
+        if cached is not None:
+            self.show(cached)
+        return cached is not None
 
+    def request_thumbnail(self):
+        """
+        Méthode demandant la miniature à la taille voulue et attendant qu'elle soit prête.
+        :return: NONE
+        """
+        self.resize_job = None
+        if self.pending is None:
+            self.pending_key = (self.image_path, self.target_size, self.label_text)
+            self.pending = thumbnails.request(*self.pending_key)
+            self.after(POLL_DELAY, self.check_thumbnail)
+
+    def check_thumbnail(self):
+        """
+        Méthode vérifiant si la miniature demandée est prête et l'affichant le cas échéant.
+        Si la taille ou l'image ont changé entre-temps, une nouvelle miniature est demandée.
+        :return: NONE
+        """
+        if not self.winfo_exists():
+            return
+        if not self.pending.done():
+            self.after(POLL_DELAY, self.check_thumbnail)
+            return
+
+        future, self.pending = self.pending, None
+        try:
+            thumbnail = future.result()
+        except OSError:
+            # Image illisible : le bouton reste sans image
+            return
+        if self.pending_key == (self.image_path, self.target_size, self.label_text):
+            self.show(thumbnail)
+        else:
+            self.request_thumbnail()
+
+    def show(self, image):
+        """
+        Méthode affichant une image Pillow dans le bouton.
+        :param image: Image à afficher.
+        :return: NONE
+        """
+        self.shown_image = image
+        # Conversion de l'image compatible avec Tkinter
+        self.tk_image = ImageTk.PhotoImage(image)
+        self.configure(image=self.tk_image)
+        self.image = self.tk_image
@@ -0,0 +1,197 @@
+"""
+Instrumentation des chemins critiques du jeu : histogrammes de durées et de tailles (p50 / p95 / p99) et compteurs.
+
+Activée par la variable d'environnement MINOTAUR_PROFILE (chemin du fichier JSON écrit à la fermeture du jeu,
+ou "1" pour DEFAULT_OUTPUT) ou par l'option --profile de main.py. Les options MINOTAUR_CPROFILE=1 et
+MINOTAUR_TRACEMALLOC=1 (--cprofile, --tracemalloc) ajoutent une capture cProfile / tracemalloc.
+
+L'instrumentation doit être activée avant l'import des modules instrumentés : lorsqu'elle est désactivée,
+les décorateurs retournent la fonction d'origine et les autres points de mesure se limitent à un test
+de `instrumentation.enabled`.
+"""
+import atexit
+import functools
+import json
+import os
+import time
+from collections import deque
+
+ENV_VAR = "MINOTAUR_PROFILE"
+CPROFILE_ENV_VAR = "MINOTAUR_CPROFILE"
+TRACEMALLOC_ENV_VAR = "MINOTAUR_TRACEMALLOC"
+DEFAULT_OUTPUT = "minotaur_profile.json"
+MAX_SAMPLES = 10000  # Nombre de mesures gardées par histogramme (les plus récentes)
+TRACEMALLOC_TOP = 20  # Nombre de lignes d'allocation les plus coûteuses gardées dans le rapport
+
+enabled = False
+
+
+class Histogram:
+    """
+    Classe gardant les dernières mesures d'une grandeur ainsi que leur nombre et leur somme totale.
+    """
+    __slots__ = ("samples", "count", "total", "last")
+
+    def __init__(self):
+        self.samples = deque(maxlen=MAX_SAMPLES)
+        self.count = 0
+        self.total = 0.0
+        self.last = None
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.last = value
+
+    def summary(self):
+        """
+        Méthode retournant le résumé de l'histogramme (percentiles calculés sur les mesures gardées).
+        :return: Dictionnaire count, mean, p50, p95, p99, max, last.
+        """
+        samples = sorted(self.samples)
+        if not samples:
+            return {"count": 0}
+
+        def percentile(value):
+            return samples[min(len(samples) - 1, len(samples) * value // 100)]
+
+        return {"count": self.count, "mean": self.total / self.count, "p50": percentile(50),
+                "p95": percentile(95), "p99": percentile(99), "max": samples[-1], "last": self.last}
+
+
+class Stats:
+    """
+    Classe regroupant les histogrammes (durées en millisecondes, tailles) et les compteurs de la session.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.sources = {}  # nom → fonction retournant des statistiques à ajouter au rapport
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def record_time(self, name, seconds):
+        self.histogram(name + ".ms").add(seconds * 1000)
+
+    def observe(self, name, value):
+        self.histogram(name).add(value)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def last(self, name):
+        histogram = self.histograms.get(name)
+        return histogram.last if histogram is not None else None
+
+    def add_source(self, name, function):
+        """
+        Méthode ajoutant au rapport les statistiques d'un autre composant (scheduler, caches...).
+        :param name: Nom de la section du rapport.
+        :param function: Fonction sans paramètre retournant un dictionnaire.
+        :return: NONE
+        """
+        self.sources[name] = function
+
+    def snapshot(self):
+        """
+        Méthode retournant l'ensemble des statistiques sous une forme sérialisable en JSON.
+        :return: Dictionnaire des statistiques.
+        """
+        return {
+            "histograms": {name: histogram.summary() for name, histogram in sorted(self.histograms.items())},
+            "counters": dict(sorted(self.counters.items())),
+            **{name: function() for name, function in self.sources.items()}
+        }
+
+    def dump(self, path):
+        with open(path, "w") as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+
+stats = Stats()
+_clock = time.perf_counter
+
+
+def timed(name, size=None):
+    """
+    Décorateur enregistrant la durée de chaque appel dans l'histogramme `name`.ms.
+    Sans effet (la fonction d'origine est retournée) si l'instrumentation est désactivée.
+    :param name: Nom de la mesure.
+    :param size: Fonction optionnelle appliquée au résultat, enregistrée dans l'histogramme `name`.size.
+    :return: Le décorateur.
+    """
+    def decorator(function):
+        if not enabled:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = _clock()
+            result = function(*args, **kwargs)
+            stats.record_time(name, _clock() - start)
+            if size is not None:
+                stats.observe(name + ".size", size(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def observe(name, value):
+    stats.observe(name, value)
+
+
+def count(name, value=1):
+    stats.count(name, value)
+
+
+def enable(output=DEFAULT_OUTPUT, cprofile=False, trace_memory=False):
+    """
+    Procédure activant l'instrumentation et écrivant le rapport JSON à la fermeture du programme.
+    :param output: Chemin du rapport JSON (le profil cProfile est écrit à côté, avec l'extension .prof).
+    :param cprofile: True pour profiler toute la session avec cProfile.
+    :param trace_memory: True pour suivre les allocations avec tracemalloc.
+    :return: NONE
+    """
+    global enabled
+    if enabled:
+        return
+    enabled = True
+
+    profiler = None
+    if cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if trace_memory:
+        import tracemalloc
+
+        tracemalloc.start()
+
+    def write_report():
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(os.path.splitext(output)[0] + ".prof")
+        if trace_memory:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:TRACEMALLOC_TOP]
+            stats.add_source("tracemalloc", lambda: {
+                "current": current, "peak": peak,
+                "top": [{"line": str(stat.traceback), "size": stat.size, "count": stat.count} for stat in top]
+            })
+        stats.dump(output)
+
+    atexit.register(write_report)
+
+
+if os.environ.get(ENV_VAR):
+    enable(DEFAULT_OUTPUT if os.environ[ENV_VAR] == "1" else os.environ[ENV_VAR],
+           cprofile=bool(os.environ.get(CPROFILE_ENV_VAR)), trace_memory=bool(os.environ.get(TRACEMALLOC_ENV_VAR)))
@@ -0,0 +1,157 @@
+from tkinter import Frame, Scrollbar
+
+from utils.image_button import ImageButton
+
+COLUMNS = 3           # Nombre de colonnes de la grille de niveaux
+PADDING = 10          # Espace (en pixels) entre les boutons
+ROW_RATIO = 0.6       # Hauteur d'une ligne par rapport à la largeur d'une colonne
+SCROLL_UNIT = 40      # Défilement (en pixels) pour un cran de molette ou une flèche de la barre
+OVERSCAN_ROWS = 1     # Lignes supplémentaires préparées sous la zone visible
+
+
+class LevelBrowser(Frame):
+    """
+    Classe affichant une liste de niveaux défilante et virtualisée.
+    Seuls les boutons des lignes visibles existent : ils sont réutilisés (ImageButton.rebind) pendant le défilement,
+    et les miniatures sont créées en arrière-plan. Le coût d'ouverture ne dépend donc pas du nombre de niveaux.
+    """
+
+    def __init__(self, parent, command, columns=COLUMNS, padding=PADDING, row_ratio=ROW_RATIO, **kwargs):
+        """
+        Constructeur de la classe LevelBrowser.
+        :param parent: Parent qui va contenir la liste.
+        :param command: Fonction appelée avec le niveau choisi lorsque le joueur clique sur un bouton.
+        :param columns: Nombre de colonnes.
+        :param padding: Espace entre les boutons (en pixels).
+        :param row_ratio: Hauteur d'une ligne par rapport à la largeur d'une colonne.
+        """
+        super().__init__(parent, **kwargs)
+        self.command = command
+        self.columns = columns
+        self.padding = padding
+        self.row_ratio = row_ratio
+        self.levels = []
+        self.offset = 0           # Défilement courant (en pixels)
+        self.pool = []            # Boutons réutilisables
+        self.slots = {}           # bouton → index du niveau affiché
+        self.layout_job = None    # Mise en page en attente (after_idle)
+
+        self.viewport = Frame(self, bg=kwargs.get("bg"))
+        self.scrollbar = Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.viewport.bind("<Configure>", lambda event: self.schedule_layout())
+        # Molette (Windows / macOS : <MouseWheel>, X11 : boutons 4 et 5) sur toute la fenêtre du menu
+        toplevel = self.winfo_toplevel()
+        toplevel.bind("<MouseWheel>", lambda event: self.scroll_by(-SCROLL_UNIT * (1 if event.delta > 0 else -1)), add="+")
+        toplevel.bind("<Button-4>", lambda event: self.scroll_by(-SCROLL_UNIT), add="+")
+        toplevel.bind("<Button-5>", lambda event: self.scroll_by(SCROLL_UNIT), add="+")
+
+    def set_levels(self, levels):
+        """
+        Méthode remplaçant la liste des niveaux affichés.
+        :param levels: Liste des niveaux (domain.level.Level).
+        :return: NONE
+        """
+        self.levels = list(levels)
+        self.offset = 0
+        self.slots.clear()
+        self.schedule_layout()
+
+    def add_levels(self, levels):
+        """
+        Méthode ajoutant des niveaux à la fin de la liste (chargement progressif).
+        :param levels: Niveaux à ajouter.
+        :return: NONE
+        """
+        self.levels.extend(levels)
+        self.schedule_layout()
+
+    def cell_size(self):
+        """
+        Méthode retournant la taille d'un bouton et la hauteur d'une ligne (espacement compris).
+        :return: Tuple (largeur, hauteur, hauteur de ligne).
+        """
+        width = max(1, (self.viewport.winfo_width() - self.padding * (self.columns + 1)) // self.columns)
+        height = max(1, int(width * self.row_ratio))
+        return width, height, height + self.padding
+
+    def content_height(self):
+        rows = -(-len(self.levels) // self.columns)
+        return rows * self.cell_size()[2] + self.padding
+
+    def schedule_layout(self):
+        """
+        Méthode regroupant les demandes de mise en page jusqu'au prochain passage de la boucle Tk.
+        :return: NONE
+        """
+        if self.layout_job is None:
+            self.layout_job = self.after_idle(self.layout)
+
+    def layout(self):
+        """
+        Méthode plaçant les boutons des lignes visibles et mettant à jour la barre de défilement.
+        Les boutons sortis de la zone visible sont réutilisés pour les niveaux qui y entrent.
+        :return: NONE
+        """
+        self.layout_job = None
+        viewport_height = self.viewport.winfo_height()
+        if viewport_height <= 1:
+            return
+        width, height, row_height = self.cell_size()
+        total_height = self.content_height()
+        self.offset = max(0, min(self.offset, total_height - viewport_height))
+
+        first_row = self.offset // row_height
+        visible_rows = viewport_height // row_height + 1 + OVERSCAN_ROWS
+        first = first_row * self.columns
+        last = min(len(self.levels), first + visible_rows * self.columns)
+
+        # Boutons libres : ceux dont le niveau n'est plus visible
+        wanted = set(range(first, last))
+        free = [button for button in self.pool if self.slots.get(button) not in wanted]
+        shown = {index: button for button, index in self.slots.items() if index in wanted}
+
+        for index in range(first, last):
+            button = shown.get(index)
+            if button is None:
+                button = free.pop() if free else self.create_button()
+                level = self.levels[index]
+                button.rebind(level.get_png_path(), level.get_name(), lambda lvl=level: self.command(lvl))
+                self.slots[button] = index
+            row, col = divmod(index, self.columns)
+            button.place(x=self.padding + col * (width + self.padding),
+                         y=self.padding + row * row_height - self.offset,
+                         width=width, height=height)
+
+        for button in free:
+            button.place_forget()
+            self.slots.pop(button, None)
+
+        self.scrollbar.set(self.offset / total_height, min(1.0, (self.offset + viewport_height) / total_height))
+
+    def create_button(self):
+        button = ImageButton(self.viewport, image_path=None, label_text="", command=None)
+        self.pool.append(button)
+        return button
+
+    def scroll_by(self, pixels):
+        self.offset += pixels
+        self.schedule_layout()
+
+    def on_scrollbar(self, action, value, unit=None):
+        """
+        Méthode appelée par la barre de défilement ("moveto" ou "scroll").
+        :param action: Type de défilement.
+        :param value: Position (moveto) ou nombre de pas (scroll).
+        :param unit: Unité du pas ("units" ou "pages").
+        :return: NONE
+        """
+        if action == "moveto":
+            self.offset = int(float(value) * self.content_height())
+        elif unit == "pages":
+            self.offset += int(value) * self.viewport.winfo_height()
+        else:
+            self.offset += int(value) * SCROLL_UNIT
+        self.schedule_layout()
@@ -0,0 +1,185 @@
+import time
+import traceback
+from collections import deque
+from tkinter import TclError
+
+from utils import instrumentation
+
+PAUSED_INTERVAL = 0.25  # Intervalle (s) de vérification de la visibilité des abonnés en pause
+JITTER_SAMPLES = 1000   # Nombre de mesures de retard gardées pour les statistiques
+
+
+class Subscription:
+    """
+    Classe représentant un abonné du TickScheduler : une fonction appelée à échéances fixes.
+    """
+
+    def __init__(self, callback, interval, widget, start, pause_hidden=True):
+        """
+        Constructeur de la classe Subscription.
+        :param callback: Fonction appelée à chaque échéance avec le nombre d'échéances écoulées depuis l'appel
+                         précédent (plus de 1 si des échéances ont été manquées).
+        :param interval: Intervalle entre deux échéances en secondes.
+        :param widget: Widget affichant le résultat (None si toujours actif). L'abonné est mis en pause tant que
+                       le widget n'est pas visible et supprimé quand le widget est détruit.
+        :param start: Instant de la première échéance.
+        :param pause_hidden: False pour continuer les appels quand le widget est caché (le widget sert alors
+                            seulement à arrêter l'abonnement quand il est détruit).
+        """
+        self.callback = callback
+        self.interval = interval
+        self.widget = widget
+        self.deadline = start
+        self.pause_hidden = pause_hidden
+        self.active = True
+        self.obscured = False  # Widget entièrement caché par une autre fenêtre (événement <Visibility>)
+        if widget is not None and pause_hidden:
+            widget.bind("<Visibility>", self.on_visibility, add="+")
+
+    def on_visibility(self, event):
+        self.obscured = event.state == "VisibilityFullyObscured"
+
+    def is_visible(self):
+        """
+        Méthode indiquant si le widget de l'abonné est affiché.
+        :return: True si l'abonné doit être appelé.
+        """
+        if self.widget is None or not self.pause_hidden:
+            return True
+        return bool(self.widget.winfo_viewable()) and not self.obscured
+
+    def cancel(self):
+        self.active = False
+
+
+class TickScheduler:
+    """
+    Classe centralisant les mises à jour périodiques de l'application (chronomètre, animations...).
+    Chaque abonné a des échéances fixes (début + k × intervalle) mesurées avec une horloge monotone :
+    les retards de la boucle Tk ne s'accumulent pas. Si des échéances sont manquées, elles sont sautées
+    (et comptées) et l'abonné est prévenu du nombre d'échéances écoulées.
+    Un seul `after` est programmé à la fois, pour la prochaine échéance de tous les abonnés.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Constructeur de la classe TickScheduler.
+        :param clock: Fonction retournant le temps courant en secondes (monotone).
+        """
+        self.clock = clock
+        self.root = None          # Fenêtre Tk principale (les `after` sont programmés sur elle)
+        self.subscribers = []
+        self.job = None           # Identifiant du `after` programmé
+        self.job_deadline = None  # Échéance visée par le `after` programmé
+        self.ticks = 0            # Nombre d'échéances traitées
+        self.missed = 0           # Nombre d'échéances sautées car dépassées
+        self.jitter = deque(maxlen=JITTER_SAMPLES)  # Retards (s) des derniers appels par rapport à leur échéance
+
+    def subscribe(self, callback, interval, widget=None, pause_hidden=True):
+        """
+        Méthode ajoutant un abonné appelé toutes les `interval` secondes, à partir de maintenant.
+        :param callback: Fonction appelée avec le nombre d'échéances écoulées (voir Subscription).
+        :param interval: Intervalle entre deux appels en secondes.
+        :param widget: Widget dont la visibilité conditionne les appels (optionnel, voir Subscription).
+        :param pause_hidden: False pour continuer les appels quand le widget est caché.
+        :return: L'abonnement (cancel() pour l'arrêter).
+        """
+        if self.root is None:
+            self.root = widget.nametowidget(".") if widget is not None else None
+        subscription = Subscription(callback, interval, widget, self.clock(), pause_hidden)
+        self.subscribers.append(subscription)
+        self.schedule()
+        return subscription
+
+    def attach(self, root):
+        """
+        Méthode indiquant la fenêtre Tk principale (nécessaire pour les abonnés sans widget).
+        :param root: Fenêtre Tk principale.
+        :return: NONE
+        """
+        self.root = root
+
+    def schedule(self):
+        """
+        Méthode programmant le `after` de la prochaine échéance (s'il n'est pas déjà programmé plus tôt).
+        :return: NONE
+        """
+        if not self.subscribers or self.root is None:
+            return
+        deadline = min(subscription.deadline for subscription in self.subscribers)
+        if self.job is not None:
+            if self.job_deadline <= deadline:
+                return
+            self.root.after_cancel(self.job)
+        delay = max(0, round((deadline - self.clock()) * 1000))
+        self.job_deadline = deadline
+        self.job = self.root.after(delay, self.tick)
+
+    @instrumentation.timed("scheduler_tick")
+    def tick(self):
+        """
+        Méthode appelée par la boucle Tk : appelle les abonnés dont l'échéance est atteinte.
+        Un abonné qui lève une exception est affiché puis arrêté ; les autres abonnés continuent.
+        :return: NONE
+        """
+        self.job = None
+        now = self.clock()
+        try:
+            for subscription in list(self.subscribers):
+                if not subscription.active or not self.widget_exists(subscription):
+                    self.subscribers.remove(subscription)
+                    continue
+                if now < subscription.deadline:
+                    continue
+                if not subscription.is_visible():
+                    # En pause : pas d'appel, la visibilité est revérifiée plus tard
+                    subscription.deadline = now + PAUSED_INTERVAL
+                    continue
+
+                # Échéances écoulées depuis l'appel précédent (les échéances manquées sont sautées)
+                elapsed = int((now - subscription.deadline) // subscription.interval) + 1
+                self.jitter.append(now - subscription.deadline)
+                self.ticks += 1
+                self.missed += elapsed - 1
+                subscription.deadline += elapsed * subscription.interval
+                try:
+                    subscription.callback(elapsed)
+                except Exception:
+                    print("Scheduler ERROR : subscriber stopped after an exception")
+                    traceback.print_exc()
+                    subscription.cancel()
+        finally:
+            # Le `after` suivant est toujours programmé : c'est le seul pour tous les abonnés
+            self.subscribers = [subscription for subscription in self.subscribers if subscription.active]
+            self.schedule()
+
+    @staticmethod
+    def widget_exists(subscription):
+        if subscription.widget is None:
+            return True
+        try:
+            return bool(subscription.widget.winfo_exists())
+        except TclError:
+            return False
+
+    def stats(self):
+        """
+        Méthode retournant les statistiques du scheduler : échéances traitées, échéances manquées et
+        retard des appels par rapport à leur échéance (moyenne, p95 et maximum, en millisecondes).
+        :return: Dictionnaire des statistiques.
+        """
+        jitter = sorted(self.jitter)
+        return {
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "subscribers": len(self.subscribers),
+            "jitter_mean_ms": sum(jitter) / len(jitter) * 1000 if jitter else 0.0,
+            "jitter_p95_ms": jitter[min(len(jitter) - 1, len(jitter) * 95 // 100)] * 1000 if jitter else 0.0,
+            "jitter_max_ms": jitter[-1] * 1000 if jitter else 0.0
+        }
+
+
+# Scheduler partagé par toute l'application
+scheduler = TickScheduler()
+if instrumentation.enabled:
+    instrumentation.stats.add_source("scheduler", scheduler.stats)
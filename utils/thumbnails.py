@@ -0,0 +1,206 @@
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from PIL import Image
+
+THUMBNAIL_DIR_NAME = ".thumbnails"  # Répertoire des miniatures, créé à côté des images d'origine
+MEMORY_CACHE_SIZE = 256  # Nombre de miniatures gardées en mémoire
+WORKERS = 2  # Nombre de threads qui décodent et redimensionnent les images
+DISK_SIZES_PER_IMAGE = 4  # Nombre de miniatures gardées sur le disque pour chaque image (tailles de fenêtre récentes)
+
+
+@lru_cache(maxsize=32)
+def get_font(size):
+    """
+    Fonction retournant la police utilisée pour le texte des miniatures, chargée une seule fois par taille.
+    :param size: Taille de la police.
+    :return: La police (police par défaut de Pillow si arial.ttf est introuvable).
+    """
+    # Modules de dessin importés à la première miniature seulement (démarrage plus rapide)
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def draw_label(image, label_text):
+    """
+    Procédure écrivant le texte au centre de l'image.
+    :param image: Image Pillow (modifiée).
+    :param label_text: Texte à écrire.
+    :return: NONE
+    """
+    from PIL import ImageDraw
+
+    draw = ImageDraw.Draw(image)
+    font = get_font(max(1, image.width // 8))
+
+    # Permet de connaitre la taille de la bounding box
+    bbox = draw.textbbox((0, 0), label_text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # Compute coordinates to center the text on the image
+    text_x = (image.width - text_width) // 2
+    text_y = (image.height - text_height) // 2
+
+    # Ecrire le texte sur l'image
+    draw.text((text_x, text_y), label_text, font=font, fill="red")
+
+
+def render_thumbnail(image_path, size, label_text, resample=Image.LANCZOS):
+    """
+    Fonction créant la miniature d'une image avec son texte.
+    :param image_path: Chemin de l'image d'origine.
+    :param size: Tuple (largeur, hauteur) de la miniature.
+    :param label_text: Texte écrit au centre de la miniature.
+    :param resample: Filtre de redimensionnement de Pillow.
+    :return: La miniature (image Pillow RGBA).
+    """
+    with Image.open(image_path) as original:
+        # draft permet au décodeur JPEG de ne décoder qu'à la taille utile (sans effet pour les PNG)
+        original.draft("RGB", size)
+        thumbnail = original.convert("RGBA").resize(size, resample)
+    draw_label(thumbnail, label_text)
+    return thumbnail
+
+
+class ThumbnailCache:
+    """
+    Classe gérant les miniatures des boutons-images : cache LRU en mémoire, cache sur disque indexé par la date
+    de modification de l'image d'origine, et création des miniatures dans des threads en arrière-plan.
+    Le disque ne garde que les DISK_SIZES_PER_IMAGE dernières miniatures créées pour chaque image.
+    """
+
+    def __init__(self, memory_size=MEMORY_CACHE_SIZE, use_disk=True, workers=WORKERS):
+        """
+        Constructeur de la classe ThumbnailCache.
+        :param memory_size: Nombre de miniatures gardées en mémoire.
+        :param use_disk: True pour enregistrer les miniatures sur le disque.
+        :param workers: Nombre de threads de création des miniatures.
+        """
+        self.memory_size = memory_size
+        self.use_disk = use_disk
+        self.workers = workers
+        self._memory = OrderedDict()  # (chemin, taille, texte) → miniature
+        self._lock = threading.Lock()
+        self._executor = None
+        self._disk_index = {}  # Répertoire des miniatures → {nom de l'image: fichiers, du plus ancien au plus récent}
+
+    def get_cached(self, image_path, size, label_text):
+        """
+        Méthode retournant la miniature si elle est déjà en mémoire (sans accès disque, utilisable dans le thread de Tk).
+        :return: La miniature ou None.
+        """
+        key = (image_path, tuple(size), label_text)
+        with self._lock:
+            thumbnail = self._memory.get(key)
+            if thumbnail is not None:
+                self._memory.move_to_end(key)
+            return thumbnail
+
+    def request(self, image_path, size, label_text):
+        """
+        Méthode demandant la miniature à un thread en arrière-plan.
+        :param image_path: Chemin de l'image d'origine.
+        :param size: Tuple (largeur, hauteur) de la miniature.
+        :param label_text: Texte écrit au centre de la miniature.
+        :return: Un Future dont le résultat est la miniature (image Pillow).
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="thumbnails")
+        return self._executor.submit(self.get, image_path, tuple(size), label_text)
+
+    def get(self, image_path, size, label_text):
+        """
+        Méthode retournant la miniature depuis la mémoire, le disque, ou en la créant.
+        :return: La miniature (image Pillow).
+        """
+        thumbnail = self.get_cached(image_path, size, label_text)
+        if thumbnail is not None:
+            return thumbnail
+
+        disk_path = self._disk_path(image_path, size, label_text) if self.use_disk else None
+        if disk_path and os.path.isfile(disk_path):
+            with Image.open(disk_path) as cached:
+                thumbnail = cached.convert("RGBA")
+        else:
+            thumbnail = render_thumbnail(image_path, size, label_text)
+            if disk_path:
+                self._save(thumbnail, disk_path)
+
+        with self._lock:
+            self._memory[(image_path, tuple(size), label_text)] = thumbnail
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return thumbnail
+
+    def _disk_path(self, image_path, size, label_text):
+        """
+        Retourne le chemin de la miniature sur le disque ; il change avec la date de modification de l'image.
+        """
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+        name = os.path.splitext(os.path.basename(image_path))[0]
+        text_key = zlib.crc32(label_text.encode("utf-8"))
+        directory = os.path.join(os.path.dirname(image_path), THUMBNAIL_DIR_NAME)
+        return os.path.join(directory, f"{name}@{size[0]}x{size[1]}@{mtime}@{text_key:08x}.png")
+
+    def _disk_files(self, directory):
+        """
+        Retourne l'index des miniatures d'un répertoire, lu sur le disque une seule fois (appelée avec self._lock).
+        """
+        index = self._disk_index.get(directory)
+        if index is None:
+            index = {}
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.stat().st_mtime_ns)
+            except OSError:
+                entries = []
+            for entry in entries:
+                parts = entry.name.rsplit("@", 3)
+                if len(parts) == 4 and entry.name.endswith(".png"):
+                    index.setdefault(parts[0], []).append(entry.name)
+            self._disk_index[directory] = index
+        return index
+
+    def _save(self, thumbnail, disk_path):
+        """
+        Enregistre la miniature sur le disque ; une erreur d'écriture est ignorée.
+        Les miniatures de la même image créées pour une ancienne version de l'image sont supprimées, ainsi que
+        les plus anciennes au-delà de DISK_SIZES_PER_IMAGE.
+        """
+        directory = os.path.dirname(disk_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = disk_path + ".tmp"
+            thumbnail.save(tmp_path, format="PNG")
+            os.replace(tmp_path, disk_path)
+        except OSError:
+            return
+
+        file_name = os.path.basename(disk_path)
+        name, _, mtime, _ = file_name.rsplit("@", 3)
+        with self._lock:
+            files = self._disk_files(directory).setdefault(name, [])
+            removed = [other for other in files if other != file_name and other.rsplit("@", 3)[2] != mtime]
+            files[:] = [other for other in files if other != file_name and other not in removed] + [file_name]
+            removed += files[:-DISK_SIZES_PER_IMAGE]
+            del files[:-DISK_SIZES_PER_IMAGE]
+        for other in removed:
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass
+
+
+# Cache partagé par tous les boutons-images
+thumbnails = ThumbnailCache()